@@ -1,6 +1,7 @@
 from src.cpu import CPU
 from src.memory import Memory
 from src.instructions import *
+from src.fusion import read_fused_sequences
 
 from sdl2 import *
 
@@ -94,38 +95,55 @@ def render_tiles(gb_2bpp):
 def test_instructions():
     mem = Memory()
     cpu = CPU(mem)
+    # There's no cartridge, so anything an instruction reads past its opcode has to come from WRAM
+    cpu.PC = 0xC000
 
     cpu.H = 0xED
-    cpu.executeArbitraryInstruction("SWAP H")
+    cpu.ExecuteInstruction("SWAP H")
     assert(cpu.H == 0xDE)
 
-    cpu.executeArbitraryInstruction("CCF")
+    cpu.ExecuteInstruction("CCF")
     assert(cpu.c)
-    cpu.executeArbitraryInstruction("CCF")
+    cpu.ExecuteInstruction("CCF")
     assert(not cpu.c)
-    cpu.executeArbitraryInstruction("SCF")
+    cpu.ExecuteInstruction("SCF")
     assert(cpu.c)
 
     val = cpu.SP = 0xfffe
     cpu.BC = 0xbeef
     assert(cpu.BC == 0xbeef)
     print(mem.Read(cpu.SP, 1))
-    cpu.executeArbitraryInstruction("PUSH BC")
+    cpu.ExecuteInstruction("PUSH BC")
 
     cpu.BC = 0xc0fe
     print(mem.Read(cpu.SP, 2))
-    cpu.executeArbitraryInstruction("PUSH BC")
+    cpu.ExecuteInstruction("PUSH BC")
 
     print(mem.Read(cpu.SP, 4))
-    cpu.executeArbitraryInstruction("LD BC,d16")
+    cpu.ExecuteInstruction("LD BC,d16")
     assert(cpu.BC == 0x0)
 
-    cpu.executeArbitraryInstruction("POP BC")
+    cpu.ExecuteInstruction("POP BC")
     print(mem.Read(cpu.SP, 2))
-    cpu.executeArbitraryInstruction("POP BC")
+    cpu.ExecuteInstruction("POP BC")
     print(mem.Read(cpu.SP, 1))
 
     assert(cpu.BC == 0xbeef)
+
+    # LD (a16),SP writes a whole word
+    cpu.PC = 0xC000
+    mem.Write16(0xC001, 0xD000)
+    cpu.SP = 0xBEEF
+    cpu.ExecuteInstruction("LD (a16),SP")
+    assert(mem.Read16(0xD000) == 0xBEEF)
+
+    # Only the one instruction runs, even when it starts a fused sequence (DEC B / JR NZ)
+    cpu = CPU(mem, fusion = read_fused_sequences())
+    cpu.PC = 0xC000
+    cpu.B = 5
+    mem.Write16(0xC001, 0x1020)
+    assert(cpu.ExecuteInstruction("DEC B") == 4)
+    assert(cpu.PC == 0xC001 and cpu.B == 4)
 #end
 
 def test_window():
@@ -1,6 +1,8 @@
 import argparse, sys, logging
 
 from src.system import GameBoy
+from src.blocks import BlockCache
+from src.fusion import read_fused_sequences, DEFAULT_SEQUENCES
 
 def str2bool(v):
     if isinstance(v, bool):
@@ -21,6 +23,14 @@ def _create_arg_parser():
     parser.add_argument("-d", "--disassemble", help="Dumps the entire ROM", action="store_true")
     parser.add_argument('--debug', nargs='?', type=str2bool, default=False, const=True, help="Enable full debugging capabilities")
     parser.add_argument('--debug-video', nargs='?', type=str2bool, default=False, const=True, help="Open window debugging")
+    parser.add_argument("--profile-opcodes", nargs='?', type=int, default=None, const=0, metavar="TOP",
+                        help="Print the opcodes ranked by host time per emulated cycle on exit (optionally only the TOP ones)")
+    parser.add_argument("--mmap-rom", action="store_true",
+                        help="Memory-map the ROM file read-only instead of loading a copy, so processes running the same ROM share it")
+    parser.add_argument("--tiered", nargs='?', type=int, default=None, const=BlockCache.HOT_THRESHOLD, metavar="THRESHOLD",
+                        help="Translate ROM code into blocks once it has been entered THRESHOLD times and print what got translated on exit")
+    parser.add_argument("--fusion", nargs='?', default=None, const=DEFAULT_SEQUENCES, metavar="FILE",
+                        help="Run common instruction sequences as a single handler, from FILE (see tools/mine_ngrams.py) or the shipped set")
     return parser
 #end
 
@@ -41,7 +51,7 @@ def main():
     system = GameBoy()
     system.Debug.Active = True
     system.ConfigureBIOS(bios_data)
-    system.SetGameRomFromFile(parsed_args.rom_file)
+    system.SetGameRomFromFile(parsed_args.rom_file, mapped = parsed_args.mmap_rom)
 
     if parsed_args.debug:
         logging.basicConfig(level=logging.DEBUG)
@@ -51,7 +61,22 @@ def main():
         system.Debug.dump_rom()
         return
 
+    if parsed_args.profile_opcodes is not None:
+        system.Debug.ProfileOpcodes = True
+
+    if parsed_args.tiered is not None:
+        system.Debug.HotThreshold = parsed_args.tiered
+
+    if parsed_args.fusion is not None:
+        system.Debug.FusedSequences = read_fused_sequences(parsed_args.fusion)
+
     system.Run()
+
+    if parsed_args.tiered is not None:
+        system.Debug.print_block_report()
+
+    if parsed_args.profile_opcodes is not None:
+        system.Debug.print_opcode_profile(top = parsed_args.profile_opcodes or None)
 #end
 
 if __name__ == "__main__":
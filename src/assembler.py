@@ -0,0 +1,209 @@
+import re
+
+from .compiler import CB_OFFSET
+from .opcode_table import mnemonic_index, base_instructions, cb_prefix
+
+# A tiny assembler for the mnemonics in the opcode tables, meant for CPU test snippets and microbenchmarks.
+# Statements go one per line (or separated by '/'), a 'label:' can start any of them and ';' starts a comment:
+#
+#       LD B,10
+#   loop:
+#       DEC B
+#       JR NZ,loop
+#
+# Numbers can be decimal, 0x/$ or H suffixed hex and 0b/% binary. Anywhere an address or immediate goes,
+# a label (optionally plus or minus a number) works too, and so does '$' for the address of the statement itself.
+# JR always takes the target address and works out the offset, so a plain number is an address too:
+# write 'JR NZ,$-2' (or use a label) to jump relative to the JR.
+# The 8-bit ALU instructions take the A operand either way, 'CP A,0x90' and 'CP 0x90' or 'ADC A,B' and 'ADC B'.
+
+# Operand placeholders used by the opcode table mnemonics and how many bytes they take
+_placeholders = {'d8': 1, 'a8': 1, 'r8': 1, 'd16': 2, 'a16': 2}
+
+# Smallest and largest value each placeholder takes. Immediates can be given as negative numbers too,
+# and a8 as the address it stands for on the 0xFF00 page ('LDH (0xFF44),A' is the same as 'LDH (0x44),A')
+_ranges = {'d8': (-0x80, 0xFF), 'a8': (0, 0xFF), 'r8': (-0x80, 0x7F), 'd16': (-0x8000, 0xFFFF), 'a16': (0, 0xFFFF)}
+
+# Names that can never be labels, or 'LD A,B' could be read as loading the address of a label called B
+_reserved = {'A', 'F', 'B', 'C', 'D', 'E', 'H', 'L', 'AF', 'BC', 'DE', 'HL', 'SP', 'PC', 'NZ', 'Z', 'NC'}
+
+# Other common spellings of the table operands
+_aliases = {'(HLI)': '(HL+)', '(HLD)': '(HL-)', '(FF00+C)': '(C)', '($FF00+C)': '(C)', '(0XFF00+C)': '(C)'}
+
+# Instructions that always work on A, which only some of the table mnemonics spell out
+_alu_bases = {'ADD', 'ADC', 'SUB', 'SBC', 'AND', 'XOR', 'OR', 'CP'}
+
+_placeholder_pattern = re.compile(r'(d8|a8|r8|d16|a16)')
+_numeric_pattern = re.compile(r'^(\d|[0-9A-F]{2}H)$')
+_label_pattern = re.compile(r'^[A-Za-z_.][A-Za-z0-9_.]*$')
+_term_pattern = re.compile(r'\s*([+-]?)\s*([^+\-\s]+)')
+
+class _Template:
+    """ One table mnemonic, broken down so a statement's operands can be matched against it """
+
+    def __init__(self, mnemonic, index):
+        self.Index = index
+        self.Size = (cb_prefix[index - CB_OFFSET] if index >= CB_OFFSET else base_instructions[index]).Size
+        tokens = mnemonic.split(' ', 1)
+        self.Base = tokens[0]
+        self.Operands = tokens[1].split(',') if len(tokens) > 1 else []
+        self.Placeholders = sum(1 for x in self.Operands if _placeholder_pattern.search(x))
+    #end
+
+    def Match(self, operands, evaluate):
+        """ Gets a (placeholder, value) for each placeholder filled in by 'operands', or None if they don't fit this mnemonic """
+        values = []
+        for template, operand in zip(self.Operands, operands):
+            operand = operand.replace(' ', '')
+            found = _placeholder_pattern.search(template)
+            if found is None:
+                if _numeric_pattern.match(template):
+                    # RST vectors and bit numbers, written however the snippet likes
+                    number = _parse_number(operand)
+                    if number is None or number != int(template.rstrip('H'), 16 if template.endswith('H') else 10):
+                        return None
+                elif _aliases.get(operand.upper(), operand.upper()) != template:
+                    return None
+                continue
+
+            prefix, suffix = template[:found.start()], template[found.end():]
+            if prefix == 'SP+' and operand.upper().startswith('SP-'):
+                operand = 'SP+-' + operand[3:]
+            if not operand.upper().startswith(prefix) or not operand.upper().endswith(suffix):
+                return None
+            value = evaluate(operand[len(prefix):len(operand) - len(suffix)])
+            if value is None:
+                return None
+            values.append( (found.group(0), value) )
+        #end for
+        return values
+    #end
+#end class
+
+_templates = None
+
+def _get_templates():
+    global _templates
+    if _templates is None:
+        _templates = {}
+        for mnemonic, index in mnemonic_index().items():
+            if mnemonic in ('INVALID', 'PREFIX CB'):
+                continue
+            template = _Template(mnemonic, index)
+            _templates.setdefault( (template.Base, len(template.Operands)), [] ).append(template)
+        # Exact operands first, so 'LD A,(C)' never ends up as 'LD A,(a16)'
+        for candidates in _templates.values():
+            candidates.sort(key = lambda x: x.Placeholders)
+    return _templates
+#end
+
+def _parse_number(text):
+    text = text.strip().upper()
+    negative = text.startswith('-')
+    if negative:
+        text = text[1:]
+    try:
+        if text.startswith('0X') or text.startswith('$'):
+            value = int(text.lstrip('$')[2 if text.startswith('0X') else 0:], 16)
+        elif text.startswith('0B') or text.startswith('%'):
+            value = int(text.lstrip('%')[2 if text.startswith('0B') else 0:], 2)
+        elif text.endswith('H') and text[0].isdigit():
+            value = int(text[:-1], 16)
+        else:
+            value = int(text, 10)
+    except ValueError:
+        return None
+    return -value if negative else value
+#end
+
+def _split_statements(source):
+    for line_number, line in enumerate(source.split('\n'), 1):
+        line = line.split(';', 1)[0]
+        for statement in line.split('/'):
+            statement = statement.strip()
+            while ':' in statement:
+                label, statement = statement.split(':', 1)
+                yield line_number, label.strip(), None
+                statement = statement.strip()
+            if len(statement) > 0:
+                yield line_number, None, statement
+#end
+
+def assemble(source, origin = 0xC000, labels = None):
+    """
+    Turns a snippet of assembly into the bytes to load at 'origin' (WRAM by default).
+    When given, 'labels' is filled in with the address of every label in the snippet
+    """
+    labels = {} if labels is None else labels
+    templates = _get_templates()
+
+    def evaluate(text, line_number, address, resolve):
+        # A number, a label, '$' or any of them plus/minus numbers. Labels count as 0 until their address is known
+        terms = _term_pattern.findall(text)
+        if len(terms) == 0 or ''.join(sign + term for sign, term in terms) != text.replace(' ', ''):
+            return None
+        total = 0
+        for sign, term in terms:
+            value = address if term == '$' else _parse_number(term)
+            if value is None:
+                if not _label_pattern.match(term) or term.upper() in _reserved:
+                    return None
+                if resolve and term not in labels:
+                    raise ValueError("Line {}: unknown label '{}'".format(line_number, term))
+                value = labels.get(term, 0)
+            total += -value if sign == '-' else value
+        return total
+    #end
+
+    def encode(line_number, statement, address, resolve):
+        tokens = statement.split(None, 1)
+        base = tokens[0].upper()
+        operands = [ x.strip() for x in tokens[1].split(',') ] if len(tokens) > 1 else []
+        candidates = [ (template, operands) for template in templates.get( (base, len(operands)), [] ) ]
+        if base in _alu_bases:
+            # The table spells the A operand out for some of them only, try the other spelling after the one given
+            if len(operands) == 2 and operands[0].upper() == 'A':
+                candidates += [ (template, operands[1:]) for template in templates.get( (base, 1), [] ) ]
+            elif len(operands) == 1:
+                candidates += [ (template, ['A'] + operands) for template in templates.get( (base, 2), [] ) ]
+
+        for template, operands in candidates:
+            values = template.Match(operands, lambda x: evaluate(x, line_number, address, resolve))
+            if values is None:
+                continue
+
+            code = bytearray([0xCB, template.Index - CB_OFFSET] if template.Index >= CB_OFFSET else [template.Index])
+            for placeholder, value in values:
+                if placeholder == 'r8' and base == 'JR':
+                    value -= address + template.Size
+                elif placeholder == 'a8' and 0xFF00 <= value <= 0xFFFF:
+                    value -= 0xFF00
+                low, high = _ranges[placeholder]
+                if resolve and not low <= value <= high:
+                    raise ValueError("Line {}: '{}' is out of range for {}".format(line_number, statement, placeholder))
+                size = _placeholders[placeholder]
+                code += (value & ((1 << (8 * size)) - 1)).to_bytes(size, 'little')
+            # Anything past the opcode that isn't an operand (e.g. STOP) is zero
+            return bytes(code.ljust(template.Size, b'\x00'))
+        #end for
+        raise ValueError("Line {}: can't assemble '{}'".format(line_number, statement))
+    #end
+
+    statements = list(_split_statements(source))
+
+    # First pass is only for label addresses, sizes never depend on what a label turns out to be
+    address = origin
+    for line_number, label, statement in statements:
+        if label is not None:
+            if label in labels or not _label_pattern.match(label) or label.upper() in _reserved:
+                raise ValueError("Line {}: bad or duplicate label '{}'".format(line_number, label))
+            labels[label] = address
+        else:
+            address += len(encode(line_number, statement, address, False))
+
+    code = bytearray()
+    for line_number, label, statement in statements:
+        if statement is not None:
+            code += encode(line_number, statement, origin + len(code), True)
+    return bytes(code)
+#end
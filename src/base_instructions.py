@@ -403,7 +403,7 @@ base_instructions = [
         0x38, "JR C,r8", bus_width=1,
         byte_size=2, cycles=(12,8),
         flags=None,
-        operands = ( Operand.reg(Registers.C, 1), Operand.imm(1) ),
+        operands = ( Operand.bit(Flag.c, Bit.Set), Operand.imm(1) ),
         executor = NearJump),
         
     Instruction(
@@ -1355,7 +1355,7 @@ base_instructions = [
         0xC0, "RET NZ", bus_width=1,
         byte_size=1, cycles=(20,8),
         flags=None,
-        operands = ( None, Operand.bit(Flag.z, Bit.Reset) ),
+        operands = ( Operand.bit(Flag.z, Bit.Reset), None ),
         executor = Return),
         
     Instruction(
@@ -1371,7 +1371,7 @@ base_instructions = [
         flags=None,
         operands = ( Operand.bit(Flag.z, Bit.Reset), Operand.imm(2) ),
         executor = Jump),
-
+        
     Instruction(
         0xC3, "JP a16", bus_width=2,
         byte_size=3, cycles=16,
@@ -1411,7 +1411,7 @@ base_instructions = [
         0xC8, "RET Z", bus_width=1,
         byte_size=1, cycles=(20,8),
         flags=None,
-        operands = ( None, Operand.bit(Flag.z, Bit.Set) ),
+        operands = ( Operand.bit(Flag.z, Bit.Set), None ),
         executor = Return),
         
     Instruction(
@@ -1467,7 +1467,7 @@ base_instructions = [
         0xD0, "RET NC", bus_width=1,
         byte_size=1, cycles=(20,8),
         flags=None,
-        operands = ( None, Operand.bit(Flag.c, Bit.Reset) ),
+        operands = ( Operand.bit(Flag.c, Bit.Reset), None ),
         executor = Return),
         
     Instruction(
@@ -1523,7 +1523,7 @@ base_instructions = [
         0xD8, "RET C", bus_width=1,
         byte_size=1, cycles=(20,8),
         flags=None,
-        operands = ( None, Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.bit(Flag.c, Bit.Set), None ),
         executor = Return),
         
     Instruction(
@@ -1537,7 +1537,7 @@ base_instructions = [
         0xDA, "JP C,a16", bus_width=2,
         byte_size=3, cycles=(16,12),
         flags=None,
-        operands = ( Operand.reg(Registers.C, 1), Operand.imm(2) ),
+        operands = ( Operand.bit(Flag.c, Bit.Set), Operand.imm(2) ),
         executor = Jump),
         
     Instruction(
@@ -1551,7 +1551,7 @@ base_instructions = [
         0xDC, "CALL C,a16", bus_width=2,
         byte_size=3, cycles=(24,12),
         flags=None,
-        operands = ( Operand.reg(Registers.C, 1), Operand.imm(2) ),
+        operands = ( Operand.bit(Flag.c, Bit.Set), Operand.imm(2) ),
         executor = Call),
         
     Instruction(
@@ -1636,7 +1636,7 @@ base_instructions = [
         byte_size=2, cycles=16,
         flags={ Flag.z:Bit.Reset, Flag.n:Bit.Reset, Flag.h:Bit.Calculate, Flag.c:Bit.Calculate },
         operands = ( Operand.reg(Registers.SP, 2), Operand.imm(1) ),
-        executor = Add),
+        executor = AddOffset),
         
     Instruction(
         0xE9, "JP (HL)", bus_width=1,
@@ -0,0 +1,136 @@
+import time
+
+from .bus import Region
+from .compiler import compile_block, ends_block, writes_memory
+from .instructions import Jump, NearJump
+
+class BlockCache:
+    """
+    Translates straight-line runs of ROM code into a single generated function.
+    A block runs until the first jump, call, return or RST (or anything else that can move the PC)
+    and is cached per (ROM bank, PC) so it only ever gets translated once.
+    Code only gets translated once it's hot: every time the interpreter gets to a PC with no block, that PC's
+    counter goes up, and the block is only built when it reaches the Threshold. The start of a loop is the
+    first of its addresses to get there, and once it's translated nothing inside it gets counted again.
+    """
+
+    # Longest run of instructions that will be put in a single block
+    MAX_INSTRUCTIONS = 32
+
+    # Entries before a block gets translated. A game loop that runs once a frame gets there in about half a second,
+    # boot code and title screens that only ever run once never do
+    HOT_THRESHOLD = 32
+
+    def __init__(self, base_opcodes, cb_opcodes, lazy_flags = False, threshold = HOT_THRESHOLD):
+        self._base_opcodes = base_opcodes
+        self._cb_opcodes = cb_opcodes
+        self._lazy_flags = lazy_flags
+        self._blocks = {}
+        self._idle_loops = set()
+        self._hits = {}
+        self._rom = None # The cartridge everything in the cache was translated from
+        self._compile_time = 0.0
+        self.Threshold = threshold
+    #end
+
+    @property
+    def Count(self):
+        """ The amount of translated blocks in the cache """
+        return sum(1 for x in self._blocks.values() if x is not None)
+
+    @property
+    def Cold(self):
+        """ The amount of entry points that have been counted but aren't hot enough to be translated yet """
+        return len(self._hits)
+
+    @property
+    def CompileTime(self):
+        """ Host seconds spent translating blocks so far """
+        return self._compile_time
+
+    def Report(self):
+        """ A short summary of what has been translated, to tune the Threshold with """
+        untranslatable = sum(1 for x in self._blocks.values() if x is None)
+        return "Threshold {}: {} blocks translated in {:.1f}ms ({} idle loops), {} untranslatable, {} entry points still cold".format(
+            self.Threshold, self.Count, self._compile_time * 1000, len(self._idle_loops), untranslatable, self.Cold)
+
+    @property
+    def IdleLoops(self):
+        """
+        The translated blocks that may be polling loops: they write nothing and end in a conditional jump.
+        When one of these jumps back to its own start without changing any register, every following
+        run does the same until memory changes under it
+        """
+        return self._idle_loops
+
+    def Clear(self):
+        """ Drops every translated block and entry counter. Lookup does it by itself when the cartridge is swapped """
+        self._blocks.clear()
+        self._idle_loops.clear()
+        self._hits.clear()
+
+    def Lookup(self, memory, pc):
+        """
+        Gets the translated block that starts at the PC, translating it when this visit makes it hot.
+        Returns None when the code at the PC is still cold or can't be translated (e.g. it isn't in ROM)
+        """
+        if pc > Region.ROM_END or (pc <= Region.BOOT_END and memory.IsBootROMActive):
+            # Only ROM is guaranteed not to change under us
+            return None
+        if memory.ROM is not self._rom:
+            # Memory.SetROM installed a new cartridge, blocks have the old one's code baked in
+            self.Clear()
+            self._rom = memory.ROM
+
+        key = (0 if pc <= Region.ROM_0 else memory.ROM._bank, pc)
+        if key in self._blocks:
+            return self._blocks[key]
+
+        hits = self._hits.get(key, 0) + 1
+        if hits < self.Threshold:
+            self._hits[key] = hits
+            return None
+        self._hits.pop(key, None)
+
+        start = time.perf_counter()
+        block = self._blocks[key] = self._translate(memory, pc, key[0])
+        self._compile_time += time.perf_counter() - start
+        return block
+    #end
+
+    def _decode(self, memory, pc):
+        opcode = memory.Read8(pc)
+        if opcode == 0xCB:
+            return self._cb_opcodes[memory.Read8(pc+1)]
+        return self._base_opcodes[opcode]
+
+    def _translate(self, memory, pc, bank):
+        # Blocks never cross from the fixed bank into the switchable one
+        fixed = pc <= Region.ROM_0
+        region_end = Region.ROM_0 if fixed else Region.ROM_END
+
+        block = []
+        while len(block) < BlockCache.MAX_INSTRUCTIONS:
+            instr = self._decode(memory, pc)
+            if instr.Size < 1 or pc + instr.Size - 1 > region_end:
+                # Invalid or straddling, leave it to the interpreter
+                break
+
+            block.append( (pc + 1, instr) )
+            pc += instr.Size
+            if ends_block(instr):
+                break
+        #end while
+
+        if len(block) == 0:
+            return None
+
+        # Only blocks in the switchable range can have their bank switched out from under them, bank 0 included
+        function = compile_block(block, memory.Read, None if fixed else bank, self._lazy_flags)
+        last = block[-1][1]
+        if last._action in (Jump, NearJump) and last._operands[0] is not None \
+                and not any(writes_memory(instr) for _, instr in block):
+            self._idle_loops.add(function)
+        return function
+    #end
+#end class
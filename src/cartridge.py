@@ -1,5 +1,5 @@
 from enum import IntEnum
-import os
+import mmap, os
 
 class Cartridge:
     class Type(IntEnum):
@@ -42,13 +42,21 @@ class Cartridge:
     _bank_size = 16 * 1024 # 16KB
 
     @staticmethod
-    def FromFile(path):
+    def FromFile(path, mapped = False):
+        """
+        Loads a ROM file. When 'mapped', the file is memory-mapped read-only instead of read in,
+        so every process running the same ROM shares its pages through the OS page cache
+        """
         if not os.path.exists(path):
             return None
 
         data = bytearray()
         with open(path, 'rb') as cart:
-            data = bytearray(cart.read())
+            if mapped:
+                # The mapping keeps its own handle to the file
+                data = mmap.mmap(cart.fileno(), 0, access = mmap.ACCESS_READ)
+            else:
+                data = bytearray(cart.read())
 
         return Cartridge(path, data)
     #end from file
@@ -60,32 +68,57 @@ class Cartridge:
         self._rom_type = raw_data[Cartridge.Header.TYPE]
         self._rom_size_id = raw_data[Cartridge.Header.SIZE]
 
-        self._bank = 1
-
         assert(Cartridge.Type.is_supported(self._rom_type))
         assert(self._rom_size_id in Cartridge._size_id_map)
         self._rom_size = Cartridge._size_id_map[self._rom_size_id]
+
+        # A window over each bank, so reading one never copies it
+        view = memoryview(raw_data)
+        self._banks = [ view[x : x + Cartridge._bank_size] for x in range(0, len(raw_data), Cartridge._bank_size) ]
+        self._bank = 1
+        self._active_bank = self._banks[1]
     #end
 
     def ReadFixed(self, offset, length):
         return self._data[ offset : offset+length]
     def ReadMovable(self, offset, length):
-        start = (self._bank * Cartridge._bank_size) + (offset - Cartridge._bank_size)
-        end = start + length
-        return bytearray(self._data[ start : end ])
+        start = offset - Cartridge._bank_size
+        return self._active_bank[ start : start + length ]
 
     def ChangeBank(self, new_bank):
         if self._rom_size_id == 0x0 and new_bank > 1:
             raise RuntimeError("32KB ROM requested a bank change")
+        if new_bank >= len(self._banks):
+            raise RuntimeError("ROM requested bank {} but only has {}".format(new_bank, len(self._banks)))
         self._bank = new_bank
+        self._active_bank = self._banks[new_bank]
+
+    @property
+    def BankOffset(self):
+        """ Where the bank in the switchable range starts in the cartridge data """
+        return self._bank * Cartridge._bank_size
 
     def GetFixedBank(self):
         return self.GetBank(0)
 
     def GetCurrentBank(self):
-        return self.GetBank(self._bank)
+        return self._active_bank
 
     def GetBank(self, bank):
-        offset = bank * _bank_size
-        return bytearray(self._data[offset: offset+_bank_size])
+        """ A read-through view of a whole bank, nothing gets copied """
+        return self._banks[bank]
+
+    @property
+    def IsMapped(self):
+        """ Checks if the ROM data is a memory-mapped file rather than a private copy """
+        return type(self._data) is mmap.mmap
+
+    def Close(self):
+        """ Releases the bank views and unmaps the file, if it was mapped. The cartridge can't be read after this """
+        for bank in self._banks:
+            bank.release()
+        self._banks = []
+        self._active_bank = None
+        if self.IsMapped:
+            self._data.close()
 #end
\ No newline at end of file
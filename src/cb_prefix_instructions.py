@@ -907,448 +907,448 @@ cb_prefix = [
         0x80, "RES 0,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x81, "RES 0,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x82, "RES 0,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x83, "RES 0,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x84, "RES 0,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x85, "RES 0,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x86, "RES 0,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(0), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x87, "RES 0,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(0), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(0) ),
         executor = Reset),
         
     Instruction(
         0x88, "RES 1,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x89, "RES 1,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8A, "RES 1,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8B, "RES 1,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8C, "RES 1,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8D, "RES 1,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8E, "RES 1,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(1), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x8F, "RES 1,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(1), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(1) ),
         executor = Reset),
         
     Instruction(
         0x90, "RES 2,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x91, "RES 2,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x92, "RES 2,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x93, "RES 2,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x94, "RES 2,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x95, "RES 2,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x96, "RES 2,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(2), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x97, "RES 2,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(2), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(2) ),
         executor = Reset),
         
     Instruction(
         0x98, "RES 3,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x99, "RES 3,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9A, "RES 3,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9B, "RES 3,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9C, "RES 3,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9D, "RES 3,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9E, "RES 3,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(3), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0x9F, "RES 3,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(3), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(3) ),
         executor = Reset),
         
     Instruction(
         0xA0, "RES 4,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA1, "RES 4,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA2, "RES 4,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA3, "RES 4,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA4, "RES 4,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA5, "RES 4,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA6, "RES 4,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(4), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA7, "RES 4,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(4), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(4) ),
         executor = Reset),
         
     Instruction(
         0xA8, "RES 5,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xA9, "RES 5,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAA, "RES 5,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAB, "RES 5,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAC, "RES 5,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAD, "RES 5,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAE, "RES 5,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(5), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xAF, "RES 5,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(5), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(5) ),
         executor = Reset),
         
     Instruction(
         0xB0, "RES 6,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB1, "RES 6,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB2, "RES 6,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB3, "RES 6,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB4, "RES 6,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB5, "RES 6,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB6, "RES 6,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(6), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB7, "RES 6,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(6), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(6) ),
         executor = Reset),
         
     Instruction(
         0xB8, "RES 7,B", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.B, 1) ),
+        operands = ( Operand.reg(Registers.B, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xB9, "RES 7,C", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.C, 1) ),
+        operands = ( Operand.reg(Registers.C, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBA, "RES 7,D", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.D, 1) ),
+        operands = ( Operand.reg(Registers.D, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBB, "RES 7,E", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.E, 1) ),
+        operands = ( Operand.reg(Registers.E, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBC, "RES 7,H", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.H, 1) ),
+        operands = ( Operand.reg(Registers.H, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBD, "RES 7,L", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.L, 1) ),
+        operands = ( Operand.reg(Registers.L, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBE, "RES 7,(HL)", bus_width=1,
         byte_size=2, cycles=16,
         flags=None,
-        operands = ( Operand.const(7), Operand.regi(Registers.HL, 2) ),
+        operands = ( Operand.regi(Registers.HL, 2), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
         0xBF, "RES 7,A", bus_width=1,
         byte_size=2, cycles=8,
         flags=None,
-        operands = ( Operand.const(7), Operand.reg(Registers.A, 1) ),
+        operands = ( Operand.reg(Registers.A, 1), Operand.const(7) ),
         executor = Reset),
         
     Instruction(
@@ -1,3 +1,4 @@
+import logging
 import time
 
 class Clock:
@@ -14,7 +15,9 @@ class Clock:
 
         self._cycles = 0
         self._time = 0
+        self._updates = 0
         self._streaming_average =0
+        self._log = logging.getLogger(self.__class__.__name__)
         self._should_run = True
         self._is_ticking = False
     #end
@@ -50,19 +53,23 @@ class Clock:
         # Clock, PPU and CPU tick @ 4MHz
         self._tick_timers()
         self._ppu.Tick(self._cycles)
-        self._cpu.Tick(self._cycles)
 
         # LCD refreshes @ 59.7Hz
         self._lcd.Tick(self._cycles)
 
+        # Nothing else happens until the PPU's next event, so the CPU gets to run up to it in one go
+        deadline = max(self._ppu.NextEventCycle, self._cycles + 1)
+        self._cpu.RunCycles(deadline - self._cycles, self._cycles)
+
         end = time.monotonic_ns()
         # Increase cycle count
-        self._cycles += 1
+        self._cycles = deadline
 
+        # Updates cover a varying amount of cycles, so this is the average time per update
         duration = end-start
-        running_avg = (duration - self._streaming_average) / (self._cycles)
-        self._streaming_average = self._streaming_average + running_avg
-        print(f"last cycle time: {duration} ns")
+        self._updates += 1
+        self._streaming_average += (duration - self._streaming_average) / self._updates
+        self._log.debug("Update to cycle %d took %d ns", self._cycles, duration)
         
 
     def TickForever(self):
@@ -0,0 +1,4659 @@
+# Generated by tools/generate_instructions.py --backend handlers from gb_base.json and gb_cb_prefix.json
+# Every opcode expanded into a single function: handler(cpu, mem, location) -> cycles
+# Do not edit by hand, change the generator or src/compiler.py and regenerate instead
+from .instructions import Call, ComplementA, DecimalAdjustAccumulator, DisableInterrupts, EnableInterrupts, Halt, InvalidInstruction, Pop, Push, Restart, Return, ReturnInterrupt
+from .compiler import bind_alu_table
+
+# Shared with everything compiled at run time, and only filled in once a handler looks them up
+bind_alu_table(globals(), 'alu_0', 'def entry(dst, src, carry):\n    raw = src + 1\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x20 if ((src & 0xF) + (src & 0xF)) & 0x10 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_1', 'def entry(dst, src, carry):\n    raw = src - 1\n    result = raw & 0xFF\n    return result | ((0x40 | (0x80 if result == 0 else 0) | (0x20 if ((src & 0xF) + (src & 0xF)) & 0x10 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_2', 'def entry(dst, src, carry):\n    raw = (src << 1) | (src >> 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_3', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8) | ((src & 1) << 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_4', 'def entry(dst, src, carry):\n    raw = (src << 1) | carry\n    result = raw & 0xFF\n    return result | ((0x00 | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_5', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8) | (carry << 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_6', 'def entry(dst, src, carry):\n    raw = dst + src\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x20 if ((dst & 0xF) + (src & 0xF)) & 0x10 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_7', 'def entry(dst, src, carry):\n    raw = dst + src + carry\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x20 if ((dst & 0xF) + (src & 0xF)) & 0x10 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_8', 'def entry(dst, src, carry):\n    raw = dst - src\n    result = raw & 0xFF\n    return result | ((0x40 | (0x80 if result == 0 else 0) | (0x20 if ((dst & 0xF) + (src & 0xF)) & 0x10 else 0) | (0x10 if raw > result or (raw < 0 and result > 0) else 0)) << 8)')
+bind_alu_table(globals(), 'alu_9', 'def entry(dst, src, carry):\n    raw = dst - (src + carry)\n    result = raw & 0xFF\n    return result | ((0x40 | (0x80 if result == 0 else 0) | (0x20 if ((dst & 0xF) + (src & 0xF)) & 0x10 else 0) | (0x10 if raw > result or (raw < 0 and result > 0) else 0)) << 8)')
+bind_alu_table(globals(), 'alu_10', 'def entry(dst, src, carry):\n    raw = dst & src\n    result = raw & 0xFF\n    return result | ((0x20 | (0x80 if result == 0 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_11', 'def entry(dst, src, carry):\n    raw = dst ^ src\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_12', 'def entry(dst, src, carry):\n    raw = dst | src\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_13', 'def entry(dst, src, carry):\n    raw = (src << 1) | (src >> 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_14', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8) | ((src & 1) << 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_15', 'def entry(dst, src, carry):\n    raw = (src << 1) | carry\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_16', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8) | (carry << 7)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_17', 'def entry(dst, src, carry):\n    raw = src << 1\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+bind_alu_table(globals(), 'alu_18', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8) | (src & 0x40)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_19', 'def entry(dst, src, carry):\n    raw = ((src & 0xF) << 4) | ((src & 0xF0) >> 4)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0)) << 8)')
+bind_alu_table(globals(), 'alu_20', 'def entry(dst, src, carry):\n    raw = (src >> 1) | ((src & 1) << 8)\n    result = raw & 0xFF\n    return result | ((0x00 | (0x80 if result == 0 else 0) | (0x10 if raw > result else 0)) << 8)')
+
+def op_0x00(cpu, mem, location):
+    cpu.PC = location
+    cycles = 4
+    return cycles
+
+def op_0x01(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    cpu.B = (t0 >> 8) & 0xFF
+    cpu.C = t0 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0x02(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0x03(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    t1 = t0 + 1
+    t2 = (t1 & 0xFFFF)
+    cpu.B = (t2 >> 8) & 0xFF
+    cpu.C = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x04(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x05(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x06(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.B = t0
+    cycles = 8
+    return cycles
+
+def op_0x07(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_2[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x08(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    t1 = (cpu.SP & 0xFFFF)
+    mem.Write16(t0, t1)
+    cycles = 20
+    return cycles
+
+def op_0x09(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.B << 8) | cpu.C)
+    t2 = t0 + t1
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x8F) | (0x20 if (t0 ^ t1 ^ t3) & 0x1000 else 0) | (0x10 if t2 > t3 else 0)
+    cpu.H = (t3 >> 8) & 0xFF
+    cpu.L = t3 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x0A(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    t1 = mem.Read8(t0)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def op_0x0B(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    t1 = t0 - 1
+    t2 = (t1 & 0xFFFF)
+    cpu.B = (t2 >> 8) & 0xFF
+    cpu.C = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x0C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x0D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x0E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.C = t0
+    cycles = 8
+    return cycles
+
+def op_0x0F(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_3[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x10(cpu, mem, location):
+    cpu.PC = location
+    t0 = Halt(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 4
+    return cycles
+
+def op_0x11(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    cpu.D = (t0 >> 8) & 0xFF
+    cpu.E = t0 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0x12(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0x13(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    t1 = t0 + 1
+    t2 = (t1 & 0xFFFF)
+    cpu.D = (t2 >> 8) & 0xFF
+    cpu.E = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x14(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x15(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x16(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.D = t0
+    cycles = 8
+    return cycles
+
+def op_0x17(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_4[(((cpu._flags >> 4) & 1) << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x18(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.PC = (cpu.PC + (t0 - 0x100 if t0 & 0x80 else t0)) & 0xFFFF
+    cycles = 12
+    return cycles
+
+def op_0x19(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.D << 8) | cpu.E)
+    t2 = t0 + t1
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x8F) | (0x20 if (t0 ^ t1 ^ t3) & 0x1000 else 0) | (0x10 if t2 > t3 else 0)
+    cpu.H = (t3 >> 8) & 0xFF
+    cpu.L = t3 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x1A(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    t1 = mem.Read8(t0)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def op_0x1B(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    t1 = t0 - 1
+    t2 = (t1 & 0xFFFF)
+    cpu.D = (t2 >> 8) & 0xFF
+    cpu.E = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x1C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x1D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x1E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.E = t0
+    cycles = 8
+    return cycles
+
+def op_0x1F(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_5[(((cpu._flags >> 4) & 1) << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x20(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu._flags & 0x80) == 0)
+    t1 = mem.Read8(location)
+    if t0:
+        cpu.PC = (cpu.PC + (t1 - 0x100 if t1 & 0x80 else t1)) & 0xFFFF
+    cycles = 12 if t0 else 8
+    return cycles
+
+def op_0x21(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    cpu.H = (t0 >> 8) & 0xFF
+    cpu.L = t0 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0x22(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 + 1
+    cpu.H = (t1 >> 8) & 0xFF
+    cpu.L = t1 & 0xFF
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0x23(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 + 1
+    t2 = (t1 & 0xFFFF)
+    cpu.H = (t2 >> 8) & 0xFF
+    cpu.L = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x24(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x25(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x26(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.H = t0
+    cycles = 8
+    return cycles
+
+def op_0x27(cpu, mem, location):
+    cpu.PC = location
+    t0 = DecimalAdjustAccumulator(cpu, None, None)
+    if t0 is None: t0 = 0
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x4F) | (0x80 if t1 == 0 else 0) | (0x10 if t0 > t1 or (t0 < 0 and t1 > 0) else 0)
+    cycles = 4
+    return cycles
+
+def op_0x28(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu._flags & 0x80) != 0)
+    t1 = mem.Read8(location)
+    if t0:
+        cpu.PC = (cpu.PC + (t1 - 0x100 if t1 & 0x80 else t1)) & 0xFFFF
+    cycles = 12 if t0 else 8
+    return cycles
+
+def op_0x29(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = t0 + t1
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x8F) | (0x20 if (t0 ^ t1 ^ t3) & 0x1000 else 0) | (0x10 if t2 > t3 else 0)
+    cpu.H = (t3 >> 8) & 0xFF
+    cpu.L = t3 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x2A(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 + 1
+    cpu.H = (t1 >> 8) & 0xFF
+    cpu.L = t1 & 0xFF
+    t2 = mem.Read8(t0)
+    cpu.A = t2
+    cycles = 8
+    return cycles
+
+def op_0x2B(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 - 1
+    t2 = (t1 & 0xFFFF)
+    cpu.H = (t2 >> 8) & 0xFF
+    cpu.L = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x2C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x2D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x2E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.L = t0
+    cycles = 8
+    return cycles
+
+def op_0x2F(cpu, mem, location):
+    cpu.PC = location
+    t0 = ComplementA(cpu, None, None)
+    if t0 is None: t0 = 0
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x9F) | 0x60
+    cycles = 4
+    return cycles
+
+def op_0x30(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu._flags & 0x10) == 0)
+    t1 = mem.Read8(location)
+    if t0:
+        cpu.PC = (cpu.PC + (t1 - 0x100 if t1 & 0x80 else t1)) & 0xFFFF
+    cycles = 12 if t0 else 8
+    return cycles
+
+def op_0x31(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    cpu.SP = t0
+    cycles = 12
+    return cycles
+
+def op_0x32(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 - 1
+    cpu.H = (t1 >> 8) & 0xFF
+    cpu.L = t1 & 0xFF
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0x33(cpu, mem, location):
+    cpu.PC = location
+    t0 = (cpu.SP & 0xFFFF)
+    t1 = t0 + 1
+    t2 = (t1 & 0xFFFF)
+    cpu.SP = t2
+    cycles = 8
+    return cycles
+
+def op_0x34(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_0[(t2)]
+    cpu._flags = (cpu._flags & 0x1F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 12
+    return cycles
+
+def op_0x35(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_1[(t2)]
+    cpu._flags = (cpu._flags & 0x1F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 12
+    return cycles
+
+def op_0x36(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(location)
+    mem.Write8(t0, t1)
+    cycles = 12
+    return cycles
+
+def op_0x37(cpu, mem, location):
+    cpu.PC = location
+    t0 = 0x100
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x8F) | 0x10
+    cycles = 4
+    return cycles
+
+def op_0x38(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu._flags & 0x10) != 0)
+    t1 = mem.Read8(location)
+    if t0:
+        cpu.PC = (cpu.PC + (t1 - 0x100 if t1 & 0x80 else t1)) & 0xFFFF
+    cycles = 12 if t0 else 8
+    return cycles
+
+def op_0x39(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = (cpu.SP & 0xFFFF)
+    t2 = t0 + t1
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x8F) | (0x20 if (t0 ^ t1 ^ t3) & 0x1000 else 0) | (0x10 if t2 > t3 else 0)
+    cpu.H = (t3 >> 8) & 0xFF
+    cpu.L = t3 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x3A(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = t0 - 1
+    cpu.H = (t1 >> 8) & 0xFF
+    cpu.L = t1 & 0xFF
+    t2 = mem.Read8(t0)
+    cpu.A = t2
+    cycles = 8
+    return cycles
+
+def op_0x3B(cpu, mem, location):
+    cpu.PC = location
+    t0 = (cpu.SP & 0xFFFF)
+    t1 = t0 - 1
+    t2 = (t1 & 0xFFFF)
+    cpu.SP = t2
+    cycles = 8
+    return cycles
+
+def op_0x3C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_0[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x3D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_1[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x1F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x3E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    cpu.A = t0
+    cycles = 8
+    return cycles
+
+def op_0x3F(cpu, mem, location):
+    cpu.PC = location
+    t0 = (0 if ((cpu._flags >> 4) & 1) else 0x100)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x8F) | (0x10 if t0 > t1 else 0)
+    cycles = 4
+    return cycles
+
+def op_0x40(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x41(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x42(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x43(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x44(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x45(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x46(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def op_0x47(cpu, mem, location):
+    cpu.PC = location
+    cpu.B = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x48(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x49(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x4A(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x4B(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x4C(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x4D(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x4E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def op_0x4F(cpu, mem, location):
+    cpu.PC = location
+    cpu.C = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x50(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x51(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x52(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x53(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x54(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x55(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x56(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def op_0x57(cpu, mem, location):
+    cpu.PC = location
+    cpu.D = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x58(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x59(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x5A(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x5B(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x5C(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x5D(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x5E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def op_0x5F(cpu, mem, location):
+    cpu.PC = location
+    cpu.E = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x60(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x61(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x62(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x63(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x64(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x65(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x66(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def op_0x67(cpu, mem, location):
+    cpu.PC = location
+    cpu.H = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x68(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x69(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x6A(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x6B(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x6C(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x6D(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x6E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def op_0x6F(cpu, mem, location):
+    cpu.PC = location
+    cpu.L = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x70(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.B)
+    cycles = 8
+    return cycles
+
+def op_0x71(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.C)
+    cycles = 8
+    return cycles
+
+def op_0x72(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.D)
+    cycles = 8
+    return cycles
+
+def op_0x73(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.E)
+    cycles = 8
+    return cycles
+
+def op_0x74(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.H)
+    cycles = 8
+    return cycles
+
+def op_0x75(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.L)
+    cycles = 8
+    return cycles
+
+def op_0x76(cpu, mem, location):
+    cpu.PC = location
+    t0 = Halt(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 4
+    return cycles
+
+def op_0x77(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0x78(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.B
+    cycles = 4
+    return cycles
+
+def op_0x79(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.C
+    cycles = 4
+    return cycles
+
+def op_0x7A(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.D
+    cycles = 4
+    return cycles
+
+def op_0x7B(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.E
+    cycles = 4
+    return cycles
+
+def op_0x7C(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.H
+    cycles = 4
+    return cycles
+
+def op_0x7D(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.L
+    cycles = 4
+    return cycles
+
+def op_0x7E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def op_0x7F(cpu, mem, location):
+    cpu.PC = location
+    cpu.A = cpu.A
+    cycles = 4
+    return cycles
+
+def op_0x80(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x81(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x82(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x83(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x84(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x85(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x86(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_6[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x87(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_6[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x88(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x89(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x8A(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x8B(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x8C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x8D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x8E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x8F(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x90(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x91(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x92(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x93(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x94(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x95(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x96(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_8[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x97(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x98(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x99(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x9A(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x9B(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x9C(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x9D(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0x9E(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0x9F(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA0(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA1(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA2(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA3(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA4(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA5(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA6(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_10[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xA7(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_10[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA8(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xA9(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xAA(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xAB(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xAC(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xAD(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xAE(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_11[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xAF(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_11[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB0(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB1(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB2(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB3(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB4(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB5(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB6(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_12[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cpu.A = t2 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xB7(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_12[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 4
+    return cycles
+
+def op_0xB8(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xB9(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xBA(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xBB(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xBC(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xBD(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xBE(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = alu_8[(cpu.A << 8) | (t1)]
+    cpu._flags = (cpu._flags & 0x0F) | (t2 >> 8)
+    cycles = 8
+    return cycles
+
+def op_0xBF(cpu, mem, location):
+    cpu.PC = location
+    t0 = alu_8[(cpu.A << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cycles = 4
+    return cycles
+
+def op_0xC0(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu._flags & 0x80) == 0)
+    t1 = Return(cpu, t0, None)
+    if t1 is None: t1 = 0
+    cycles = 20 if t1 is not False else 8
+    return cycles
+
+def op_0xC1(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    t1 = ((cpu.B << 8) | cpu.C)
+    t2 = Pop(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    t3 = (t2 & 0xFFFF)
+    cpu.B = (t3 >> 8) & 0xFF
+    cpu.C = t3 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0xC2(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x80) == 0)
+    t1 = mem.Read16(location)
+    if t0:
+        cpu.PC = t1
+    cycles = 16 if t0 else 12
+    return cycles
+
+def op_0xC3(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    cpu.PC = t0
+    cycles = 16
+    return cycles
+
+def op_0xC4(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x80) == 0)
+    t1 = mem.Read16(location)
+    t2 = Call(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    cycles = 24 if t2 is not False else 12
+    return cycles
+
+def op_0xC5(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.B << 8) | cpu.C)
+    t1 = Push(cpu, None, t0)
+    if t1 is None: t1 = 0
+    cycles = 16
+    return cycles
+
+def op_0xC6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_6[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xC7(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 0)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xC8(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu._flags & 0x80) != 0)
+    t1 = Return(cpu, t0, None)
+    if t1 is None: t1 = 0
+    cycles = 20 if t1 is not False else 8
+    return cycles
+
+def op_0xC9(cpu, mem, location):
+    cpu.PC = location
+    t0 = Return(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xCA(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x80) != 0)
+    t1 = mem.Read16(location)
+    if t0:
+        cpu.PC = t1
+    cycles = 16 if t0 else 12
+    return cycles
+
+def op_0xCB(cpu, mem, location):
+    cpu.PC = location
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 4
+    return cycles
+
+def op_0xCC(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x80) != 0)
+    t1 = mem.Read16(location)
+    t2 = Call(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    cycles = 24 if t2 is not False else 12
+    return cycles
+
+def op_0xCD(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    t1 = Call(cpu, None, t0)
+    if t1 is None: t1 = 0
+    cycles = 24
+    return cycles
+
+def op_0xCE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_7[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xCF(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 8)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xD0(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu._flags & 0x10) == 0)
+    t1 = Return(cpu, t0, None)
+    if t1 is None: t1 = 0
+    cycles = 20 if t1 is not False else 8
+    return cycles
+
+def op_0xD1(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    t1 = ((cpu.D << 8) | cpu.E)
+    t2 = Pop(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    t3 = (t2 & 0xFFFF)
+    cpu.D = (t3 >> 8) & 0xFF
+    cpu.E = t3 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0xD2(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x10) == 0)
+    t1 = mem.Read16(location)
+    if t0:
+        cpu.PC = t1
+    cycles = 16 if t0 else 12
+    return cycles
+
+def op_0xD3(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xD4(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x10) == 0)
+    t1 = mem.Read16(location)
+    t2 = Call(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    cycles = 24 if t2 is not False else 12
+    return cycles
+
+def op_0xD5(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.D << 8) | cpu.E)
+    t1 = Push(cpu, None, t0)
+    if t1 is None: t1 = 0
+    cycles = 16
+    return cycles
+
+def op_0xD6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_8[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xD7(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 16)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xD8(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu._flags & 0x10) != 0)
+    t1 = Return(cpu, t0, None)
+    if t1 is None: t1 = 0
+    cycles = 20 if t1 is not False else 8
+    return cycles
+
+def op_0xD9(cpu, mem, location):
+    cpu.PC = location
+    t0 = ReturnInterrupt(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xDA(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x10) != 0)
+    t1 = mem.Read16(location)
+    if t0:
+        cpu.PC = t1
+    cycles = 16 if t0 else 12
+    return cycles
+
+def op_0xDB(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xDC(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = ((cpu._flags & 0x10) != 0)
+    t1 = mem.Read16(location)
+    t2 = Call(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    cycles = 24 if t2 is not False else 12
+    return cycles
+
+def op_0xDD(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xDE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_9[(((cpu._flags >> 4) & 1) << 16) | (cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xDF(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 24)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xE0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (mem.Read8(location) | 0xFF00)
+    mem.Write8(t0, cpu.A)
+    cycles = 12
+    return cycles
+
+def op_0xE1(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = Pop(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    t3 = (t2 & 0xFFFF)
+    cpu.H = (t3 >> 8) & 0xFF
+    cpu.L = t3 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0xE2(cpu, mem, location):
+    cpu.PC = location
+    t0 = (cpu.C | 0xFF00)
+    mem.Write8(t0, cpu.A)
+    cycles = 8
+    return cycles
+
+def op_0xE3(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xE4(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xE5(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = Push(cpu, None, t0)
+    if t1 is None: t1 = 0
+    cycles = 16
+    return cycles
+
+def op_0xE6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_10[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xE7(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 32)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xE8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.SP & 0xFFFF)
+    t1 = mem.Read8(location)
+    t2 = t0 + (t1 - 0x100 if t1 & 0x80 else t1)
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x0F) | (0x20 if (cpu.SP ^ ((t3 - cpu.SP) & 0xFFFF) ^ t3) & 0x10 else 0) | (0x10 if (cpu.SP ^ ((t3 - cpu.SP) & 0xFFFF) ^ t3) & 0x100 else 0)
+    cpu.SP = t3
+    cycles = 16
+    return cycles
+
+def op_0xE9(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    cpu.PC = t1
+    cycles = 4
+    return cycles
+
+def op_0xEA(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    mem.Write8(t0, cpu.A)
+    cycles = 16
+    return cycles
+
+def op_0xEB(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xEC(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xED(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xEE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_11[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xEF(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 40)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xF0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (mem.Read8(location) | 0xFF00)
+    t1 = mem.Read8(t0)
+    cpu.A = t1
+    cycles = 12
+    return cycles
+
+def op_0xF1(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.A << 8) | cpu._flags)
+    t1 = ((cpu.A << 8) | cpu._flags)
+    t2 = Pop(cpu, t0, t1)
+    if t2 is None: t2 = 0
+    t3 = (t2 & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x0F) | (0x80 if t3 == 0 else 0) | (0x20 if (t0 ^ t1 ^ t3) & 0x1000 else 0) | (0x10 if t2 > t3 or (t2 < 0 and t3 > 0) else 0)
+    cpu.A = (t3 >> 8) & 0xFF
+    cpu._flags = t3 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0xF2(cpu, mem, location):
+    cpu.PC = location
+    t0 = (cpu.C | 0xFF00)
+    t1 = mem.Read8(t0)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def op_0xF3(cpu, mem, location):
+    cpu.PC = location
+    t0 = DisableInterrupts(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 4
+    return cycles
+
+def op_0xF4(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xF5(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.A << 8) | cpu._flags)
+    t1 = Push(cpu, None, t0)
+    if t1 is None: t1 = 0
+    cycles = 16
+    return cycles
+
+def op_0xF6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_12[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cpu.A = t1 & 0xFF
+    cycles = 8
+    return cycles
+
+def op_0xF7(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 48)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def op_0xF8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(location)
+    t2 = (cpu.SP + (t1 - 0x100 if t1 & 0x80 else t1) & 0xFFFF)
+    cpu._flags = (cpu._flags & 0x0F) | (0x20 if (cpu.SP ^ ((t2 - cpu.SP) & 0xFFFF) ^ t2) & 0x10 else 0) | (0x10 if (cpu.SP ^ ((t2 - cpu.SP) & 0xFFFF) ^ t2) & 0x100 else 0)
+    cpu.H = (t2 >> 8) & 0xFF
+    cpu.L = t2 & 0xFF
+    cycles = 12
+    return cycles
+
+def op_0xF9(cpu, mem, location):
+    cpu.PC = location
+    t0 = ((cpu.H << 8) | cpu.L)
+    cpu.SP = t0
+    cycles = 8
+    return cycles
+
+def op_0xFA(cpu, mem, location):
+    cpu.PC = location + 2
+    t0 = mem.Read16(location)
+    t1 = (mem.Read16(t0) & 0xFF)
+    cpu.A = t1
+    cycles = 16
+    return cycles
+
+def op_0xFB(cpu, mem, location):
+    cpu.PC = location
+    t0 = EnableInterrupts(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = 4
+    return cycles
+
+def op_0xFC(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xFD(cpu, mem, location):
+    cpu.PC = location - 2
+    t0 = InvalidInstruction(cpu, None, None)
+    if t0 is None: t0 = 0
+    cycles = -1
+    return cycles
+
+def op_0xFE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = mem.Read8(location)
+    t1 = alu_8[(cpu.A << 8) | (t0)]
+    cpu._flags = (cpu._flags & 0x0F) | (t1 >> 8)
+    cycles = 8
+    return cycles
+
+def op_0xFF(cpu, mem, location):
+    cpu.PC = location
+    t0 = Restart(cpu, None, 56)
+    if t0 is None: t0 = 0
+    cycles = 16
+    return cycles
+
+def cb_0x00(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x01(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x02(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x03(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x04(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x05(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x06(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_13[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x07(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_13[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x08(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x09(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x0A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x0B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x0C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x0D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x0E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_14[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x0F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_14[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x10(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x11(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x12(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x13(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x14(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x15(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x16(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x17(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_15[(((cpu._flags >> 4) & 1) << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x18(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x19(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x1A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x1B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x1C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x1D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x1E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x1F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_16[(((cpu._flags >> 4) & 1) << 8) | (cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x20(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x21(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x22(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x23(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x24(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x25(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x26(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_17[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x27(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_17[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x28(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x29(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x2A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x2B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x2C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x2D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x2E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_18[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x2F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_18[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x30(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x31(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x32(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x33(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x34(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x35(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x36(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_19[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x37(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_19[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x38(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.B)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.B = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x39(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.C)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.C = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x3A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.D)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.D = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x3B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.E)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.E = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x3C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.H)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.H = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x3D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.L)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.L = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x3E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = ((cpu.H << 8) | cpu.L)
+    t2 = mem.Read8(t1)
+    t3 = alu_20[(t2)]
+    cpu._flags = (cpu._flags & 0x0F) | (t3 >> 8)
+    mem.Write8(t0, t3 & 0xFF)
+    cycles = 16
+    return cycles
+
+def cb_0x3F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = alu_20[(cpu.A)]
+    cpu._flags = (cpu._flags & 0x0F) | (t0 >> 8)
+    cpu.A = t0 & 0xFF
+    cycles = 8
+    return cycles
+
+def cb_0x40(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x41(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x42(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x43(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x44(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x45(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x46(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 0)) == (1 << 0)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x47(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 0)) == (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x48(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x49(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x4A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x4B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x4C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x4D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x4E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 1)) == (1 << 1)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x4F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 1)) == (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x50(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x51(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x52(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x53(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x54(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x55(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x56(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 2)) == (1 << 2)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x57(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 2)) == (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x58(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x59(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x5A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x5B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x5C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x5D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x5E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 3)) == (1 << 3)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x5F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 3)) == (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x60(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x61(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x62(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x63(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x64(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x65(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x66(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 4)) == (1 << 4)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x67(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 4)) == (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x68(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x69(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x6A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x6B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x6C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x6D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x6E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 5)) == (1 << 5)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x6F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 5)) == (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x70(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x71(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x72(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x73(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x74(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x75(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x76(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 6)) == (1 << 6)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x77(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 6)) == (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x78(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.B & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x79(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.C & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x7A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.D & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x7B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.E & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x7C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.H & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x7D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.L & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x7E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = (t1 & (1 << 7)) == (1 << 7)
+    t3 = (t2 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t3 == 0 else 0)
+    cycles = 16
+    return cycles
+
+def cb_0x7F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = (cpu.A & (1 << 7)) == (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu._flags = (cpu._flags & 0x1F) | 0x20 | (0x80 if t1 == 0 else 0)
+    cycles = 8
+    return cycles
+
+def cb_0x80(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0x81(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0x82(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0x83(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0x84(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0x85(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0x86(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 0)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0x87(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0x88(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0x89(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0x8A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0x8B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0x8C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0x8D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0x8E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 1)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0x8F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0x90(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0x91(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0x92(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0x93(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0x94(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0x95(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0x96(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 2)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0x97(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0x98(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0x99(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0x9A(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0x9B(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0x9C(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0x9D(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0x9E(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 3)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0x9F(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 4)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xA7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xA9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xAA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xAB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xAC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xAD(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xAE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 5)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xAF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 6)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xB7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xB9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xBA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xBB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xBC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xBD(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xBE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 & ~(1 << 7)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xBF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A & ~(1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 0)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xC7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 0)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xC9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xCA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xCB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xCC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xCD(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xCE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 1)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xCF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 1)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 2)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xD7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 2)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xD9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xDA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xDB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xDC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xDD(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xDE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 3)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xDF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 3)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 4)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xE7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 4)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xE9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xEA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xEB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xEC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xED(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xEE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 5)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xEF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 5)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF0(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF1(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF2(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF3(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF4(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF5(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF6(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 6)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xF7(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 6)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF8(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.B | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.B = t1
+    cycles = 8
+    return cycles
+
+def cb_0xF9(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.C | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.C = t1
+    cycles = 8
+    return cycles
+
+def cb_0xFA(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.D | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.D = t1
+    cycles = 8
+    return cycles
+
+def cb_0xFB(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.E | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.E = t1
+    cycles = 8
+    return cycles
+
+def cb_0xFC(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.H | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.H = t1
+    cycles = 8
+    return cycles
+
+def cb_0xFD(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.L | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.L = t1
+    cycles = 8
+    return cycles
+
+def cb_0xFE(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = ((cpu.H << 8) | cpu.L)
+    t1 = mem.Read8(t0)
+    t2 = t1 | (1 << 7)
+    t3 = (t2 & 0xFF)
+    mem.Write8(t0, t3)
+    cycles = 16
+    return cycles
+
+def cb_0xFF(cpu, mem, location):
+    cpu.PC = location + 1
+    t0 = cpu.A | (1 << 7)
+    t1 = (t0 & 0xFF)
+    cpu.A = t1
+    cycles = 8
+    return cycles
+
+handlers = [
+    op_0x00,
+    op_0x01,
+    op_0x02,
+    op_0x03,
+    op_0x04,
+    op_0x05,
+    op_0x06,
+    op_0x07,
+    op_0x08,
+    op_0x09,
+    op_0x0A,
+    op_0x0B,
+    op_0x0C,
+    op_0x0D,
+    op_0x0E,
+    op_0x0F,
+    op_0x10,
+    op_0x11,
+    op_0x12,
+    op_0x13,
+    op_0x14,
+    op_0x15,
+    op_0x16,
+    op_0x17,
+    op_0x18,
+    op_0x19,
+    op_0x1A,
+    op_0x1B,
+    op_0x1C,
+    op_0x1D,
+    op_0x1E,
+    op_0x1F,
+    op_0x20,
+    op_0x21,
+    op_0x22,
+    op_0x23,
+    op_0x24,
+    op_0x25,
+    op_0x26,
+    op_0x27,
+    op_0x28,
+    op_0x29,
+    op_0x2A,
+    op_0x2B,
+    op_0x2C,
+    op_0x2D,
+    op_0x2E,
+    op_0x2F,
+    op_0x30,
+    op_0x31,
+    op_0x32,
+    op_0x33,
+    op_0x34,
+    op_0x35,
+    op_0x36,
+    op_0x37,
+    op_0x38,
+    op_0x39,
+    op_0x3A,
+    op_0x3B,
+    op_0x3C,
+    op_0x3D,
+    op_0x3E,
+    op_0x3F,
+    op_0x40,
+    op_0x41,
+    op_0x42,
+    op_0x43,
+    op_0x44,
+    op_0x45,
+    op_0x46,
+    op_0x47,
+    op_0x48,
+    op_0x49,
+    op_0x4A,
+    op_0x4B,
+    op_0x4C,
+    op_0x4D,
+    op_0x4E,
+    op_0x4F,
+    op_0x50,
+    op_0x51,
+    op_0x52,
+    op_0x53,
+    op_0x54,
+    op_0x55,
+    op_0x56,
+    op_0x57,
+    op_0x58,
+    op_0x59,
+    op_0x5A,
+    op_0x5B,
+    op_0x5C,
+    op_0x5D,
+    op_0x5E,
+    op_0x5F,
+    op_0x60,
+    op_0x61,
+    op_0x62,
+    op_0x63,
+    op_0x64,
+    op_0x65,
+    op_0x66,
+    op_0x67,
+    op_0x68,
+    op_0x69,
+    op_0x6A,
+    op_0x6B,
+    op_0x6C,
+    op_0x6D,
+    op_0x6E,
+    op_0x6F,
+    op_0x70,
+    op_0x71,
+    op_0x72,
+    op_0x73,
+    op_0x74,
+    op_0x75,
+    op_0x76,
+    op_0x77,
+    op_0x78,
+    op_0x79,
+    op_0x7A,
+    op_0x7B,
+    op_0x7C,
+    op_0x7D,
+    op_0x7E,
+    op_0x7F,
+    op_0x80,
+    op_0x81,
+    op_0x82,
+    op_0x83,
+    op_0x84,
+    op_0x85,
+    op_0x86,
+    op_0x87,
+    op_0x88,
+    op_0x89,
+    op_0x8A,
+    op_0x8B,
+    op_0x8C,
+    op_0x8D,
+    op_0x8E,
+    op_0x8F,
+    op_0x90,
+    op_0x91,
+    op_0x92,
+    op_0x93,
+    op_0x94,
+    op_0x95,
+    op_0x96,
+    op_0x97,
+    op_0x98,
+    op_0x99,
+    op_0x9A,
+    op_0x9B,
+    op_0x9C,
+    op_0x9D,
+    op_0x9E,
+    op_0x9F,
+    op_0xA0,
+    op_0xA1,
+    op_0xA2,
+    op_0xA3,
+    op_0xA4,
+    op_0xA5,
+    op_0xA6,
+    op_0xA7,
+    op_0xA8,
+    op_0xA9,
+    op_0xAA,
+    op_0xAB,
+    op_0xAC,
+    op_0xAD,
+    op_0xAE,
+    op_0xAF,
+    op_0xB0,
+    op_0xB1,
+    op_0xB2,
+    op_0xB3,
+    op_0xB4,
+    op_0xB5,
+    op_0xB6,
+    op_0xB7,
+    op_0xB8,
+    op_0xB9,
+    op_0xBA,
+    op_0xBB,
+    op_0xBC,
+    op_0xBD,
+    op_0xBE,
+    op_0xBF,
+    op_0xC0,
+    op_0xC1,
+    op_0xC2,
+    op_0xC3,
+    op_0xC4,
+    op_0xC5,
+    op_0xC6,
+    op_0xC7,
+    op_0xC8,
+    op_0xC9,
+    op_0xCA,
+    op_0xCB,
+    op_0xCC,
+    op_0xCD,
+    op_0xCE,
+    op_0xCF,
+    op_0xD0,
+    op_0xD1,
+    op_0xD2,
+    op_0xD3,
+    op_0xD4,
+    op_0xD5,
+    op_0xD6,
+    op_0xD7,
+    op_0xD8,
+    op_0xD9,
+    op_0xDA,
+    op_0xDB,
+    op_0xDC,
+    op_0xDD,
+    op_0xDE,
+    op_0xDF,
+    op_0xE0,
+    op_0xE1,
+    op_0xE2,
+    op_0xE3,
+    op_0xE4,
+    op_0xE5,
+    op_0xE6,
+    op_0xE7,
+    op_0xE8,
+    op_0xE9,
+    op_0xEA,
+    op_0xEB,
+    op_0xEC,
+    op_0xED,
+    op_0xEE,
+    op_0xEF,
+    op_0xF0,
+    op_0xF1,
+    op_0xF2,
+    op_0xF3,
+    op_0xF4,
+    op_0xF5,
+    op_0xF6,
+    op_0xF7,
+    op_0xF8,
+    op_0xF9,
+    op_0xFA,
+    op_0xFB,
+    op_0xFC,
+    op_0xFD,
+    op_0xFE,
+    op_0xFF,
+    cb_0x00,
+    cb_0x01,
+    cb_0x02,
+    cb_0x03,
+    cb_0x04,
+    cb_0x05,
+    cb_0x06,
+    cb_0x07,
+    cb_0x08,
+    cb_0x09,
+    cb_0x0A,
+    cb_0x0B,
+    cb_0x0C,
+    cb_0x0D,
+    cb_0x0E,
+    cb_0x0F,
+    cb_0x10,
+    cb_0x11,
+    cb_0x12,
+    cb_0x13,
+    cb_0x14,
+    cb_0x15,
+    cb_0x16,
+    cb_0x17,
+    cb_0x18,
+    cb_0x19,
+    cb_0x1A,
+    cb_0x1B,
+    cb_0x1C,
+    cb_0x1D,
+    cb_0x1E,
+    cb_0x1F,
+    cb_0x20,
+    cb_0x21,
+    cb_0x22,
+    cb_0x23,
+    cb_0x24,
+    cb_0x25,
+    cb_0x26,
+    cb_0x27,
+    cb_0x28,
+    cb_0x29,
+    cb_0x2A,
+    cb_0x2B,
+    cb_0x2C,
+    cb_0x2D,
+    cb_0x2E,
+    cb_0x2F,
+    cb_0x30,
+    cb_0x31,
+    cb_0x32,
+    cb_0x33,
+    cb_0x34,
+    cb_0x35,
+    cb_0x36,
+    cb_0x37,
+    cb_0x38,
+    cb_0x39,
+    cb_0x3A,
+    cb_0x3B,
+    cb_0x3C,
+    cb_0x3D,
+    cb_0x3E,
+    cb_0x3F,
+    cb_0x40,
+    cb_0x41,
+    cb_0x42,
+    cb_0x43,
+    cb_0x44,
+    cb_0x45,
+    cb_0x46,
+    cb_0x47,
+    cb_0x48,
+    cb_0x49,
+    cb_0x4A,
+    cb_0x4B,
+    cb_0x4C,
+    cb_0x4D,
+    cb_0x4E,
+    cb_0x4F,
+    cb_0x50,
+    cb_0x51,
+    cb_0x52,
+    cb_0x53,
+    cb_0x54,
+    cb_0x55,
+    cb_0x56,
+    cb_0x57,
+    cb_0x58,
+    cb_0x59,
+    cb_0x5A,
+    cb_0x5B,
+    cb_0x5C,
+    cb_0x5D,
+    cb_0x5E,
+    cb_0x5F,
+    cb_0x60,
+    cb_0x61,
+    cb_0x62,
+    cb_0x63,
+    cb_0x64,
+    cb_0x65,
+    cb_0x66,
+    cb_0x67,
+    cb_0x68,
+    cb_0x69,
+    cb_0x6A,
+    cb_0x6B,
+    cb_0x6C,
+    cb_0x6D,
+    cb_0x6E,
+    cb_0x6F,
+    cb_0x70,
+    cb_0x71,
+    cb_0x72,
+    cb_0x73,
+    cb_0x74,
+    cb_0x75,
+    cb_0x76,
+    cb_0x77,
+    cb_0x78,
+    cb_0x79,
+    cb_0x7A,
+    cb_0x7B,
+    cb_0x7C,
+    cb_0x7D,
+    cb_0x7E,
+    cb_0x7F,
+    cb_0x80,
+    cb_0x81,
+    cb_0x82,
+    cb_0x83,
+    cb_0x84,
+    cb_0x85,
+    cb_0x86,
+    cb_0x87,
+    cb_0x88,
+    cb_0x89,
+    cb_0x8A,
+    cb_0x8B,
+    cb_0x8C,
+    cb_0x8D,
+    cb_0x8E,
+    cb_0x8F,
+    cb_0x90,
+    cb_0x91,
+    cb_0x92,
+    cb_0x93,
+    cb_0x94,
+    cb_0x95,
+    cb_0x96,
+    cb_0x97,
+    cb_0x98,
+    cb_0x99,
+    cb_0x9A,
+    cb_0x9B,
+    cb_0x9C,
+    cb_0x9D,
+    cb_0x9E,
+    cb_0x9F,
+    cb_0xA0,
+    cb_0xA1,
+    cb_0xA2,
+    cb_0xA3,
+    cb_0xA4,
+    cb_0xA5,
+    cb_0xA6,
+    cb_0xA7,
+    cb_0xA8,
+    cb_0xA9,
+    cb_0xAA,
+    cb_0xAB,
+    cb_0xAC,
+    cb_0xAD,
+    cb_0xAE,
+    cb_0xAF,
+    cb_0xB0,
+    cb_0xB1,
+    cb_0xB2,
+    cb_0xB3,
+    cb_0xB4,
+    cb_0xB5,
+    cb_0xB6,
+    cb_0xB7,
+    cb_0xB8,
+    cb_0xB9,
+    cb_0xBA,
+    cb_0xBB,
+    cb_0xBC,
+    cb_0xBD,
+    cb_0xBE,
+    cb_0xBF,
+    cb_0xC0,
+    cb_0xC1,
+    cb_0xC2,
+    cb_0xC3,
+    cb_0xC4,
+    cb_0xC5,
+    cb_0xC6,
+    cb_0xC7,
+    cb_0xC8,
+    cb_0xC9,
+    cb_0xCA,
+    cb_0xCB,
+    cb_0xCC,
+    cb_0xCD,
+    cb_0xCE,
+    cb_0xCF,
+    cb_0xD0,
+    cb_0xD1,
+    cb_0xD2,
+    cb_0xD3,
+    cb_0xD4,
+    cb_0xD5,
+    cb_0xD6,
+    cb_0xD7,
+    cb_0xD8,
+    cb_0xD9,
+    cb_0xDA,
+    cb_0xDB,
+    cb_0xDC,
+    cb_0xDD,
+    cb_0xDE,
+    cb_0xDF,
+    cb_0xE0,
+    cb_0xE1,
+    cb_0xE2,
+    cb_0xE3,
+    cb_0xE4,
+    cb_0xE5,
+    cb_0xE6,
+    cb_0xE7,
+    cb_0xE8,
+    cb_0xE9,
+    cb_0xEA,
+    cb_0xEB,
+    cb_0xEC,
+    cb_0xED,
+    cb_0xEE,
+    cb_0xEF,
+    cb_0xF0,
+    cb_0xF1,
+    cb_0xF2,
+    cb_0xF3,
+    cb_0xF4,
+    cb_0xF5,
+    cb_0xF6,
+    cb_0xF7,
+    cb_0xF8,
+    cb_0xF9,
+    cb_0xFA,
+    cb_0xFB,
+    cb_0xFC,
+    cb_0xFD,
+    cb_0xFE,
+    cb_0xFF,
+]
@@ -0,0 +1,829 @@
+from array import array
+import itertools, re
+
+from .cpu_types import *
+from .operands import *
+from . import instructions
+from .instructions import Instruction
+
+# The Instruction tables are the source of truth for what every opcode does.
+# Interpreting them generically (see Instruction.execute) means every single instruction
+# goes through two operand lookups, an executor call, a dictionary of flag closures and a writeback.
+# The methods below read the exact same tables and emit one straight-line Python function per opcode
+# with all of that expanded, so the CPU can dispatch with a single list index and call.
+#
+# Each generated handler has the signature: handler(cpu, mem, location) -> cycles
+# where 'location' has the same meaning as in Instruction.execute (the address right after the opcode)
+# Handlers advance the PC themselves and return how many cycles the instruction took.
+
+# Index where the CB prefixed instructions begin in the flat handler table
+CB_OFFSET = 0x100
+
+# Executors that never look at the destination operand (unless the flags need it)
+_ignores_destination = {
+    instructions.Load, instructions.Increment, instructions.Decrement,
+    instructions.ShiftLeft, instructions.RotateLeft, instructions.RotateLeftWithCarry,
+    instructions.ShiftRight, instructions.ShiftRightArithmetic,
+    instructions.RotateRight, instructions.RotateRightWithCarry,
+    instructions.Swap,
+}
+
+# Executors whose raw result can never be negative
+_non_negative = {
+    instructions.Load, instructions.Add, instructions.AddWithCarry, instructions.Increment,
+    instructions.BinOr, instructions.BinXor, instructions.BinAnd,
+    instructions.ShiftLeft, instructions.RotateLeft, instructions.RotateLeftWithCarry,
+    instructions.ShiftRight, instructions.ShiftRightArithmetic,
+    instructions.RotateRight, instructions.RotateRightWithCarry,
+    instructions.Swap, instructions.SetBit, instructions.Reset,
+    instructions.SetCarry, instructions.InvertCarry,
+}
+
+# Expressions for the executors that can be expanded in place.
+# 'dst' and 'src' are replaced by the (already masked) operand values and 'carry' by the carry flag as 0 or 1
+_inline_actions = {
+    instructions.Load: "{src}",
+    instructions.Add: "{dst} + {src}",
+    instructions.AddOffset: "{dst} + ({src} - 0x100 if {src} & 0x80 else {src})",
+    instructions.AddWithCarry: "{dst} + {src} + {carry}",
+    instructions.Subtract: "{dst} - {src}",
+    instructions.SubWithCarry: "{dst} - ({src} + {carry})",
+    instructions.BinOr: "{dst} | {src}",
+    instructions.BinXor: "{dst} ^ {src}",
+    instructions.BinAnd: "{dst} & {src}",
+    instructions.Increment: "{src} + 1",
+    instructions.Decrement: "{src} - 1",
+    instructions.ShiftLeft: "{src} << 1",
+    instructions.RotateLeft: "({src} << 1) | {carry}",
+    instructions.RotateLeftWithCarry: "({src} << 1) | ({src} >> 7)",
+    instructions.ShiftRight: "({src} >> 1) | (({src} & 1) << 8)",
+    instructions.ShiftRightArithmetic: "({src} >> 1) | (({src} & 1) << 8) | ({src} & 0x40)",
+    instructions.RotateRight: "({src} >> 1) | (({src} & 1) << 8) | ({carry} << 7)",
+    instructions.RotateRightWithCarry: "({src} >> 1) | (({src} & 1) << 8) | (({src} & 1) << 7)",
+    instructions.Swap: "(({src} & 0xF) << 4) | (({src} & 0xF0) >> 4)",
+    instructions.CheckBit: "({src} & (1 << {dst})) == (1 << {dst})",
+    instructions.SetBit: "{dst} | (1 << {src})",
+    instructions.Reset: "{dst} & ~(1 << {src})",
+    instructions.SetCarry: "0x100",
+    instructions.InvertCarry: "(0 if {carry} else 0x100)",
+}
+
+# 8-bit arithmetic, rotates and shifts that run off a precomputed table of results and flags
+# rather than computing either (Compare is Subtract). BIT, SET and RES are plain masking, so they stay inline
+_alu_actions = {
+    instructions.Add, instructions.AddWithCarry, instructions.Subtract, instructions.SubWithCarry,
+    instructions.BinOr, instructions.BinXor, instructions.BinAnd, instructions.Increment, instructions.Decrement,
+    instructions.ShiftLeft, instructions.ShiftRight, instructions.ShiftRightArithmetic, instructions.Swap,
+    instructions.RotateLeft, instructions.RotateRight, instructions.RotateLeftWithCarry, instructions.RotateRightWithCarry,
+}
+
+# Executors that can move the PC or change how interrupts are handled
+_block_terminators = {
+    instructions.Jump, instructions.NearJump, instructions.Call, instructions.Restart,
+    instructions.Return, instructions.ReturnInterrupt, instructions.Halt, instructions.Stop,
+    instructions.EnableInterrupts, instructions.DisableInterrupts, instructions.InvalidInstruction,
+}
+
+# Executors that write to the stack
+_stack_writers = { instructions.Push, instructions.Call, instructions.Restart }
+# And the ones that read from it
+_stack_readers = { instructions.Pop, instructions.Return, instructions.ReturnInterrupt }
+
+_flag_names = { Flag.z: 'z', Flag.n: 'n', Flag.h: 'h', Flag.c: 'c' }
+
+def _executor_names():
+    """ Maps every executor in the instructions module to the name generated code refers to it by """
+    names = {}
+    for name, value in vars(instructions).items():
+        if callable(value) and not isinstance(value, type) and value not in names:
+            names[value] = name
+    return names
+#end
+
+class _Emitter:
+    """
+    Accumulates the source lines for a single instruction.
+    'location' is either the name of a variable or a known integer address.
+    When the location is known and a 'fetch' method is given, the bytes of the instruction are read at compile time
+    """
+
+    def __init__(self, location, indent = 1, fetch = None, lazy_flags = False):
+        self.lines = []
+        self._location = location
+        self._indent = "    " * indent
+        self._temps = 0
+        self._fetch = fetch if type(location) is int else None
+        self.lazy_flags = lazy_flags
+
+    def emit(self, line):
+        self.lines.append(self._indent + line)
+
+    def temp(self, expression):
+        """ Stores an expression in a new local and returns the local's name """
+        if expression.isidentifier() or expression.isdigit():
+            return expression
+        name = "t{}".format(self._temps)
+        self._temps += 1
+        self.emit("{} = {}".format(name, expression))
+        return name
+
+    def at(self, offset = 0):
+        """ Expression for an address relative to the instruction location """
+        if type(self._location) is int:
+            return "0x{:04X}".format(self._location + offset)
+        if offset == 0:
+            return self._location
+        return "{} {} {}".format(self._location, '+' if offset > 0 else '-', abs(offset))
+
+    def flag(self, flag, expected = True):
+        """ Boolean expression for reading a flag """
+        if self.lazy_flags:
+            # Go through the CPU property so any pending flags get resolved first
+            name = "cpu." + _flag_names[flag]
+            return name if expected else "(not {})".format(name)
+        return "((cpu._flags & 0x{:02X}) {} 0)".format(1 << flag, "!=" if expected else "==")
+
+    def carry(self):
+        """ Expression for the carry flag as 0 or 1 """
+        if self.lazy_flags:
+            return "cpu.c"
+        return "((cpu._flags >> 4) & 1)"
+
+    def immediate(self, width, offset = 0):
+        """ Expression for the little-endian immediate value stored in the instruction """
+        if self._fetch is None:
+            return _read_number(self, self.at(offset), width)
+
+        data = self._fetch(self._location + offset, width)
+        return str(data[0] if width == 1 else (data[1] << 8) | data[0])
+#end
+
+def _register_attribute(out, name):
+    if name == 'F' and not out.lazy_flags:
+        # Nothing is ever pending when flags are eager, so the backing field can be used directly
+        return "cpu._flags"
+    return "cpu." + name
+
+def _register_expression(out, register, width):
+    name = GetRegisterName(register, width)
+    if width == 2 and register >= 0:
+        # Pairs are put together from their halves in place, rather than going through the CPU property
+        return "(({} << 8) | {})".format(_register_attribute(out, name[0]), _register_attribute(out, name[1]))
+    return _register_attribute(out, name)
+#end
+
+def _emit_register_write(out, register, width, value):
+    name = GetRegisterName(register, width)
+    if width == 2 and register >= 0:
+        value = out.temp(value)
+        out.emit("{} = ({} >> 8) & 0xFF".format(_register_attribute(out, name[0]), value))
+        out.emit("{} = {} & 0xFF".format(_register_attribute(out, name[1]), value))
+    else:
+        out.emit("{} = {}".format(_register_attribute(out, name), value))
+#end
+
+def _translated_address(operand, address):
+    """ Mirrors BaseOperand._translate_address for an integer address """
+    if operand.width == 1 and address.isdigit():
+        return str(int(address) | 0xFF00)
+    if operand.width == 1:
+        return "({} | 0xFF00)".format(address)
+    return address
+#end
+
+def _read_number(out, address, width):
+    """ Mirrors ImmediateOperand._read_number(mem, address) """
+    return "mem.Read{}({})".format(8 * width, address)
+#end
+
+def _mask(expression, bus_width):
+    return "({} & {})".format(expression, "0xFF" if bus_width == 1 else "0xFFFF")
+
+def _get_operand(out, operand, bus_width):
+    """
+    Emits whatever is needed to read an operand and returns an expression for its value.
+    Returns a tuple of (value expression, address expression) where the address is only set for memory operands
+    """
+    if operand is None:
+        return "None", None
+
+    if isinstance(operand, BitOperand):
+        # Bit operands are never masked
+        return out.flag(operand._bit, operand._expected == Bit.Set), None
+
+    if isinstance(operand, ConstOperand):
+        mask = 0xFF if bus_width == 1 else 0xFFFF
+        return str(operand._value & mask), None
+
+    if isinstance(operand, DirectOperand):
+        address = out.temp(_translated_address(operand, out.immediate(operand.width)))
+        value = _read_number(out, address, operand.width)
+        if operand.width == 1 or bus_width == 2:
+            return value, address
+        return _mask(value, bus_width), address
+
+    if isinstance(operand, ImmediateOperand):
+        value = out.immediate(operand.width)
+        if operand.width == 1 or bus_width == 2:
+            return value, None
+        return _mask(value, bus_width), None
+
+    if isinstance(operand, RegisterPostOperand):
+        address = out.temp(_register_expression(out, operand._register, operand.width))
+        step = "+ 1" if operand._mode == Addressing.RegisterIncrement else "- 1"
+        _emit_register_write(out, operand._register, operand.width, "{} {}".format(address, step))
+        return "mem.Read8({})".format(_translated_address(operand, address)), address
+
+    if isinstance(operand, RegisterIndirectOperand):
+        address = out.temp(_translated_address(operand, _register_expression(out, operand._register, operand.width)))
+        return "mem.Read8({})".format(address), address
+
+    if isinstance(operand, RegisterAndImmediateOperand):
+        # The immediate is a signed offset
+        offset = out.immediate(1)
+        if offset.isdigit():
+            offset = str(int(offset) - 0x100 if int(offset) & 0x80 else int(offset))
+        else:
+            offset = out.temp(offset)
+            offset = "({0} - 0x100 if {0} & 0x80 else {0})".format(offset)
+        return _mask("cpu.SP + {}".format(offset), bus_width), None
+
+    if isinstance(operand, RegisterOperand):
+        value = _register_expression(out, operand._register, operand.width)
+        if operand._register < 0 or (operand.width == 2 and bus_width == 1):
+            # The stack pointer and program counter are not guaranteed to be in range
+            return _mask(value, bus_width), None
+        return value, None
+
+    raise NotImplementedError("Operand {} cannot be compiled".format(repr(operand)))
+#end
+
+def _set_operand(out, operand, address, result, bus_width = 1):
+    """ Emits the writeback of 'result' into an operand """
+    if operand is None:
+        return
+
+    if isinstance(operand, (BitOperand, ConstOperand, RegisterAndImmediateOperand)):
+        return
+    if isinstance(operand, DirectOperand):
+        out.emit("mem.Write{}({}, {})".format(8 * bus_width, address, result))
+        return
+    if isinstance(operand, ImmediateOperand):
+        return
+    if isinstance(operand, RegisterPostOperand):
+        out.emit("mem.Write8({}, {})".format(_translated_address(operand, address), result))
+        return
+    if isinstance(operand, RegisterIndirectOperand):
+        out.emit("mem.Write8({}, {})".format(address, result))
+        return
+    if isinstance(operand, RegisterOperand):
+        if operand._throwaway:
+            return
+        _emit_register_write(out, operand._register, operand.width, result)
+        return
+
+    raise NotImplementedError("Operand {} cannot be compiled".format(repr(operand)))
+#end
+
+def _offset_carries(result):
+    # See instructions._offset_carries. This reads the SP, so it has to run before anything writes it back
+    return "(cpu.SP ^ (({0} - cpu.SP) & 0xFFFF) ^ {0})".format(result)
+
+def _flag_expressions(instr, raw, result, dest, source):
+    """ Returns the bits that are kept, the bits that are forced on and expressions for the calculated bits """
+    # The lower nibble of F is never touched by flag updates
+    keep = 0x0F
+    forced = 0
+    calculated = []
+    for flag, status in instr._flags_affected.items():
+        bit = 1 << flag
+        if status is Bit.Ignore:
+            keep |= bit
+        elif status is Bit.Set:
+            forced |= bit
+        elif status is Bit.Calculate:
+            if flag == Flag.z:
+                calculated.append("(0x{:02X} if {} == 0 else 0)".format(bit, result))
+            elif flag == Flag.n:
+                # The result has been masked at this point, so it can never be negative
+                continue
+            elif flag == Flag.h and instr._flag_width == 'word':
+                # Carry out of bit 11
+                calculated.append("(0x{:02X} if ({} ^ {} ^ {}) & 0x1000 else 0)".format(bit, dest, source, result))
+            elif flag == Flag.h and instr._flag_width == 'offset':
+                calculated.append("(0x{:02X} if {} & 0x10 else 0)".format(bit, _offset_carries(result)))
+            elif flag == Flag.h:
+                calculated.append("(0x{:02X} if (({} & 0xF) + ({} & 0xF)) & 0x10 else 0)".format(bit, dest, source))
+            elif flag == Flag.c and instr._flag_width == 'offset':
+                calculated.append("(0x{:02X} if {} & 0x100 else 0)".format(bit, _offset_carries(result)))
+            elif flag == Flag.c:
+                if instr._action in _non_negative:
+                    calculated.append("(0x{:02X} if {} > {} else 0)".format(bit, raw, result))
+                else:
+                    calculated.append("(0x{0:02X} if {1} > {2} or ({1} < 0 and {2} > 0) else 0)".format(bit, raw, result))
+    return keep, forced, calculated
+#end
+
+def _flag_update(instr, flags, raw, result, dest, source):
+    """ Expression for the new value of the flag register """
+    keep, forced, calculated = _flag_expressions(instr, raw, result, dest, source)
+    terms = []
+    if keep != 0:
+        terms.append("({} & 0x{:02X})".format(flags, keep))
+    if forced != 0 or not (terms or calculated):
+        terms.append("0x{:02X}".format(forced))
+    terms += calculated
+    return " | ".join(terms)
+#end
+
+# Resolvers for lazy flags, shared by every compiled handler and block
+# Keyed by the source of the flag update, so instructions that set their flags the same way share one
+_flag_resolvers = {}
+
+def _flag_resolver(instr):
+    """ Gets the name of a function(flags, raw, result, dest, source) that computes what 'instr' does to the flags """
+    update = _flag_update(instr, "flags", "raw", "result", "dest", "source")
+    if update not in _flag_resolvers:
+        name = "flags_{}".format(len(_flag_resolvers))
+        namespace = {}
+        exec("def {}(flags, raw, result, dest, source):\n    return {}".format(name, update), namespace)
+        _flag_resolvers[update] = (name, namespace[name])
+    return _flag_resolvers[update][0]
+#end
+
+# Result and flag tables for the 8-bit arithmetic, shared by every compiled handler and block
+# Keyed by the source of the function that fills them in, so instructions that behave the same share one.
+# Each one is (name, table), where the table stays an _UnfilledTable until something first looks it up
+_alu_tables = {}
+
+class _UnfilledTable:
+    """
+    Stands in for an ALU table until its first lookup, so a run only pays for filling the tables it actually uses.
+    That lookup fills it in and swaps the table itself in everywhere this was bound, so it only ever happens once
+    """
+
+    def __init__(self, entry):
+        self._entry = entry
+        self._bindings = []
+
+    def Bind(self, namespace, name):
+        namespace[name] = self
+        self._bindings.append( (namespace, name) )
+
+    def __getitem__(self, index):
+        name, table = _alu_tables[self._entry]
+        if table is self:
+            table = build_alu_table(self._entry)
+            _alu_tables[self._entry] = (name, table)
+        for namespace, bound in self._bindings:
+            if namespace.get(bound) is self:
+                namespace[bound] = table
+        self._bindings = []
+        return table[index]
+#end class
+
+def _alu_entry(instr):
+    """ Source of a function(dst, src, carry) that works out a table entry for 'instr' """
+    # Instructions that ignore their destination only read it for the half carry, and it's the same operand as the source
+    dst = "src" if instr._action in _ignores_destination else "dst"
+    _, forced, calculated = _flag_expressions(instr, "raw", "result", dst, "src")
+    flags = " | ".join(["0x{:02X}".format(forced)] + calculated)
+    return "def entry(dst, src, carry):\n    raw = {}\n    result = raw & 0xFF\n    return result | (({}) << 8)".format(
+        _inline_actions[instr._action].format(dst = "dst", src = "src", carry = "carry"), flags)
+
+def _alu_index(entry):
+    """ Which of carry, dst and src go into the table index, from the most significant down """
+    body = entry.split("\n", 1)[1]
+    return [ x for x in ("carry", "dst", "src") if x in body ]
+
+def _register_alu_table(entry):
+    if entry not in _alu_tables:
+        _alu_tables[entry] = ("alu_{}".format(len(_alu_tables)), _UnfilledTable(entry))
+    return _alu_tables[entry]
+
+def _alu_table(instr):
+    """
+    Gets the name of the table for 'instr'. It's indexed by whichever of [carry, dst, src] the instruction
+    actually uses, 8 bits each (so a rotate through carry has 512 entries and ADC has 128K).
+    Each entry holds the result byte and, above it, the flag bits the instruction sets (everything but the bits it leaves alone)
+    """
+    return _register_alu_table(_alu_entry(instr))[0]
+
+def bind_alu_table(namespace, name, entry):
+    """ Puts the shared table for 'entry' in 'namespace' as 'name'. It only gets filled in once something looks it up """
+    _, table = _register_alu_table(entry)
+    if type(table) is _UnfilledTable:
+        table.Bind(namespace, name)
+    else:
+        namespace[name] = table
+#end
+
+def build_alu_table(entry):
+    """ Fills in a table from the source of its entry(dst, src, carry) function """
+    index = _alu_index(entry)
+    ranges = [ range(2) if x == "carry" else range(256) for x in index ]
+
+    # Put the parameters in index order, so going through every combination in order fills the table in order
+    namespace = {}
+    exec(entry + "\ndef ordered({}):\n    return entry({})".format(
+        ", ".join(index), ", ".join(x if x in index else "0" for x in ("dst", "src", "carry"))), namespace)
+    return array('H', itertools.starmap(namespace["ordered"], itertools.product(*ranges)))
+#end
+
+def _alu_ignores_destination(instr):
+    """ Checks if 'instr' goes through an ALU table that never looks at its destination """
+    if instr._action not in _alu_actions or instr._result_size != 1 or instr._flags_affected is None:
+        return False
+    return "dst" not in _alu_index(_alu_entry(instr))
+
+def _uses_alu_table(instr, dest):
+    if instr._action not in _alu_actions or instr._result_size != 1 or instr._flags_affected is None:
+        return False
+    return dest != "None" or "dst" not in _alu_index(_alu_entry(instr))
+
+def _emit_alu(out, instr, dest, source, address):
+    """ Emits a table lookup for both the result and the flags of an 8-bit arithmetic instruction """
+    values = { "carry": out.carry(), "dst": dest, "src": source }
+    index = _alu_index(_alu_entry(instr))
+    index = " | ".join("({} << {})".format(values[name], 8 * (len(index) - 1 - slot)) for slot, name in enumerate(index))
+    entry = out.temp("{}[{}]".format(_alu_table(instr), index.replace(" << 0)", ")")))
+
+    keep, _, _ = _flag_expressions(instr, None, None, None, None)
+    if out.lazy_flags:
+        # Same as _emit_flags: the table already has every flag the instruction sets, so whatever was pending only
+        # needs working out when some of the bits carry over
+        if Bit.Ignore in instr._flags_affected.values():
+            out.emit("if cpu._pending_flags is not None: cpu._resolve_flags()")
+        else:
+            out.emit("cpu._pending_flags = None")
+    out.emit("cpu._flags = (cpu._flags & 0x{:02X}) | ({} >> 8)".format(keep, entry))
+    if _writes_back(instr._operands[0]):
+        _set_operand(out, instr._operands[0], address, "{} & 0xFF".format(entry))
+#end
+
+def _emit_flags(out, instr, raw, result, dest, source):
+    if instr._flags_affected is None:
+        return
+
+    if not out.lazy_flags:
+        out.emit("cpu._flags = " + _flag_update(instr, "cpu._flags", raw, result, dest, source))
+        return
+
+    if instr._flag_width == 'offset':
+        # These depend on the SP as it is right now, so they can't wait
+        out.emit("cpu.F = " + _flag_update(instr, "cpu.F", raw, result, dest, source))
+        return
+
+    # Just record what the instruction did, the CPU only works out the flags when something reads them
+    if Bit.Ignore in instr._flags_affected.values():
+        # Some bits carry over from the current flags, so those can't be pending anymore
+        out.emit("if cpu._pending_flags is not None: cpu._resolve_flags()")
+    out.emit("cpu._pending_flags = ({}, {}, {}, {}, {})".format(_flag_resolver(instr), raw, result, dest, source))
+#end
+
+def _emit_action(out, instr, names, dest, source):
+    """ Emits the executor and returns an expression for the raw result """
+    action = instr._action
+    if action is instructions.NoOp:
+        return None
+
+    if action is instructions.Load:
+        return source
+
+    if action in _inline_actions:
+        return out.temp(_inline_actions[action].format(dst = dest, src = source, carry = out.carry()))
+
+    # Jumps are only expanded when they are unconditional or conditioned on a flag.
+    # Anything else writes the executor result back into the first operand, so it goes through the executor
+    jumps = (instructions.Jump, instructions.NearJump)
+    destination = instr._operands[0] if instr._operands is not None else None
+    if action in jumps and (destination is None or isinstance(destination, BitOperand)):
+        jump = "cpu.PC = {}".format(source)
+        if action is instructions.NearJump:
+            offset = out.temp(source)
+            jump = "cpu.PC = (cpu.PC + ({0} - 0x100 if {0} & 0x80 else {0})) & 0xFFFF".format(offset)
+
+        if destination is None:
+            out.emit(jump)
+        else:
+            out.emit("if {}:".format(dest))
+            out.emit("    " + jump)
+        return None
+
+    # Everything else keeps calling into the executor
+    raw = out.temp("{}(cpu, {}, {})".format(names[action], dest, source))
+    out.emit("if {0} is None: {0} = 0".format(raw))
+    return raw
+#end
+
+def _is_simple(expression, allow_registers):
+    """ Checks if an expression can be repeated without storing it in a local first """
+    if expression.isidentifier() or expression.isdigit():
+        return True
+    return allow_registers and expression.startswith("cpu.") and expression[4:].isidentifier()
+#end
+
+def _writes_back(operand):
+    """ Checks if the writeback step does anything for this operand """
+    if operand is None or isinstance(operand, (BitOperand, ConstOperand, RegisterAndImmediateOperand)):
+        return False
+    if isinstance(operand, ImmediateOperand):
+        return isinstance(operand, DirectOperand)
+    return not operand._throwaway
+#end
+
+def emit_instruction(instr, location, names, indent = 1, fetch = None, set_pc = True, cycles = True, lazy_flags = False):
+    """
+    Returns the lines of Python that execute 'instr' (including the PC increment) with the given location.
+    The emitted code leaves the cycles the instruction took in a local named 'cycles'.
+    Translated blocks can skip the PC update and the cycle count for the instructions in the middle of the block
+    """
+    out = _Emitter(location, indent, fetch, lazy_flags)
+    next_pc = out.at(instr.Size - 1)
+    if set_pc:
+        out.emit("cpu.PC = {}".format(next_pc))
+
+    operands = instr._operands or (None, None)
+    bus_width = instr._result_size
+    action = instr._action
+    needs_flags = instr._flags_affected is not None
+    needs_dest = action not in _ignores_destination or (needs_flags and Bit.Calculate is instr._flags_affected.get(Flag.h))
+    needs_dest = needs_dest and not _alu_ignores_destination(instr)
+
+    # Register reads are cheap and stable, so they're used in place unless something may change them first
+    keep_registers = action in _inline_actions and not isinstance(operands[1], RegisterPostOperand)
+
+    # 1. Operands, in the same order as Instruction.execute
+    dest, address = "None", None
+    if operands[0] is not None:
+        if needs_dest or isinstance(operands[0], RegisterPostOperand):
+            dest, address = _get_operand(out, operands[0], bus_width)
+            if needs_dest and not _is_simple(dest, keep_registers):
+                dest = out.temp(dest)
+        elif isinstance(operands[0], DirectOperand):
+            address = out.temp(_translated_address(operands[0], out.immediate(operands[0].width)))
+        elif isinstance(operands[0], RegisterIndirectOperand):
+            address = out.temp(_translated_address(operands[0], _register_expression(out, operands[0]._register, operands[0].width)))
+    source, _ = _get_operand(out, operands[1], bus_width)
+    if not _is_simple(source, keep_registers):
+        source = out.temp(source)
+
+    # 2. Execute
+    if _uses_alu_table(instr, dest):
+        # 3. Flags & writeback come straight out of the table
+        _emit_alu(out, instr, dest, source, address)
+        raw = None
+    else:
+        raw = _emit_action(out, instr, names, dest, source)
+
+    # 3. Flags & writeback
+    if raw is not None and (needs_flags or _writes_back(operands[0])):
+        # Loads copy an operand that has already been masked to the bus width
+        result = raw if action is instructions.Load else out.temp(_mask(raw, bus_width))
+        _emit_flags(out, instr, raw, result, dest, source)
+        _set_operand(out, operands[0], address, result, bus_width)
+
+    # 4. Cycles
+    if cycles and instr.ShortCycles is None:
+        out.emit("cycles = {}".format(instr.Cycles))
+    elif cycles:
+        # Conditional instructions only pay the full price when they took the branch, wherever it went.
+        # Expanded jumps test the condition right here, executors return False when they didn't branch
+        taken = dest if raw is None else "{} is not False".format(raw)
+        out.emit("cycles = {} if {} else {}".format(instr.Cycles, taken, instr.ShortCycles))
+    return out.lines
+#end
+
+def ends_block(instr):
+    """ Checks if a translated block has to stop after this instruction """
+    return instr._action in _block_terminators
+
+def writes_memory(instr):
+    """ Checks if an instruction may write to memory """
+    if instr._action in _stack_writers:
+        return True
+    destination = instr._operands[0] if instr._operands is not None else None
+    return isinstance(destination, (DirectOperand, RegisterIndirectOperand, RegisterPostOperand))
+#end
+
+def touches_memory(instr):
+    """ Checks if an instruction may read or write memory, past fetching its own bytes """
+    if instr._action in _stack_writers or instr._action in _stack_readers:
+        return True
+    return any(isinstance(x, (DirectOperand, RegisterIndirectOperand, RegisterPostOperand)) for x in instr._operands or ())
+#end
+
+def compile_block(block, fetch, bank = None, lazy_flags = False):
+    """
+    Translates a straight-line run of instructions into a single function: block(cpu, mem, cycle) -> cycles
+    'block' is a list of (location, Instruction) tuples, where only the last instruction may change the PC.
+    Immediate operands are read through 'fetch' once and baked into the generated code.
+    Memory is ticked to the cycle each instruction would start on when run one at a time, so writes get queued
+    and retire on the same cycles they would in the interpreter. The block stops early if a write (landing
+    directly or retiring from the queue) raises an interrupt or, when a 'bank' is given, switches the ROM bank
+    out from under it
+    """
+    names = _executor_names()
+    stops = ["(mem._pending_interrupts and cpu.InterruptsEnabled)"]
+    if bank is not None:
+        stops.append("mem.ROM._bank != {}".format(bank))
+    stop = " or ".join(stops)
+
+    # The caller already took any interrupt that was pending on the first cycle
+    source = ["def block(cpu, mem, cycle):", "    mem.Tick(cycle)"]
+    elapsed = 0
+    for index, (location, instr) in enumerate(block):
+        if index > 0:
+            # Writes that were queued may land before this instruction, exactly like between two dispatches.
+            # Instructions that touch memory always tick, so their own writes get queued against the right cycle
+            now = "cycle + {}".format(elapsed)
+            due = "mem._next_write_cycle <= {}".format(now)
+            tick = "mem.Tick({})".format(now)
+            if writes_memory(block[index - 1][1]):
+                # An unsynchronized write landed straight away, so the stop conditions always need checking
+                source.append("    " + (tick if touches_memory(instr) else "if {}: {}".format(due, tick)))
+                source.append("    if {}:".format(stop))
+            elif touches_memory(instr):
+                source.append("    if {} and ({}):".format(tick, stop))
+            else:
+                source.append("    if {} and {} and ({}):".format(due, tick, stop))
+            source.append("        cpu.PC = 0x{:04X}".format(location - 1))
+            source.append("        return {}".format(elapsed))
+
+        last = index == len(block) - 1
+        source += emit_instruction(instr, location, names, fetch = fetch, set_pc = last, cycles = last, lazy_flags = lazy_flags)
+        elapsed += instr.Cycles
+    source.append("    return {} + cycles".format(elapsed - block[-1][1].Cycles))
+
+    return _compile("\n".join(source), names)["block"]
+#end
+
+def _handler_name(instr, prefixed):
+    return "{}_0x{:02X}".format("cb" if prefixed else "op", instr.Opcode)
+
+def _compile(source, names):
+    namespace = { name: executor for executor, name in names.items() }
+    namespace.update(_flag_resolvers.values())
+    for entry, (name, _) in list(_alu_tables.items()):
+        if name + "[" in source:
+            bind_alu_table(namespace, name, entry)
+    exec(compile(source, "<compiled instructions>", "exec"), namespace)
+    return namespace
+
+def _handlers_source(base_opcodes, cb_opcodes, names, lazy_flags):
+    source = []
+    handler_names = []
+    for prefixed, table in ((False, base_opcodes), (True, cb_opcodes)):
+        for instr in table:
+            name = _handler_name(instr, prefixed)
+            source.append("def {}(cpu, mem, location):".format(name))
+            source += emit_instruction(instr, "location", names, lazy_flags = lazy_flags)
+            source.append("    return cycles")
+            source.append("")
+            handler_names.append(name)
+    return source, handler_names
+#end
+
+def compile_handlers(base_opcodes, cb_opcodes, lazy_flags = False):
+    """
+    Builds the flat 512 entry handler table.
+    Entries [0x00, 0xFF] are the base instructions and [0x100, 0x1FF] are the CB prefixed ones.
+    With 'lazy_flags', handlers record what they did to the flags in the CPU instead of computing them
+    """
+    names = _executor_names()
+    source, handler_names = _handlers_source(base_opcodes, cb_opcodes, names, lazy_flags)
+    namespace = _compile("\n".join(source), names)
+    return [ namespace[name] for name in handler_names ]
+#end
+
+def handlers_module(base_opcodes, cb_opcodes, header = ()):
+    """
+    Source of a module that defines the same handlers compile_handlers builds, as a 'handlers' list.
+    Lets the expanded code be generated ahead of time, checked in and reviewed
+    """
+    names = _executor_names()
+    source, handler_names = _handlers_source(base_opcodes, cb_opcodes, names, False)
+    text = "\n".join(source)
+    used = lambda name: re.search(r"\b{}\b".format(re.escape(name)), text) is not None
+
+    # Tables are numbered in the order the handlers use them, whatever else got registered first
+    tables = []
+    for name in re.findall(r"\b(alu_\d+)\[", text):
+        if name not in tables:
+            tables.append(name)
+    renamed = { name: "alu_{}".format(number) for number, name in enumerate(tables) }
+    text = re.sub(r"\b(alu_\d+)\[", lambda x: renamed[x.group(1)] + "[", text)
+    entries = { name: entry for entry, (name, _) in _alu_tables.items() }
+
+    module = [ "# " + line for line in header ]
+    executors = sorted(name for name in set(names.values()) if used(name))
+    module.append("from .instructions import {}".format(", ".join(executors)))
+    module.append("from .compiler import bind_alu_table")
+    module.append("")
+    module.append("# Shared with everything compiled at run time, and only filled in once a handler looks them up")
+    for name in tables:
+        module.append("bind_alu_table(globals(), {!r}, {!r})".format(renamed[name], entries[name]))
+    module.append("")
+    module.append(text)
+    module.append("handlers = [")
+    module += [ "    {},".format(name) for name in handler_names ]
+    module.append("]")
+    return "\n".join(module) + "\n"
+#end
+
+def can_fuse(instrs):
+    """
+    Checks if a sequence of instructions can run as one fused handler.
+    Everything but the last one has to fall through to the next without writing memory, so nothing
+    (a pending interrupt, a queued write, a bank switch) can tell the difference
+    """
+    return len(instrs) > 1 and not any(ends_block(x) or writes_memory(x) for x in instrs[:-1])
+
+def _emit_fused(node, table, location, names, depth, lazy_flags):
+    """ Emits the instruction at the root of 'node' followed by the checks for whatever can come after it """
+    index, children = node
+    instr = table[index]
+    indent = depth + 1
+    pad = "    " * indent
+    if not children:
+        # The end of a sequence, this one can move the PC
+        source = emit_instruction(instr, location, names, indent, lazy_flags = lazy_flags)
+        source.append(pad + "return elapsed + cycles")
+        return source
+
+    source = emit_instruction(instr, location, names, indent, set_pc = False, cycles = False, lazy_flags = lazy_flags)
+    elapsed = "elapsed + {}".format(instr.Cycles) if depth > 0 else str(instr.Cycles)
+    following = "l{}".format(depth + 1)
+    source.append(pad + "{} = {} + {}".format(following, location, instr.Size))
+    source.append(pad + "elapsed = {}".format(elapsed))
+    # Tick memory in between like compile_block does, before the next opcode gets read since a write could switch banks
+    stop = "(mem._pending_interrupts and cpu.InterruptsEnabled)"
+    if writes_memory(instr):
+        source.append(pad + "mem.Tick(cycle + elapsed)")
+        source.append(pad + "if {}:".format(stop))
+    elif any(touches_memory(table[child]) for child in children):
+        source.append(pad + "if mem.Tick(cycle + elapsed) and {}:".format(stop))
+    else:
+        source.append(pad + "if mem._next_write_cycle <= cycle + elapsed and mem.Tick(cycle + elapsed) and {}:".format(stop))
+    source.append(pad + "    cpu.PC = {} - 1".format(following))
+    source.append(pad + "    return elapsed")
+    source.append(pad + "opcode = mem.Read8({} - 1)".format(following))
+    if any(child >= CB_OFFSET for child, _ in children.items()):
+        source.append(pad + "if opcode == 0xCB:")
+        source.append(pad + "    opcode = {} + mem.Read8({})".format(CB_OFFSET, following))
+    for child, grandchildren in children.items():
+        source.append(pad + "if opcode == 0x{:03X}:".format(child))
+        source += _emit_fused((child, grandchildren), table, following, names, depth + 1, lazy_flags)
+
+    # Anything else gets dispatched on its own
+    source.append(pad + "cpu.PC = {} - 1".format(following))
+    source.append(pad + "return elapsed")
+    return source
+#end
+
+def compile_fused(handlers, sequences, base_opcodes, cb_opcodes, lazy_flags = False):
+    """
+    Builds a copy of the handler table where the first opcode of every fused sequence runs the whole sequence.
+    'sequences' are lists of handler table indices (CB prefixed opcodes start at CB_OFFSET).
+    The fused handler checks what actually comes next and stops as soon as it doesn't match,
+    or when a write landing in between raises an interrupt
+    """
+    table = list(base_opcodes) + list(cb_opcodes)
+    names = _executor_names()
+
+    # Sequences that share a start become a single tree of checks
+    roots = {}
+    for sequence in sequences:
+        if not can_fuse([ table[index] for index in sequence ]):
+            raise ValueError("Can't fuse {}".format(" ; ".join(table[index].Mnemonic for index in sequence)))
+        children = roots.setdefault(sequence[0], {})
+        for index in sequence[1:]:
+            children = children.setdefault(index, {})
+
+    source = []
+    for index, children in roots.items():
+        source.append("def fused_0x{:03X}(cpu, mem, location):".format(index))
+        # Memory was ticked to the cycle this handler started on
+        source.append("    cycle = mem._cycle_count")
+        source += _emit_fused((index, children), table, "location", names, 0, lazy_flags)
+        source.append("")
+
+    namespace = _compile("\n".join(source), names)
+    fused = list(handlers)
+    for index in roots:
+        fused[index] = namespace["fused_0x{:03X}".format(index)]
+    return fused
+#end
+
+def reference_handler(instr):
+    """ Wraps the generic Instruction.execute path so it can sit in a handler table """
+    def handler(cpu, mem, location):
+        cpu.PC = location - 1 + instr.Size
+        return instr.execute(cpu, mem, location)
+    return handler
+#end
+
+def reference_handlers(base_opcodes, cb_opcodes):
+    """ Builds a handler table that interprets every instruction through Instruction.execute """
+    return [ reference_handler(instr) for instr in list(base_opcodes) + list(cb_opcodes) ]
+#end
@@ -4,47 +4,114 @@ from .cpu_types import Registers, Flag
 from .bus import InterruptBit
 from .memory import Memory
 from .instructions import Instruction
-from .base_instructions import base_instructions
-from .cb_prefix_instructions import cb_prefix
+from .compiler import compile_handlers, compile_fused, reference_handlers, CB_OFFSET
+from .blocks import BlockCache
+from .profiler import OpcodeProfile
+from .opcode_table import base_instructions, cb_prefix, mnemonic_index
+
+try:
+    # The handlers expanded ahead of time by tools/generate_instructions.py --backend handlers
+    from .compiled_handlers import handlers as generated_handlers
+except ImportError:
+    generated_handlers = None
 
 class CPU:
     """
     Emulates the Sharp LR35902 by instruction interpretation
     """
 
-    def __init__(self, memory: Memory):
-        self.__program_counter = 0
-        self.__stack_ptr = 0
+    # Every register is a plain int attribute. 16-bit pairs (AF, BC, DE, HL) are computed from their halves
+    # A:  The 8-bit Accumulator register
+    # F:  The Flag register. Backed by _flags, with _pending_flags holding the last flag update when flags are lazy
+    # B, C, D, E, H, L: General purpose 8-bit registers
+    # SP: The 16-bit Stack Pointer
+    # PC: The 16-bit Program Counter
+    __slots__ = (
+        'A', '_flags', 'B', 'C', 'D', 'E', 'H', 'L', 'SP', 'PC', '_pending_flags',
+        '__stack_size', '__memory', '__interrupts_enabled', '__suspended',
+        '_curr_inst', '_next_instr_cycle',
+        '__base_opcodes', '__cb_opcodes', '__handlers', '__blocks', '__specialized', '__lazy_flags', '__fusion', '__profile', '__debug',
+    )
+
+    # Attribute names of the 8-bit registers, indexed by their Registers offset
+    _register_names = ('A', 'F', 'B', 'C', 'D', 'E', 'H', 'L')
+
+    # Flat handler tables shared by every CPU, built the first time they're needed
+    _handler_tables = {}
+
+    def __init__(self, memory: Memory, specialized = True, tiered = False, lazy_flags = False, fusion = ()):
+        self.PC = 0
+        self.SP = 0
         self.__stack_size = 0
-        self.__registers = bytearray(2 * 4)
+        self.A = self._flags = 0
+        self._pending_flags = None
+        self.B = self.C = 0
+        self.D = self.E = 0
+        self.H = self.L = 0
 
         self.__memory = memory
         self.__interrupts_enabled = True
         self.__suspended = False
 
         self._curr_inst = None
-        self._curr_result = None
         self._next_instr_cycle = 0
 
         self.__base_opcodes = base_instructions
         self.__cb_opcodes = cb_prefix
+        self.__handlers = None
+        self.__blocks = None
+        self.__specialized = specialized
+        self.__lazy_flags = lazy_flags
+        self.__fusion = tuple(tuple(x) for x in fusion)
+        self.__profile = None
+        self.__handlers = CPU._get_handler_table(specialized, lazy_flags, self.__fusion)
+        self.Tiered = tiered
 
         self.__debug = False
     # end init
 
+    @classmethod
+    def _get_handler_table(cls, specialized: bool, lazy_flags: bool, fusion: tuple = ()) -> List[Callable]:
+        """ Gets the 512 entry dispatch table, with CB prefixed opcodes starting at CB_OFFSET """
+        # The reference handlers always go through the F property, so they work the same either way
+        # Fused sequences only exist as specialized handlers
+        if not specialized:
+            lazy_flags, fusion = False, ()
+        key = (specialized, lazy_flags, fusion)
+        if key not in cls._handler_tables:
+            if len(fusion) > 0:
+                handlers = cls._get_handler_table(specialized, lazy_flags)
+                cls._handler_tables[key] = compile_fused(handlers, fusion, base_instructions, cb_prefix, lazy_flags)
+            elif specialized and not lazy_flags and generated_handlers is not None:
+                cls._handler_tables[key] = generated_handlers
+            elif specialized:
+                cls._handler_tables[key] = compile_handlers(base_instructions, cb_prefix, lazy_flags)
+            else:
+                cls._handler_tables[key] = reference_handlers(base_instructions, cb_prefix)
+        return cls._handler_tables[key]
+
+    def _resolve_flags(self):
+        """ Works out the flags left pending by the last instruction that set them """
+        resolver, raw, result, dest, source = self._pending_flags
+        self._pending_flags = None
+        self._flags = resolver(self._flags, raw, result, dest, source)
+
     ### Bit Flag methods ###
     def get_flag(self, bit_offset: int) -> bool:
-        return (self.__registers[1] & (1 << bit_offset)) == (1 << bit_offset)
+        return (self.F & (1 << bit_offset)) != 0
 
     def set_flag(self, value : bool, bit_offset: int):
         if value:
-            self.__registers[1] = self.__registers[1] | 1 << bit_offset
+            self.F = self.F | 1 << bit_offset
         else:
-            self.__registers[1] = (self.__registers[1] & ~(1 << bit_offset))
+            self.F = self.F & ~(1 << bit_offset)
 
     def _generate_get_flag(bit_offset: int) -> Callable[['CPU'], bool]:
+        mask = 1 << bit_offset
         def gen(self: 'CPU') -> bool:
-            return self.get_flag(bit_offset)
+            if self._pending_flags is not None:
+                self._resolve_flags()
+            return (self._flags & mask) != 0
         return gen
 
     def _generate_set_flag(bit_offset: int) -> Callable[['CPU', bool], None]:
@@ -53,26 +120,22 @@ class CPU:
         return gen
 
     ### Register Flag methods ###
-    # NOTE they use big endian because the MSB should be stored in the first 8-bit register!
+    # NOTE the MSB of a pair is the first 8-bit register (e.g. B in BC)
     def get_register(self, offset: int, length: int) -> int:
         """ Get method for regular registers """
-        return int.from_bytes(self.__registers[offset : offset+length], 'big')
+        names = CPU._register_names
+        if length == 1:
+            return getattr(self, names[offset])
+        return (getattr(self, names[offset]) << 8) | getattr(self, names[offset + 1])
 
     def set_register(self, value : int, offset: int, length: int):
         """ Set method for regular registers """
-        data = bytes([value]) if length == 1 else bytes([ (value&0xFF00) >> 8, value & 0xFF] )
-        for i in range(0, length):
-            self.__registers[offset + i] = data[i]
-
-    def _generate_get_register(offset: int, length: int = 1) -> Callable[['CPU'], int]:
-        def gen(self: 'CPU') -> int:
-            return self.get_register(offset, length)
-        return gen
-
-    def _generate_set_register(offset: int, length: int = 1) -> Callable[['CPU', int], None]:
-        def gen(self: 'CPU', value: int):
-            self.set_register(value, offset, length)
-        return gen
+        names = CPU._register_names
+        if length == 1:
+            setattr(self, names[offset], value & 0xFF)
+        else:
+            setattr(self, names[offset], (value >> 8) & 0xFF)
+            setattr(self, names[offset + 1], value & 0xFF)
 
     ### Properties ###
 
@@ -86,39 +149,143 @@ class CPU:
         self.__debug = value
 
     @property
-    def PC(self):
-        """ The 16-bit Program Counter """
-        return self.__program_counter
+    def Specialized(self):
+        """ Executes through the compiled opcode handlers rather than the generic Instruction.execute """
+        return self.__specialized
 
-    @PC.setter
-    def PC(self, value):
-        self.__program_counter = value
+    @Specialized.setter
+    def Specialized(self, value):
+        self.__specialized = value
+        self._switch_handlers()
 
     @property
-    def SP(self):
-        """ The 16-bit Stack Pointer """
-        return self.__stack_ptr
+    def LazyFlags(self):
+        """ Only works out the flags when something reads them, instead of after every instruction that sets them """
+        return self.__lazy_flags
 
-    @SP.setter
-    def SP(self, value):
-        self.__stack_ptr = value
+    @LazyFlags.setter
+    def LazyFlags(self, value):
+        self.__lazy_flags = value
+        self._switch_handlers()
+
+    @property
+    def Fusion(self):
+        """
+        Opcode sequences (as handler table indices) that run as a single handler when they show up back to back.
+        See fusion.read_fused_sequences
+        """
+        return self.__fusion
+
+    @Fusion.setter
+    def Fusion(self, value):
+        self.__fusion = tuple(tuple(x) for x in value) if value is not None else ()
+        self._switch_handlers()
+
+    @property
+    def Profiling(self):
+        """ Records what every opcode costs (see Profile). Swaps in an instrumented handler table, so it's free when off """
+        return self.__profile is not None
+
+    @Profiling.setter
+    def Profiling(self, value):
+        if value == self.Profiling:
+            return
+        self.__profile = OpcodeProfile() if value else None
+        self._switch_handlers()
+
+    @property
+    def Profile(self):
+        """ The OpcodeProfile being recorded into, None unless Profiling. Translated blocks don't show up in it """
+        return self.__profile
+
+    def ProfileReport(self, top = None):
+        """ The opcodes that ran while Profiling, ranked by host time per emulated cycle """
+        return self.__profile.Report(list(self.__base_opcodes) + list(self.__cb_opcodes), top)
+
+    def _switch_handlers(self):
+        # Eager handlers read the flags directly, so nothing can be left pending for them
+        if self._pending_flags is not None:
+            self._resolve_flags()
+        self.__handlers = CPU._get_handler_table(self.__specialized, self.__lazy_flags, self.__fusion)
+        if self.__profile is not None:
+            self.__handlers = self.__profile.Instrument(self.__handlers)
+        if self.__blocks is not None:
+            # Translated blocks are built for one flag mode, so start over with the new one
+            self.Tiered = True
+
+    @property
+    def Tiered(self):
+        """
+        Runs hot straight-line runs of ROM code as a single translated block rather than one instruction at a time.
+        Cold code stays on the handler table, see BlockCache.Threshold
+        """
+        return self.__blocks is not None
+
+    @Tiered.setter
+    def Tiered(self, value):
+        # Starting over keeps whatever Threshold was tuned in
+        threshold = self.__blocks.Threshold if self.__blocks is not None else BlockCache.HOT_THRESHOLD
+        self.__blocks = BlockCache(self.__base_opcodes, self.__cb_opcodes, self.__lazy_flags and self.__specialized, threshold) if value else None
+
+    @property
+    def Blocks(self):
+        """ The translated block cache, None unless the CPU is Tiered """
+        return self.__blocks
 
     ## Registers ##
     # 8-BIT WIDTH #
-    A = property(_generate_get_register(Registers.A), _generate_set_register(Registers.A), None, "The 8-bit Accumulator register")
-    F = property(_generate_get_register(Registers.F), _generate_set_register(Registers.F), None, "The Flag register")
-    B = property(_generate_get_register(Registers.B), _generate_set_register(Registers.B), None, "General purpose 8-bit register")
-    C = property(_generate_get_register(Registers.C), _generate_set_register(Registers.C), None, "General purpose 8-bit register")
-    D = property(_generate_get_register(Registers.D), _generate_set_register(Registers.D), None, "General purpose 8-bit register")
-    E = property(_generate_get_register(Registers.E), _generate_set_register(Registers.E), None, "General purpose 8-bit register")
-    H = property(_generate_get_register(Registers.H), _generate_set_register(Registers.H), None, "General purpose 8-bit register")
-    L = property(_generate_get_register(Registers.L), _generate_set_register(Registers.L), None, "General purpose 8-bit register")
+    @property
+    def F(self):
+        """ The Flag register """
+        if self._pending_flags is not None:
+            self._resolve_flags()
+        return self._flags
+
+    @F.setter
+    def F(self, value):
+        self._pending_flags = None
+        self._flags = value
 
     # 16-BIT WIDTH #
-    AF = property(_generate_get_register(Registers.A,2), _generate_set_register(Registers.A,2), None, "General purpose 16-bit register")
-    BC = property(_generate_get_register(Registers.B,2), _generate_set_register(Registers.B,2), None, "General purpose 16-bit register")
-    DE = property(_generate_get_register(Registers.D,2), _generate_set_register(Registers.D,2), None, "General purpose 16-bit register")
-    HL = property(_generate_get_register(Registers.H,2), _generate_set_register(Registers.H,2), None, "General purpose 16-bit register")
+    @property
+    def AF(self):
+        """ General purpose 16-bit register """
+        return (self.A << 8) | self.F
+
+    @AF.setter
+    def AF(self, value):
+        self.A = (value >> 8) & 0xFF
+        self.F = value & 0xFF
+
+    @property
+    def BC(self):
+        """ General purpose 16-bit register """
+        return (self.B << 8) | self.C
+
+    @BC.setter
+    def BC(self, value):
+        self.B = (value >> 8) & 0xFF
+        self.C = value & 0xFF
+
+    @property
+    def DE(self):
+        """ General purpose 16-bit register """
+        return (self.D << 8) | self.E
+
+    @DE.setter
+    def DE(self, value):
+        self.D = (value >> 8) & 0xFF
+        self.E = value & 0xFF
+
+    @property
+    def HL(self):
+        """ General purpose 16-bit register """
+        return (self.H << 8) | self.L
+
+    @HL.setter
+    def HL(self, value):
+        self.H = (value >> 8) & 0xFF
+        self.L = value & 0xFF
 
     ## Flags ##
     z = property(_generate_get_flag(Flag.z), _generate_set_flag(Flag.z), None, "The Zero bit flag")
@@ -126,6 +293,11 @@ class CPU:
     h = property(_generate_get_flag(Flag.h), _generate_set_flag(Flag.h), None, "The Half Carry bit flag")
     c = property(_generate_get_flag(Flag.c), _generate_set_flag(Flag.c), None, "The Carry bit flag")
 
+    @property
+    def InterruptsEnabled(self):
+        """ The Interrupt Master Enable. Set through EnableInterrupts """
+        return self.__interrupts_enabled
+
     def EnableInterrupts(self, is_enabled):
         self.__interrupts_enabled = is_enabled
     def Halt(self):
@@ -136,28 +308,27 @@ class CPU:
     # Right now, the way this fits in the instruction machinery makes it complicated and wrong
     # but when executing instructions, we have a handle back to the CPU, so just use it here directly.
     def PushStack(self, value):
-        converted = value.to_bytes(2, 'little')
-        self.SP -= 2
-        self.__memory.Write(self.SP, converted)
+        self.SP = (self.SP - 2) & 0xFFFF
+        self.__memory.Write16(self.SP, value)
         self.__stack_size += 1
     def PeekStack(self):
         if self.__stack_size == 0:
             return 0
 
-        return self.__memory.Read(self.SP, 2)
+        return self.__memory.Read16(self.SP)
     def PopStack(self):
         assert(self.__stack_size > 0)
         top = self.PeekStack()
-        self.SP += 2
+        self.SP = (self.SP + 2) & 0xFFFF
         self.__stack_size -= 1
-        return int.from_bytes(top, 'little')
+        return top
     #end
 
     def _get_next_instruction(self):
-        opcode = self.__memory.Read(self.PC)[0]
+        opcode = self.__memory.Read8(self.PC)
         instr = self.__base_opcodes[opcode]
         if opcode == 0xCB:
-            opcode = self.__memory.Read(self.PC+1)[0]
+            opcode = self.__memory.Read8(self.PC+1)
             instr = self.__cb_opcodes[opcode]
 
         self._curr_inst = instr
@@ -172,20 +343,18 @@ class CPU:
     }
 
     def _execute_instruction(self, location):
-        self._curr_result = self._curr_inst.execute(self, self.__memory, location)
+        return self._curr_inst.execute(self, self.__memory, location)
     def _check_interrupts(self):
         if not self.__interrupts_enabled:
             return
 
-        # TODO: Optimize! Switch priority and have memory execute a callback to CPU
-        # or better yet, have it come in through the system and mark a dirty flag.
-        raised = self.__memory.CheckInterruptFlags()
-        if raised == 0:
+        # Memory keeps IE & IF up to date as they get written, so there's nothing to read here
+        pending = self.__memory.PendingInterrupts
+        if pending == 0:
             return
 
-        enabled = self.__memory.CheckInterruptEnable()
         for bit in InterruptBit:
-            if (enabled & bit) == bit and (raised & bit) == bit:
+            if (pending & bit) == bit:
                 # If we were suspended, wake up!
                 self.__suspended = False
 
@@ -202,6 +371,21 @@ class CPU:
         #end for
     #end
 
+    def _register_state(self):
+        return (self.A, self.F, self.B, self.C, self.D, self.E, self.H, self.L, self.SP)
+
+    def _dispatch(self):
+        "Fetches, decodes and executes the instruction at the PC. Returns the amount of cycles it took"
+        memory = self.__memory
+        location = self.PC + 1
+
+        opcode = memory.Read8(self.PC)
+        if opcode == 0xCB:
+            opcode = CB_OFFSET + memory.Read8(location)
+
+        return self.__handlers[opcode](self, memory, location)
+    #end
+
     def Step(self):
         "Executes the next instruction immediately"
 
@@ -209,17 +393,38 @@ class CPU:
         if self.__suspended:
             return
 
-        # 1. Instruction Fetch, Decode
-        self._get_next_instruction()
-        location = self.PC
-
-        self.PC += self._curr_inst.Size
-        nextPC = self.PC
-
-        # 2. Execute & Writeback
-        self._execute_instruction(location + 1)
+        self._dispatch()
     #end Step
 
+    def _handler_index(self, instruction):
+        """ Where an opcode (0xCBxx for CB prefixed ones) or a mnemonic as the tables spell it is in the handler table """
+        if type(instruction) is str:
+            index = mnemonic_index().get(instruction)
+            if index is None:
+                raise KeyError("Mnemonic not found!")
+            return index
+        if (instruction & 0xFF00) == 0xCB00:
+            return CB_OFFSET + (instruction & 0xFF)
+        return instruction
+
+    def _instruction_at(self, index):
+        """ The Instruction for a handler table index """
+        return self.__cb_opcodes[index - CB_OFFSET] if index >= CB_OFFSET else self.__base_opcodes[index]
+
+    def ExecuteInstruction(self, instruction):
+        """
+        Runs a single instruction as if it were at the PC, regardless of what's actually there.
+        'instruction' is an opcode (0xCBxx for CB prefixed ones) or a mnemonic as the tables spell it (e.g. 'LD BC,d16').
+        Operands past the opcode are still read from memory. Returns the amount of cycles it took
+        """
+        # Straight from the unfused table, a fused handler would carry on into whatever follows in memory
+        index = self._handler_index(instruction)
+        handler = CPU._get_handler_table(self.__specialized, self.__lazy_flags)[index]
+        if self.__profile is not None:
+            handler = self.__profile.Wrap(index, handler)
+        return handler(self, self.__memory, self.PC + 1)
+    #end
+
     def Tick(self, cycle_num):
         "Executes instructions to the tick of a clock"
 
@@ -230,25 +435,72 @@ class CPU:
         if self.__suspended:
             return
 
-        # 1. Instruction Fetch, Decode
-        self._get_next_instruction()
-        location = self.PC
-
-        self.PC += self._curr_inst.Size
-        nextPC = self.PC
-
-        # 2. Execute & Writeback
-        # if self.__debug:
-        #     print(self._curr_inst.ToString(self.__memory, location))
-        # TODO: Verify this location + 1
-        self._execute_instruction(location + 1)
+        if self.__blocks is not None:
+            # A translated block charges the cycles of every instruction in it at once
+            block = self.__blocks.Lookup(self.__memory, self.PC)
+            if block is not None:
+                self._next_instr_cycle = cycle_num + block(self, self.__memory, cycle_num)
+                return
 
-        # TODO: FIX: have the instruction return how many cycles we need to wait
-        # Check how many cycles we have left for the next instruction
-        if self.PC == nextPC and self._curr_inst.ShortCycles is not None:
-            # This means we didn't take the Jump, so there's no memory penalty to pay here
-            self._next_instr_cycle = cycle_num + self._curr_inst.ShortCycles# - 1
-        else:
-            self._next_instr_cycle = cycle_num + self._curr_inst.Cycles# - 1
+        # Fetch, Decode, Execute & Writeback all happen through the handler
+        self._next_instr_cycle = cycle_num + self._dispatch()
     #end Tick
+
+    def RunCycles(self, budget, cycle_num = None):
+        """
+        Executes whole instructions back to back for 'budget' cycles, starting at 'cycle_num'
+        (or wherever the CPU left off). The last instruction can run past the budget.
+        Returns the amount of cycles consumed
+        """
+        if cycle_num is None:
+            cycle_num = self._next_instr_cycle
+        end = cycle_num + budget
+        cycle = max(cycle_num, self._next_instr_cycle)
+
+        memory = self.__memory
+        blocks = self.__blocks
+        idle_loops = blocks.IdleLoops if blocks is not None else ()
+        dispatch = self._dispatch
+        while cycle < end:
+            # Writes retire (and get their due cycle) against the memory clock, so keep it in step
+            memory.Tick(cycle)
+            if self.__interrupts_enabled and memory.PendingInterrupts:
+                self._check_interrupts()
+            if self.__suspended:
+                # Halted until an interrupt. Neither the PPU nor the timers raise any yet,
+                # so the only thing that can wake us up before the budget runs out is a queued write (e.g. to IF)
+                wake = memory.NextWriteCycle
+                if wake is None or wake >= end:
+                    cycle = end
+                    break
+                cycle = max(wake, cycle + 1)
+                continue
+
+            if blocks is not None:
+                start = self.PC
+                block = blocks.Lookup(memory, start)
+                if block is None:
+                    pass
+                elif block in idle_loops:
+                    registers = self._register_state()
+                    period = block(self, memory, cycle)
+                    cycle += period
+                    if self.PC == start and self._register_state() == registers:
+                        # Spinning on memory that nothing in the loop changes (e.g. polling LY).
+                        # Every pass is the same until a queued write lands, so skip the passes in between
+                        wake = memory.NextWriteCycle
+                        limit = end if wake is None or wake > end else wake
+                        if limit > cycle:
+                            cycle += -(-(limit - cycle) // period) * period
+                    continue
+                else:
+                    cycle += block(self, memory, cycle)
+                    continue
+
+            cycle += dispatch()
+        #end while
+
+        self._next_instr_cycle = cycle
+        return cycle - cycle_num
+    #end RunCycles
 #end class
@@ -0,0 +1,44 @@
+import json, os
+
+from .compiler import CB_OFFSET
+
+# The sequences fused by default. They're hand-picked idioms (delay loops, copy loops, polling a register) rather than
+# mined, since there's no ROM to mine them from in here. Mine a set for a given title with tools/mine_ngrams.py
+DEFAULT_SEQUENCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fused_sequences.json")
+
+def parse_opcode(text):
+    """ Turns an opcode as written in the sequence file (e.g. '05' or 'CB37') into a handler table index """
+    text = text.replace(" ", "").upper()
+    if len(text) == 4 and text.startswith("CB"):
+        return CB_OFFSET + int(text[2:], 16)
+    return int(text, 16)
+
+def format_opcode(index):
+    """ The inverse of parse_opcode """
+    if index >= CB_OFFSET:
+        return "CB{:02X}".format(index - CB_OFFSET)
+    return "{:02X}".format(index)
+
+def read_fused_sequences(filename = DEFAULT_SEQUENCES):
+    """ Reads a list of opcode sequences (as tuples of handler table indices) to fuse """
+    with open(filename, 'r') as a_file:
+        data = json.load(a_file)
+    return [ tuple(parse_opcode(x) for x in entry["opcodes"]) for entry in data["sequences"] ]
+
+def write_fused_sequences(filename, sequences, table, counts = None, source = None):
+    """
+    Writes out the opcode sequences to fuse, along with their mnemonics for whoever reads the file.
+    'table' is the combined base + CB instruction list, 'counts' the optional amount of times each sequence was seen
+    and 'source' an optional note on where the sequences came from
+    """
+    entries = []
+    for idx, sequence in enumerate(sequences):
+        entries.append({
+            "opcodes": [ format_opcode(x) for x in sequence ],
+            "mnemonics": [ table[x].Mnemonic for x in sequence ],
+            "count": counts[idx] if counts is not None else None,
+        })
+    with open(filename, 'w') as a_file:
+        data = { "sequences": entries } if source is None else { "source": source, "sequences": entries }
+        json.dump(data, a_file, indent=4)
+#end
@@ -24,6 +24,15 @@ class Instruction:
 
         self._action = executor
         self._operands = operands
+
+        # 16-bit arithmetic carries out of different bits than the 8-bit kind
+        #  'word':   ADD HL,rr carries out of bits 11 and 15
+        #  'offset': ADD SP,r8 and LD HL,SP+r8 carry out of bits 3 and 7, like adding the low bytes
+        self._flag_width = 'byte'
+        if bus_width == 2 and flags is not None:
+            self._flag_width = 'word'
+            if executor is AddOffset or any(x is not None and x._mode == Addressing.RegisterPlusImmediate for x in operands):
+                self._flag_width = 'offset'
     #end
 
     def _get_operand(self, index, cpu, mem, location):
@@ -53,8 +62,14 @@ class Instruction:
         def half_carry():
             # Really good explanation behind the Half-Carry flag
             # https://robdor.com/2016/08/10/gameboy-emulator-half-carry-flag/
+            if self._flag_width == 'word':
+                return ((destination ^ source ^ result) & 0x1000) != 0
+            if self._flag_width == 'offset':
+                return (_offset_carries(cpu, result) & 0x10) != 0
             return (((destination & 0xF) + (source & 0xF)) & 0x10) == 0x10
         def carry():
+            if self._flag_width == 'offset':
+                return (_offset_carries(cpu, result) & 0x100) != 0
             return (raw_result > result) or (raw_result < 0 and result > 0)
 
         # We use a dictionary in case we have instructions where directly executing the above methods would be an exception
@@ -70,13 +85,16 @@ class Instruction:
     #end set_flags
 
     def execute(self, cpu, mem, location):
-        """ Runs the instruction action on the known operands and returns the result """
+        """ Runs the instruction action on the known operands and returns the cycles it took """
         #Get the operands
         dest = self._get_operand(0, cpu, mem, location)
         source = self._get_operand(1, cpu, mem, location)
 
         # Do the thing and box the result!
         raw_result = self._action(cpu, dest, source)
+        if raw_result is False and self._short_cycles is not None:
+            # Conditional instruction that didn't branch, so there's no memory penalty to pay here
+            return self._short_cycles
         if raw_result is None:
             raw_result = 0
         result = (raw_result & 0xFF) if self._result_size == 1 else (raw_result & 0xFFFF)
@@ -87,7 +105,7 @@ class Instruction:
         # Do writeback
         self.writeback(cpu, mem, location, result)
 
-        return result
+        return self._cycles
     #end execute
 
     def writeback(self, cpu, mem, location, result):
@@ -95,7 +113,12 @@ class Instruction:
             # write back would be illegal
             return
 
-        self._operands[0].Set(cpu, mem, location, result)
+        destination = self._operands[0]
+        if destination._mode == Addressing.Direct:
+            # Memory writes need to know how many bytes go out
+            destination.Set(cpu, mem, location, result, self._result_size)
+            return
+        destination.Set(cpu, mem, location, result)
     #end writeback
 
     @property
@@ -181,11 +204,9 @@ class Instruction:
 
 def NoOp(*unused):
     return None
-def Reset(*unused):
-    # TODO: FIX - SHOULD RESET A BIT!
-    # NOTE: I just noticed this prevented us from running blargs test
-    #       not all of our CB prefix instructions were tested enough
-    return 0
+def Reset(_, source, bit):
+    # Operands are swapped like SetBit so the result gets written back
+    return source & ~(1 << bit)
 #end
 
 def InvalidInstruction(*unused):
@@ -203,6 +224,13 @@ def _from_operator(an_operator):
 #end
 
 Add = _from_operator(operator.add)
+def AddOffset(cpu, destination, offset):
+    # The offset is a signed byte
+    return destination + (offset - 0x100 if offset & 0x80 else offset)
+def _offset_carries(cpu, result):
+    # Every bit that carried while adding some offset to SP. The offset is whatever it took to get to 'result'
+    offset = (result - cpu.SP) & 0xFFFF
+    return cpu.SP ^ offset ^ result
 def AddWithCarry(cpu, destination, source):
     return Add(cpu, destination, source) + cpu.c
 #end
@@ -210,7 +238,7 @@ def AddWithCarry(cpu, destination, source):
 Subtract = _from_operator(operator.sub)
 Compare = Subtract
 def SubWithCarry(cpu, destination, source):
-    return Subtract(cpu, destination, source + CPU.c)
+    return Subtract(cpu, destination, source + cpu.c)
 #end
 
 BinOr = _from_operator(operator.or_)
@@ -295,14 +323,14 @@ def Call(cpu, condition, location):
     # Call into a routine.
     # Note that None is not False
     if condition is False:
-        return
+        return False
 
     # The PC is always pointing at the next instruction now
     Push(cpu, None, cpu.PC)
     cpu.PC = location
 def Return(cpu, condition, unused):
     if condition is False:
-        return
+        return False
 
     cpu.PC = Pop(cpu, None)
 def ReturnInterrupt(cpu, *unused):
@@ -319,18 +347,19 @@ Stop = Halt # TODO? We might need to do blank the screen
 
 def Jump(cpu, condition, location):
     if condition is False:
-        return
+        return False
     cpu.PC = location
 def NearJump(cpu, condition, signed_value):
     if condition is False:
-        return
+        return False
 
     value = signed_value
     if CheckBit(None, 7, signed_value):
         # Convert 2's complement back to integer and add a negative sign
         value = - (((~value)+1)&0xFF)
 
-    cpu.PC = cpu.PC + value
+    # The PC wraps around like any other 16-bit register
+    cpu.PC = (cpu.PC + value) & 0xFFFF
 #end
 
 def EnableInterrupts(cpu, *unused):
@@ -352,10 +381,10 @@ def DecimalAdjustAccumulator(cpu, *unused):
     # then $06 is added to the register. Then the four most significant bits are checked.
     # If this more significant digit also happens to be greater than 9 or the C flag is set, then $60 is added.
     if cpu.h or (cpu.A & 0xF) > 9:
-        cpu.A += 0x6
+        cpu.A = (cpu.A + 0x6) & 0xFF
 
     if cpu.c or ((cpu.A & 0xF0) >> 4) > 9:
-        cpu.A += 0x60
+        cpu.A = (cpu.A + 0x60) & 0xFF
 
     return cpu.A
 #end
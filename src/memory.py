@@ -1,7 +1,41 @@
+from collections import deque
 from enum import Enum, IntEnum
 from .bus import IO, Region, InterruptBit, MEMORY_RAM_CYCLES, MEMORY_VRAM_CYCLES
 from .cartridge import Cartridge
 
+# Reads go through a table with one (buffer, delta) entry per 256 byte page: the bytes at an address are
+# buffer[address + delta]. Bank switches and turning the boot ROM off only change the entries of the pages involved
+PAGE_SHIFT = 8
+PAGE_COUNT = 0x100
+
+_ROM_0_PAGES = range(0, (Region.ROM_0 + 1) >> PAGE_SHIFT)
+_ROM_XX_PAGES = range((Region.ROM_0 + 1) >> PAGE_SHIFT, (Region.ROM_END + 1) >> PAGE_SHIFT)
+_BANK_SIZE = Region.ROM_0 + 1
+
+# Plain ints, every write compares against these
+_ROM_END = int(Region.ROM_END)
+_INT_FLAG = int(IO.INT.FLAG)
+_VRAM_BGN = int(Region.VRAM_BGN)
+_VRAM_END = int(Region.VRAM_END)
+
+# Due cycle of an empty write queue, later than any cycle the clock will ever get to
+_NEVER = float('inf')
+_INT_ENABLE = int(IO.INT.ENABLE)
+
+class _UnusablePage:
+    """ Stands in for the buffer of the page shared by OAM and the unusable range, which reads back zeroes on a DMG """
+
+    def __init__(self, mem_area):
+        self._mem_area = mem_area
+
+    def __getitem__(self, span):
+        if type(span) is int:
+            return 0 if span > Region.OAM_END else self._mem_area[span]
+        if span.start > Region.OAM_END:
+            return bytearray(span.stop - span.start)
+        return self._mem_area[span]
+#end class
+
 class Memory:
     def __init__(self, synchronized = False):
         # hard coding to the DMG for now
@@ -9,7 +43,13 @@ class Memory:
         self._rom = None
         self._mem_area = bytearray(0xFFFF + 1) # Full 16-bit address space
         self._len = len(self._mem_area)
-        self._ram_write_queue = []
+        # Everything is the flat array until there's a cartridge
+        self._pages = [ (self._mem_area, 0) ] * PAGE_COUNT
+        self._pages[Region.OAM_BGN >> PAGE_SHIFT] = (_UnusablePage(self._mem_area), 0)
+        # (due cycle, offset, data, length) in the order they're due, and the due cycle of the first one
+        self._ram_write_queue = deque()
+        self._next_write_cycle = _NEVER
+        self._pending_interrupts = 0 # IE & IF, kept up to date by every write to either
 
         self._synchronized = synchronized
         self._cycle_count = 0
@@ -26,14 +66,21 @@ class Memory:
         self._synchronized = value
         if not value:
             # purge current write queue
-            while any(self._ram_write_queue):
-                write_args = self._ram_write_queue[0][1:]
-                self._write_internal(*write_args)
-
-                del self._ram_write_queue[0]
-        # end while
+            self._retire_writes(_NEVER)
     #end
 
+    @property
+    def PendingInterrupts(self):
+        """ The interrupts that are both requested (IF) and enabled (IE) """
+        return self._pending_interrupts
+
+    @property
+    def NextWriteCycle(self):
+        """ The cycle the next queued write is due on, or None if nothing is queued """
+        if self._next_write_cycle is _NEVER:
+            return None
+        return self._next_write_cycle
+
     @property
     def ROMName(self):
         return str(self._rom.name)
@@ -50,6 +97,23 @@ class Memory:
     @IsBootROMActive.setter
     def IsBootROMActive(self, value):
         self._mem_area[IO.Boot] = int(value)
+        self._map_boot_rom()
+
+    def _map_boot_rom(self):
+        # The boot ROM covers the first page only, the cartridge shows through once it's turned off
+        if self.IsBootROMActive and self._boot_rom is not None:
+            self._pages[0] = (self._boot_rom, 0)
+        elif self._rom is not None:
+            self._pages[0] = (self._rom._data, 0)
+        else:
+            self._pages[0] = (self._mem_area, 0)
+
+    def _map_bank(self):
+        # Switchable bank pages read from the selected bank, wherever it is in the cartridge data.
+        # That's the same bytes as the cartridge's bank window, but indexing the data itself is cheaper than a memoryview
+        entry = (self._rom._data, self._rom.BankOffset - _BANK_SIZE)
+        for page in _ROM_XX_PAGES:
+            self._pages[page] = entry
 
     def _is_vram_range(self, address):
         return address >= Region.VRAM_BGN and address <= Region.VRAM_END
@@ -64,113 +128,157 @@ class Memory:
         return address >= Region.ROM_BGN and address <= Region.ROM_END
 
     def Tick(self, cycle_num):
-        """ Should be called for writing/refreshing Work RAM """
+        """
+        Should be called for writing/refreshing Work RAM. Nothing but the clock update happens until a write is due.
+        Returns True if any queued write landed
+        """
         self._cycle_count = cycle_num
-        # assert(len(self._ram_write_queue) < 2)
-        # Check if there's anything to write
-        if len(self._ram_write_queue) > 0:
-            # While there's something in a queue, pop it and do it
-            next_element = self._ram_write_queue[0]
-            when_cycle = next_element[0]
-            if cycle_num == when_cycle:
-                write_args = next_element[1:]
-                self._write_internal(*write_args)
-                del self._ram_write_queue[0]
-            else:
-                # we assume the queue is ordered, 
-                # so we return here immediately
-                return
-        # end if
+        if cycle_num >= self._next_write_cycle:
+            self._retire_writes(cycle_num)
+            return True
+        return False
     #end
 
-    def _read_internal(self, offset, length):
-        # Dispatches special memory segments
-
-        if offset <= Region.BOOT_END and self.IsBootROMActive:
-            # Read straight from the boot ROM
-            return self._boot_rom[offset: offset+length]
-
-        elif self._is_ROM_region(offset):
-            # Read from the cartridge
-            read_func = Cartridge.ReadFixed
-            if offset > Region.ROM_0:
-                read_func = Cartridge.ReadMovable
-
-            return read_func(self._rom, offset, length)
-
-        elif self._is_unusable_region(offset):
-            # Throw an exception!
-            raise RuntimeError()
-
-        # Fallback to Flat data
-        return self._mem_area[offset: offset + length]
+    def _retire_writes(self, cycle_num):
+        # Retire everything that's due, in order. Batched execution (e.g. translated blocks) can queue
+        # several writes before the clock catches up, and they all land no matter how far behind it was
+        queue = self._ram_write_queue
+        while len(queue) > 0 and queue[0][0] <= cycle_num:
+            _, offset, data, length = queue.popleft()
+            self._write_internal(offset, data, length)
+        self._next_write_cycle = queue[0][0] if len(queue) > 0 else _NEVER
     #end
 
     def Read(self, offset, length = 1):
-        """ Read data from Memory """
-        return self._read_internal(offset, length)
+        """ Read a slice of Memory. Meant for bulk reads, the CPU goes through Read8 & Read16 """
+        buffer, delta = self._pages[offset >> PAGE_SHIFT]
+        start = offset + delta
+        return buffer[start : start + length]
+    #end
+
+    def Read8(self, offset):
+        """ Read the byte at an address """
+        buffer, delta = self._pages[offset >> PAGE_SHIFT]
+        return buffer[offset + delta]
+
+    def Read16(self, offset):
+        """ Read the little-endian word at an address. The high byte can be on the next page, or wrap around to 0x0000 """
+        buffer, delta = self._pages[offset >> PAGE_SHIFT]
+        start = offset + delta
+        if (offset & 0xFF) != 0xFF:
+            return buffer[start] | (buffer[start + 1] << 8)
+        return buffer[start] | (self.Read8((offset + 1) & 0xFFFF) << 8)
     #end
 
     def _write_internal(self, offset, data, length):
+        # 'data' is an int (of 'length' bytes) from Write8 & Write16, or anything indexable from a bulk Write
         # Intercept Bank switches
-        if self._is_ROM_region(offset):
-            self._rom.ChangeBank(int(data[0]))
+        if offset <= _ROM_END:
+            self.SwitchBank((data & 0xFF) if type(data) is int else int(data[0]))
             return
 
-        # internal write method
-        # TODO: Optimize!
         # It'll be easier if certain sections (like the PPU or input) are able to
         # intercept the call and handle their own memory rather than writing here
-        for i in range(0, length):
-            self._mem_area[offset + i] = data[i]
+        mem_area = self._mem_area
+        if type(data) is not int:
+            for i in range(0, length):
+                mem_area[offset + i] = data[i]
+        elif length == 1:
+            mem_area[offset] = data
+        elif offset == _INT_ENABLE:
+            # Like Read16, the high byte wraps around to 0x0000
+            self._write_internal(offset, data & 0xFF, 1)
+            self._write_internal(0, (data >> 8) & 0xFF, 1)
+            return
+        else:
+            # A return address pushed from the very end of memory is 0x10000, which wraps around to 0x0000
+            mem_area[offset] = data & 0xFF
+            mem_area[offset + 1] = (data >> 8) & 0xFF
+
+        end = offset + length
+        if offset <= _INT_FLAG < end or end > _INT_ENABLE:
+            self._pending_interrupts = mem_area[_INT_FLAG] & mem_area[_INT_ENABLE] & 0x1F
+        if offset <= IO.Boot < end:
+            self._map_boot_rom()
+    #end
+
+    def _queue_write(self, offset, data, length):
+        # Lands once the memory access has had the time to go through
+        next_cycles = self._cycle_count + MEMORY_RAM_CYCLES - 1
+        if _VRAM_BGN <= offset <= _VRAM_END:
+            next_cycles = self._cycle_count + MEMORY_VRAM_CYCLES - 1
+
+        queue = self._ram_write_queue
+        entry = (next_cycles, offset, data, length)
+        if len(queue) == 0 or queue[-1][0] <= next_cycles:
+            queue.append(entry)
+        else:
+            # VRAM is quicker, so it can be due before RAM writes queued ahead of it.
+            # Writes due on the same cycle keep the order they were made in
+            index = len(queue) - 1
+            while index > 0 and queue[index - 1][0] > next_cycles:
+                index -= 1
+            queue.insert(index, entry)
+        self._next_write_cycle = queue[0][0]
     #end
 
     def Write(self, offset, data):
-        """ Read data to memory locations """
+        """ Write a run of bytes (or a single byte int) to memory. Meant for bulk writes, the CPU goes through Write8 & Write16 """
         if type(data) is int:
-            # We don't allow int writes larger than a byte!
-            data = bytes([data])
+            return self.Write8(offset, data)
 
-        size = len(data)
-        if self.Synchronized:
-            # queue it for a later write
-            write_tuple = (offset, data, size)
-            next_cycles = self._cycle_count + MEMORY_RAM_CYCLES - 1
-            if self._is_vram_range(offset):
-                next_cycles = self._cycle_count + MEMORY_VRAM_CYCLES - 1
-
-            # assert(not any(self._ram_write_queue)) # or self._ram_write_queue[0][0] - next_cycles < 2)
+        if self._synchronized:
+            self._queue_write(offset, data, len(data))
+        else:
+            self._write_internal(offset, data, len(data))
+    #end Write
 
-            self._ram_write_queue.append( (next_cycles, ) + write_tuple )
+    def Write8(self, offset, value):
+        """ Write a byte to an address """
+        if self._synchronized:
+            self._queue_write(offset, value, 1)
+        else:
+            self._write_internal(offset, value, 1)
 
+    def Write16(self, offset, value):
+        """ Write a little-endian word to an address """
+        if self._synchronized:
+            self._queue_write(offset, value, 2)
         else:
-            # Write it directly
-            self._write_internal(offset, data, size)
-        #end
-    #end Write
+            self._write_internal(offset, value, 2)
+    #end
 
     def SetInterruptFlags(self, flags, set_bits):
         curr_val = self.CheckInterruptFlags()
         new_value = curr_val | flags if set_bits else curr_val & (~flags)
-        self.Write(IO.INT.FLAG, new_value)
+        self.Write8(IO.INT.FLAG, new_value)
     def CheckInterruptFlags(self):
-        return self.Read(IO.INT.FLAG)[0]
+        return self.Read8(IO.INT.FLAG)
     #end
 
     def SetInterruptEnable(self, flags, enable):
         curr_val = self.CheckInterruptEnable()
         new_value = curr_val | flags if enable else curr_val & (~flags)
-        self.Write(IO.INT.ENABLE, new_value)
+        self.Write8(IO.INT.ENABLE, new_value)
     def CheckInterruptEnable(self):
-        return self.Read(IO.INT.ENABLE)[0]
+        return self.Read8(IO.INT.ENABLE)
     #end
 
     def SetBootRom(self, data):
         """Starts the Gameboy's Boot ROM"""
-        self.IsBootROMActive = True
         self._boot_rom = data
+        self.IsBootROMActive = True
 
     def SetROM(self, rom):
         """Sets the main Cartridge file"""
         assert(type(rom) is Cartridge)
-        self._rom = rom
\ No newline at end of file
+        self._rom = rom
+        for page in _ROM_0_PAGES:
+            self._pages[page] = (rom._data, 0)
+        self._map_boot_rom()
+        self._map_bank()
+
+    def SwitchBank(self, bank):
+        """ Selects the cartridge bank that shows up in the switchable ROM range """
+        self._rom.ChangeBank(bank)
+        self._map_bank()
\ No newline at end of file
@@ -0,0 +1,186 @@
+import struct
+
+from .cpu_types import Registers, Flag, Bit
+from .operands import Operand, Addressing
+from . import instructions
+from .compiler import _executor_names, CB_OFFSET
+
+# Every opcode is one fixed size record:
+#  opcode, bus width, byte size, cycles, short cycles (0 when there's only one timing), flags, executor
+#  followed by (kind, register, width, extra) for the destination and then the source operand.
+# Sizes, cycles and registers are signed: invalid opcodes take -1 byte and -1 cycles, and SP and PC are negative registers
+_record = struct.Struct('2B3b2B' + 'BbBB' * 2)
+
+# Operand kinds, by their index in the record. 0 is no operand at all
+_kinds = (None, Addressing.Register, Addressing.RegisterIndirect, Addressing.RegisterIncrement, Addressing.RegisterDecrement,
+          Addressing.RegisterPlusImmediate, Addressing.Immediate, Addressing.Direct, Addressing.Constant, Addressing.Bit)
+
+# Each flag takes 2 bits of the flags byte, z in the highest ones. A 0 byte means no flags are affected
+_flag_order = (Flag.z, Flag.n, Flag.h, Flag.c)
+_bit_states = (Bit.Ignore, Bit.Reset, Bit.Set, Bit.Calculate)
+
+def _pack_operand(operand):
+    if operand is None:
+        return (0, 0, 0, 0)
+
+    kind = _kinds.index(operand._mode)
+    if operand._mode == Addressing.Constant:
+        return (kind, 0, operand.width, operand._value)
+    if operand._mode == Addressing.Bit:
+        return (kind, operand._bit, operand.width, operand._expected.value)
+    if operand._mode in (Addressing.Immediate, Addressing.Direct):
+        return (kind, 0, operand.width, 0)
+    return (kind, operand._register, operand.width, int(operand._throwaway))
+#end
+
+def _unpack_operand(kind, register, width, extra):
+    mode = _kinds[kind]
+    if mode is None:
+        return None
+    if mode == Addressing.Constant:
+        return Operand.const(extra)
+    if mode == Addressing.Bit:
+        return Operand.bit(Flag(register), Bit(extra))
+    if mode == Addressing.Immediate:
+        return Operand.imm(width)
+    if mode == Addressing.Direct:
+        return Operand.mem(width)
+
+    register = Registers(register)
+    if mode == Addressing.Register:
+        return Operand.reg(register, width, throwaway = extra != 0)
+    if mode == Addressing.RegisterIndirect:
+        return Operand.regi(register, width)
+    if mode == Addressing.RegisterIncrement:
+        return Operand.regInc(register, width)
+    if mode == Addressing.RegisterDecrement:
+        return Operand.regDec(register, width)
+    return Operand.regI(register)
+#end
+
+def _pack_flags(flags):
+    if flags is None:
+        return 0
+    packed = 0
+    for flag in _flag_order:
+        packed = (packed << 2) | _bit_states.index(flags[flag])
+    return packed
+
+def _unpack_flags(packed):
+    if packed == 0:
+        return None
+    return { flag: _bit_states[(packed >> (6 - 2 * x)) & 0x3] for x, flag in enumerate(_flag_order) }
+
+def pack_instructions(instruction_list, executors):
+    """
+    Packs a list of Instructions into records for an OpcodeTable.
+    Executors are stored by their index in 'executors', which gets any new ones appended to it
+    """
+    names = _executor_names()
+    packed = bytearray()
+    for instr in instruction_list:
+        name = names[instr._action]
+        if name not in executors:
+            executors.append(name)
+        operands = instr._operands if instr._operands is not None else (None, None)
+        packed += _record.pack(
+            instr.Opcode, instr._result_size, instr.Size, instr.Cycles, instr.ShortCycles or 0,
+            _pack_flags(instr._flags_affected), executors.index(name),
+            *_pack_operand(operands[0]), *_pack_operand(operands[1]))
+    return bytes(packed)
+#end
+
+class OpcodeTable:
+    """
+    Read-only list of Instructions backed by their packed records.
+    Each Instruction (and its operands) only gets built the first time its opcode is looked up
+    """
+
+    def __init__(self, records, mnemonics, executors):
+        self._records = records
+        self._mnemonics = mnemonics
+        self._executors = executors
+        self._instructions = [None] * len(mnemonics)
+    #end
+
+    def __len__(self):
+        return len(self._instructions)
+
+    def __getitem__(self, opcode):
+        instr = self._instructions[opcode]
+        if instr is None:
+            instr = self._instructions[opcode] = self._unpack(opcode)
+        return instr
+
+    def __iter__(self):
+        for opcode in range(len(self._instructions)):
+            yield self[opcode]
+
+    def _unpack(self, opcode):
+        fields = _record.unpack_from(self._records, opcode * _record.size)
+        number, bus_width, size, cycles, short_cycles, flags, executor = fields[:7]
+        operands = (_unpack_operand(*fields[7:11]), _unpack_operand(*fields[11:15]))
+        if operands[0] is None and operands[1] is None:
+            operands = None
+
+        return instructions.Instruction(
+            number, self._mnemonics[opcode], bus_width = bus_width,
+            byte_size = size, cycles = cycles if short_cycles == 0 else (cycles, short_cycles),
+            flags = _unpack_flags(flags),
+            operands = operands,
+            executor = getattr(instructions, self._executors[executor]))
+    #end
+#end class
+
+def packed_module(base_opcodes, cb_opcodes, header = ()):
+    """ Source of a module with both opcode tables packed, to be loaded back as OpcodeTables """
+    executors = []
+    base = pack_instructions(base_opcodes, executors)
+    cb = pack_instructions(cb_opcodes, executors)
+
+    module = [ "# " + line for line in header ]
+    module.append("")
+    module.append("executors = {!r}".format(tuple(executors)))
+    module.append("")
+    for name, table, records in (("base", base_opcodes, base), ("cb", cb_opcodes, cb)):
+        module.append("{}_mnemonics = (".format(name))
+        module += [ "    {!r},".format(instr._mnemonic) for instr in table ]
+        module.append(")")
+        module.append("{}_records = bytes.fromhex(".format(name))
+        module += [ "    '{}'".format(records[x:x + 32 * _record.size].hex()) for x in range(0, len(records), 32 * _record.size) ]
+        module.append(")")
+        module.append("")
+    return "\n".join(module)
+#end
+
+_names = { "base_instructions": "base", "cb_prefix": "cb" }
+
+def __getattr__(name):
+    """ Loads base_instructions and cb_prefix from src/packed_opcodes.py the first time either is asked for """
+    if name not in _names:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    from . import packed_opcodes
+    prefix = _names[name]
+    table = OpcodeTable(getattr(packed_opcodes, prefix + "_records"), getattr(packed_opcodes, prefix + "_mnemonics"), packed_opcodes.executors)
+    globals()[name] = table
+    return table
+#end
+
+_mnemonic_index = None
+
+def mnemonic_index():
+    """
+    Maps every mnemonic, as the tables spell it (e.g. 'LD B,d8' or 'BIT 7,H'), to its handler table index.
+    CB prefixed instructions start at CB_OFFSET. Built out of the packed mnemonics, so no Instruction gets built for it
+    """
+    global _mnemonic_index
+    if _mnemonic_index is None:
+        from . import packed_opcodes
+        index = {}
+        for offset, mnemonics in ((0, packed_opcodes.base_mnemonics), (CB_OFFSET, packed_opcodes.cb_mnemonics)):
+            for opcode, mnemonic in enumerate(mnemonics):
+                index.setdefault(mnemonic, offset + opcode)
+        _mnemonic_index = index
+    return _mnemonic_index
+#end
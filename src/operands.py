@@ -56,16 +56,9 @@ class BaseOperand:
     #end
 
     def _translate_address(self, address):
-        is_bytes = type(address) is not int
-
+        # 8-bit addresses are offsets into the I/O page
         if self.width == 1:
-            if is_bytes:
-                address = address[0]
             return address | 0xFF00
-
-        if is_bytes:
-            return address[1] << 8 | address[0]
-
         return address
 
     def can_set_value(self):
@@ -83,7 +76,7 @@ class BaseOperand:
             return self.__str__()
 
         formatter = "0x{0:02X}" if self.width == 1 else "0x{0:04X}"
-        val = int.from_bytes(mem.Read(address, self.width), 'little')
+        val = mem.Read8(address) if self.width == 1 else mem.Read16(address)
         base = formatter.format(val)
         return base if self._mode == Addressing.Immediate else ("({})".format(base))
     #end
@@ -169,17 +162,12 @@ class ImmediateOperand(BaseOperand):
         super().__init__(width, Addressing.Immediate)
     #end
 
-    def _to_num(self, value):
-        if self.width == 1:
-            return value[0]
-
-        # TODO: Optimize based on this
-        #assert(self.width == 2)
-        #return int.from_bytes(value, 'little')
-        return (value[1] << 8) | value[0]
+    def _read_number(self, mem, address):
+        # Little-endian, as wide as the operand
+        return mem.Read8(address) if self.width == 1 else mem.Read16(address)
     def Get(self, cpu, mem, location):
         "Gets the value of the operand"
-        return self._to_num(mem.Read(location, self.width))
+        return self._read_number(mem, location)
     def Set(self, cpu, mem, location, value):
         # No-op
         #raise ValueError("An immediate mode operand cannot be written to!")
@@ -194,10 +182,14 @@ class DirectOperand(ImmediateOperand):
     def Get(self, cpu, mem, location):
         "Gets the value of the operand"
         imm = super().Get(cpu, mem, location)
-        return self._to_num(mem.Read(self._translate_address(imm), self.width))
-    def Set(self, cpu, mem, location, value):
-        address = mem.Read(location, self.width)
-        mem.Write(self._translate_address(address), value)
+        return self._read_number(mem, self._translate_address(imm))
+    def Set(self, cpu, mem, location, value, bus_width = 1):
+        "Sets the value of the operand. LD (a16),SP is the only instruction that writes a whole word here"
+        address = self._translate_address(self._read_number(mem, location))
+        if bus_width == 2:
+            mem.Write16(address, value)
+        else:
+            mem.Write8(address, value)
     #end
 #end class
 
@@ -206,20 +198,16 @@ class RegisterOperand(BaseOperand):
         super().__init__(width, mode)
         self._register = reg
         self._throwaway=throwaway
+        # Every register (and register pair) is an attribute on the CPU with the same name
+        self._attribute = GetRegisterName(reg, width)
     #end
 
     def _get_register(self, cpu):
-        if self._register < 0:
-            return cpu.SP if self._register == Registers.SP else cpu.PC
-        return cpu.get_register(self._register, self.width)
+        return getattr(cpu, self._attribute)
     def _set_register(self, cpu, new_value):
-        if self._register < 0:
-            if self._register == Registers.SP:
-                cpu.SP = new_value
-            else:
-                cpu.PC = new_value
-        else:
-            cpu.set_register(new_value, self._register, self.width)
+        if self._register >= 0 and self.width == 1:
+            new_value &= 0xFF
+        setattr(cpu, self._attribute, new_value)
     #end
 
     def Get(self, cpu, mem, location):
@@ -243,43 +231,35 @@ class RegisterIndirectOperand(RegisterOperand):
     def Get(self, cpu, mem, location):
         "Gets the value of the operand"
         # Reads 1 byte of data
-        return mem.Read(self._translate_address(self._get_register(cpu)), self.width)[0]
+        return mem.Read8(self._translate_address(self._get_register(cpu)))
     def Set(self, cpu, mem, location, value):
         "Sets the value of the operand. Use for writeback step"
         # writes 1 byte of data
-        mem.Write(self._translate_address(self._get_register(cpu)), bytes([value]))
+        mem.Write8(self._translate_address(self._get_register(cpu)), value)
     #end
 #end class
 
 class RegisterPostOperand(RegisterOperand):
+    # Nothing about a single execution is kept in here, since every CPU shares the same operand instances.
+    # The address that was read is recovered by undoing the post operation on the register instead
+
     def __init__(self, reg, width, mode):
         RegisterOperand.__init__(self, reg, width, mode)
         self._register = reg
-
-        inc = lambda x: x+1
-        dec = lambda x: x-1
-        self._postop = inc if self._mode == Addressing.RegisterIncrement else dec
-        self._old_val = None
-    #end
-
-    def _do_postop(self, cpu):
-        #Set the new value immediately
-        value = self._get_register(cpu)
-        new_value = self._postop(value)
-        self._set_register(cpu, new_value)
-        self._old_val = value
+        self._step = 1 if self._mode == Addressing.RegisterIncrement else -1
     #end
 
     def Get(self, cpu, mem, location):
         "Gets the value of the operand"
+        #Set the new value immediately
         value = self._get_register(cpu)
-        self._do_postop(cpu)
-        return mem.Read(self._translate_address(value))[0]
+        self._set_register(cpu, (value + self._step) & 0xFFFF)
+        return mem.Read8(self._translate_address(value))
     def Set(self, cpu, mem, location, value):
         "Sets the value of the operand. Use for writeback step"
-        assert(self._old_val is not None)
-        mem.Write(self._translate_address(self._old_val), bytes([value]))
-        self._old_val = None
+        # Writeback always comes after Get in the same instruction, so the register has already moved
+        address = (self._get_register(cpu) - self._step) & 0xFFFF
+        mem.Write8(self._translate_address(address), value)
     #end
 #end
 
@@ -291,8 +271,9 @@ class RegisterAndImmediateOperand(RegisterOperand):
 
     def Get(self, cpu, mem, location):
         "Gets the value of the operand"
-        # Reads 1 byte of data
-        return super().Get(cpu, mem, location) + (mem.Read(location)[0])
+        # Reads 1 byte of data, which is a signed offset
+        offset = mem.Read8(location)
+        return super().Get(cpu, mem, location) + (offset - 0x100 if offset & 0x80 else offset)
     def Set(self, cpu, mem, location, value):
         # No-op
         #raise ValueError("An immediate mode operand cannot be written to!")
@@ -0,0 +1,543 @@
+# Generated by tools/generate_instructions.py from gb_base.json and gb_cb_prefix.json
+# The packed form of base_instructions.py and cb_prefix_instructions.py, loaded through src/opcode_table.py
+# Do not edit by hand, change the generator and regenerate instead
+
+executors = ('NoOp', 'Load', 'Increment', 'Decrement', 'RotateLeftWithCarry', 'Add', 'RotateRightWithCarry', 'Halt', 'RotateLeft', 'NearJump', 'RotateRight', 'DecimalAdjustAccumulator', 'ComplementA', 'SetCarry', 'InvertCarry', 'AddWithCarry', 'Subtract', 'SubWithCarry', 'BinAnd', 'BinXor', 'BinOr', 'Return', 'Pop', 'Jump', 'Call', 'Push', 'Restart', 'InvalidInstruction', 'ReturnInterrupt', 'AddOffset', 'DisableInterrupts', 'EnableInterrupts', 'ShiftLeft', 'ShiftRightArithmetic', 'Swap', 'ShiftRight', 'CheckBit', 'Reset', 'SetBit')
+
+base_mnemonics = (
+    'NOP',
+    'LD BC,d16',
+    'LD (BC),A',
+    'INC BC',
+    'INC B',
+    'DEC B',
+    'LD B,d8',
+    'RLCA',
+    'LD (a16),SP',
+    'ADD HL,BC',
+    'LD A,(BC)',
+    'DEC BC',
+    'INC C',
+    'DEC C',
+    'LD C,d8',
+    'RRCA',
+    'STOP',
+    'LD DE,d16',
+    'LD (DE),A',
+    'INC DE',
+    'INC D',
+    'DEC D',
+    'LD D,d8',
+    'RLA',
+    'JR r8',
+    'ADD HL,DE',
+    'LD A,(DE)',
+    'DEC DE',
+    'INC E',
+    'DEC E',
+    'LD E,d8',
+    'RRA',
+    'JR NZ,r8',
+    'LD HL,d16',
+    'LD (HL+),A',
+    'INC HL',
+    'INC H',
+    'DEC H',
+    'LD H,d8',
+    'DAA',
+    'JR Z,r8',
+    'ADD HL,HL',
+    'LD A,(HL+)',
+    'DEC HL',
+    'INC L',
+    'DEC L',
+    'LD L,d8',
+    'CPL',
+    'JR NC,r8',
+    'LD SP,d16',
+    'LD (HL-),A',
+    'INC SP',
+    'INC (HL)',
+    'DEC (HL)',
+    'LD (HL),d8',
+    'SCF',
+    'JR C,r8',
+    'ADD HL,SP',
+    'LD A,(HL-)',
+    'DEC SP',
+    'INC A',
+    'DEC A',
+    'LD A,d8',
+    'CCF',
+    'LD B,B',
+    'LD B,C',
+    'LD B,D',
+    'LD B,E',
+    'LD B,H',
+    'LD B,L',
+    'LD B,(HL)',
+    'LD B,A',
+    'LD C,B',
+    'LD C,C',
+    'LD C,D',
+    'LD C,E',
+    'LD C,H',
+    'LD C,L',
+    'LD C,(HL)',
+    'LD C,A',
+    'LD D,B',
+    'LD D,C',
+    'LD D,D',
+    'LD D,E',
+    'LD D,H',
+    'LD D,L',
+    'LD D,(HL)',
+    'LD D,A',
+    'LD E,B',
+    'LD E,C',
+    'LD E,D',
+    'LD E,E',
+    'LD E,H',
+    'LD E,L',
+    'LD E,(HL)',
+    'LD E,A',
+    'LD H,B',
+    'LD H,C',
+    'LD H,D',
+    'LD H,E',
+    'LD H,H',
+    'LD H,L',
+    'LD H,(HL)',
+    'LD H,A',
+    'LD L,B',
+    'LD L,C',
+    'LD L,D',
+    'LD L,E',
+    'LD L,H',
+    'LD L,L',
+    'LD L,(HL)',
+    'LD L,A',
+    'LD (HL),B',
+    'LD (HL),C',
+    'LD (HL),D',
+    'LD (HL),E',
+    'LD (HL),H',
+    'LD (HL),L',
+    'HALT',
+    'LD (HL),A',
+    'LD A,B',
+    'LD A,C',
+    'LD A,D',
+    'LD A,E',
+    'LD A,H',
+    'LD A,L',
+    'LD A,(HL)',
+    'LD A,A',
+    'ADD A,B',
+    'ADD A,C',
+    'ADD A,D',
+    'ADD A,E',
+    'ADD A,H',
+    'ADD A,L',
+    'ADD A,(HL)',
+    'ADD A,A',
+    'ADC A,B',
+    'ADC A,C',
+    'ADC A,D',
+    'ADC A,E',
+    'ADC A,H',
+    'ADC A,L',
+    'ADC A,(HL)',
+    'ADC A,A',
+    'SUB B',
+    'SUB C',
+    'SUB D',
+    'SUB E',
+    'SUB H',
+    'SUB L',
+    'SUB (HL)',
+    'SUB A',
+    'SBC A,B',
+    'SBC A,C',
+    'SBC A,D',
+    'SBC A,E',
+    'SBC A,H',
+    'SBC A,L',
+    'SBC A,(HL)',
+    'SBC A,A',
+    'AND B',
+    'AND C',
+    'AND D',
+    'AND E',
+    'AND H',
+    'AND L',
+    'AND (HL)',
+    'AND A',
+    'XOR B',
+    'XOR C',
+    'XOR D',
+    'XOR E',
+    'XOR H',
+    'XOR L',
+    'XOR (HL)',
+    'XOR A',
+    'OR B',
+    'OR C',
+    'OR D',
+    'OR E',
+    'OR H',
+    'OR L',
+    'OR (HL)',
+    'OR A',
+    'CP B',
+    'CP C',
+    'CP D',
+    'CP E',
+    'CP H',
+    'CP L',
+    'CP (HL)',
+    'CP A',
+    'RET NZ',
+    'POP BC',
+    'JP NZ,a16',
+    'JP a16',
+    'CALL NZ,a16',
+    'PUSH BC',
+    'ADD A,d8',
+    'RST 00H',
+    'RET Z',
+    'RET',
+    'JP Z,a16',
+    'PREFIX CB',
+    'CALL Z,a16',
+    'CALL a16',
+    'ADC A,d8',
+    'RST 08H',
+    'RET NC',
+    'POP DE',
+    'JP NC,a16',
+    'INVALID',
+    'CALL NC,a16',
+    'PUSH DE',
+    'SUB d8',
+    'RST 10H',
+    'RET C',
+    'RETI',
+    'JP C,a16',
+    'INVALID',
+    'CALL C,a16',
+    'INVALID',
+    'SBC A,d8',
+    'RST 18H',
+    'LDH (a8),A',
+    'POP HL',
+    'LD (C),A',
+    'INVALID',
+    'INVALID',
+    'PUSH HL',
+    'AND d8',
+    'RST 20H',
+    'ADD SP,r8',
+    'JP (HL)',
+    'LD (a16),A',
+    'INVALID',
+    'INVALID',
+    'INVALID',
+    'XOR d8',
+    'RST 28H',
+    'LDH A,(a8)',
+    'POP AF',
+    'LD A,(C)',
+    'DI',
+    'INVALID',
+    'PUSH AF',
+    'OR d8',
+    'RST 30H',
+    'LD HL,SP+r8',
+    'LD SP,HL',
+    'LD A,(a16)',
+    'EI',
+    'INVALID',
+    'INVALID',
+    'CP d8',
+    'RST 38H',
+)
+base_records = bytes.fromhex(
+    '0001010400000000000000000000000102030c00000101020200060002000201010800000102020200010001000302010800000201020200010202000401010400dc0201020100010201000501010400ec030102010001020100060102080000010102010006000100070101040057040100010001000100080203140000010700020001ff020009020108001f0501060200010202000a01010800000101000100020202000b02010800000301020200010202000c01010400dc0201030100010301000d01010400ec0301030100010301000e01020800000101030100060001000f01010400570601000100010001001001010400000700000000000000001102030c00000101040200060002001201010800000102040200010001001302010800000201040200010402001401010400dc0201040100010401001501010400ec0301040100010401001601020800000101040100060001001701010400570801000100010001001801020c000009000000000600010019020108001f0501060200010402001a01010800000101000100020402001b02010800000301040200010402001c01010400dc0201050100010501001d01010400ec0301050100010501001e01020800000101050100060001001f01010400570a0100010001000100'
+    '2001020c08000909070100060001002102030c00000101060200060002002201010800000103060200010001002302010800000201060200010602002401010400dc0201060100010601002501010400ec0301060100010601002601020800000101060100060001002701010400c70b00000000000000002801020c080009090701010600010029020108001f0501060200010602002a01010800000101000100030602002b02010800000301060200010602002c01010400dc0201070100010701002d01010400ec0301070100010701002e01020800000101070100060001002f01010400280c00000000000000003001020c08000909040100060001003102030c00000101ff0200060002003201010800000104060200010001003302010800000201ff020001ff02003401010c00dc0202060200020602003501010c00ec0302060200020602003601020c00000102060200060001003701010400160d00000000000000003801020c080009090401010600010039020108001f050106020001ff02003a01010800000101000100040602003b02010800000301ff020001ff02003c01010400dc0201000100010001003d01010400ec0301000100010001003e01020800000101000100060001003f01010400170e0000000000000000'
+    '4001010400000101020100010201004101010400000101020100010301004201010400000101020100010401004301010400000101020100010501004401010400000101020100010601004501010400000101020100010701004601010800000101020100020602004701010400000101020100010001004801010400000101030100010201004901010400000101030100010301004a01010400000101030100010401004b01010400000101030100010501004c01010400000101030100010601004d01010400000101030100010701004e01010800000101030100020602004f01010400000101030100010001005001010400000101040100010201005101010400000101040100010301005201010400000101040100010401005301010400000101040100010501005401010400000101040100010601005501010400000101040100010701005601010800000101040100020602005701010400000101040100010001005801010400000101050100010201005901010400000101050100010301005a01010400000101050100010401005b01010400000101050100010501005c01010400000101050100010601005d01010400000101050100010701005e01010800000101050100020602005f0101040000010105010001000100'
+    '6001010400000101060100010201006101010400000101060100010301006201010400000101060100010401006301010400000101060100010501006401010400000101060100010601006501010400000101060100010701006601010800000101060100020602006701010400000101060100010001006801010400000101070100010201006901010400000101070100010301006a01010400000101070100010401006b01010400000101070100010501006c01010400000101070100010601006d01010400000101070100010701006e01010800000101070100020602006f01010400000101070100010001007001010800000102060200010201007101010800000102060200010301007201010800000102060200010401007301010800000102060200010501007401010800000102060200010601007501010800000102060200010701007601010400000700000000000000007701010800000102060200010001007801010400000101000100010201007901010400000101000100010301007a01010400000101000100010401007b01010400000101000100010501007c01010400000101000100010601007d01010400000101000100010701007e01010800000101000100020602007f0101040000010100010001000100'
+    '8001010400df0501000100010201008101010400df0501000100010301008201010400df0501000100010401008301010400df0501000100010501008401010400df0501000100010601008501010400df0501000100010701008601010800df0501000100020602008701010400df0501000100010001008801010400df0f01000100010201008901010400df0f01000100010301008a01010400df0f01000100010401008b01010400df0f01000100010501008c01010400df0f01000100010601008d01010400df0f01000100010701008e01010800df0f01000100020602008f01010400df0f01000100010001009001010400ef1001000100010201009101010400ef1001000100010301009201010400ef1001000100010401009301010400ef1001000100010501009401010400ef1001000100010601009501010400ef1001000100010701009601010800ef1001000100020602009701010400ef1001000100010001009801010400ef1101000100010201009901010400ef1101000100010301009a01010400ef1101000100010401009b01010400ef1101000100010501009c01010400ef1101000100010601009d01010400ef1101000100010701009e01010800ef1101000100020602009f01010400ef110100010001000100'
+    'a001010400d9120100010001020100a101010400d9120100010001030100a201010400d9120100010001040100a301010400d9120100010001050100a401010400d9120100010001060100a501010400d9120100010001070100a601010800d9120100010002060200a701010400d9120100010001000100a801010400d5130100010001020100a901010400d5130100010001030100aa01010400d5130100010001040100ab01010400d5130100010001050100ac01010400d5130100010001060100ad01010400d5130100010001070100ae01010800d5130100010002060200af01010400d5130100010001000100b001010400d5140100010001020100b101010400d5140100010001030100b201010400d5140100010001040100b301010400d5140100010001050100b401010400d5140100010001060100b501010400d5140100010001070100b601010800d5140100010002060200b701010400d5140100010001000100b801010400ef100100010101020100b901010400ef100100010101030100ba01010400ef100100010101040100bb01010400ef100100010101050100bc01010400ef100100010101060100bd01010400ef100100010101070100be01010800ef100100010102060200bf01010400ef100100010101000100'
+    'c00101140800150907010000000000c102010c0000160102020001020200c20203100c00170907010006000200c30203100000170000000006000200c40203180c00180907010006000200c50201100000190000000001020200c601020800df050100010006000100c701011000001a0000000008000100c80101140800150907010100000000c90101100000150000000000000000ca0203100c00170907010106000200cb01010400001b0000000000000000cc0203180c00180907010106000200cd0203180000180000000006000200ce01020800df0f0100010006000100cf01011000001a0000000008000108d00101140800150904010000000000d102010c0000160104020001040200d20203100c00170904010006000200d301ffff00001b0000000000000000d40203180c00180904010006000200d50201100000190000000001040200d601020800ef100100010006000100d701011000001a0000000008000110d80101140800150904010100000000d901011000001c0000000000000000da0203100c00170904010106000200db01ffff00001b0000000000000000dc0203180c00180904010106000200dd01ffff00001b0000000000000000de01020800ef110100010006000100df01011000001a0000000008000118'
+    'e001020c0000010700010001000100e102010c0000160106020001060200e20101080000010203010001000100e301ffff00001b0000000000000000e401ffff00001b0000000000000000e50201100000190000000001060200e601020800d9120100010006000100e701011000001a0000000008000120e8020210005f1d01ff020006000100e90101040000170000000002060200ea0103100000010700020001000100eb01ffff00001b0000000000000000ec01ffff00001b0000000000000000ed01ffff00001b0000000000000000ee01020800d5130100010006000100ef01011000001a0000000008000128f001020c0000010100010007000100f102010c00ff160100020001000200f20101080000010100010002030100f301010400001e0000000000000000f401ffff00001b0000000000000000f50201100000190000000001000200f601020800d5140100010006000100f701011000001a0000000008000130f802020c005f010106020005ff0200f902010800000101ff020001060200fa0103100000010100010007000200fb01010400001f0000000000000000fc01ffff00001b0000000000000000fd01ffff00001b0000000000000000fe01020800ef100100010106000100ff01011000001a0000000008000138'
+)
+
+cb_mnemonics = (
+    'RLC B',
+    'RLC C',
+    'RLC D',
+    'RLC E',
+    'RLC H',
+    'RLC L',
+    'RLC (HL)',
+    'RLC A',
+    'RRC B',
+    'RRC C',
+    'RRC D',
+    'RRC E',
+    'RRC H',
+    'RRC L',
+    'RRC (HL)',
+    'RRC A',
+    'RL B',
+    'RL C',
+    'RL D',
+    'RL E',
+    'RL H',
+    'RL L',
+    'RL (HL)',
+    'RL A',
+    'RR B',
+    'RR C',
+    'RR D',
+    'RR E',
+    'RR H',
+    'RR L',
+    'RR (HL)',
+    'RR A',
+    'SLA B',
+    'SLA C',
+    'SLA D',
+    'SLA E',
+    'SLA H',
+    'SLA L',
+    'SLA (HL)',
+    'SLA A',
+    'SRA B',
+    'SRA C',
+    'SRA D',
+    'SRA E',
+    'SRA H',
+    'SRA L',
+    'SRA (HL)',
+    'SRA A',
+    'SWAP B',
+    'SWAP C',
+    'SWAP D',
+    'SWAP E',
+    'SWAP H',
+    'SWAP L',
+    'SWAP (HL)',
+    'SWAP A',
+    'SRL B',
+    'SRL C',
+    'SRL D',
+    'SRL E',
+    'SRL H',
+    'SRL L',
+    'SRL (HL)',
+    'SRL A',
+    'BIT 0,B',
+    'BIT 0,C',
+    'BIT 0,D',
+    'BIT 0,E',
+    'BIT 0,H',
+    'BIT 0,L',
+    'BIT 0,(HL)',
+    'BIT 0,A',
+    'BIT 1,B',
+    'BIT 1,C',
+    'BIT 1,D',
+    'BIT 1,E',
+    'BIT 1,H',
+    'BIT 1,L',
+    'BIT 1,(HL)',
+    'BIT 1,A',
+    'BIT 2,B',
+    'BIT 2,C',
+    'BIT 2,D',
+    'BIT 2,E',
+    'BIT 2,H',
+    'BIT 2,L',
+    'BIT 2,(HL)',
+    'BIT 2,A',
+    'BIT 3,B',
+    'BIT 3,C',
+    'BIT 3,D',
+    'BIT 3,E',
+    'BIT 3,H',
+    'BIT 3,L',
+    'BIT 3,(HL)',
+    'BIT 3,A',
+    'BIT 4,B',
+    'BIT 4,C',
+    'BIT 4,D',
+    'BIT 4,E',
+    'BIT 4,H',
+    'BIT 4,L',
+    'BIT 4,(HL)',
+    'BIT 4,A',
+    'BIT 5,B',
+    'BIT 5,C',
+    'BIT 5,D',
+    'BIT 5,E',
+    'BIT 5,H',
+    'BIT 5,L',
+    'BIT 5,(HL)',
+    'BIT 5,A',
+    'BIT 6,B',
+    'BIT 6,C',
+    'BIT 6,D',
+    'BIT 6,E',
+    'BIT 6,H',
+    'BIT 6,L',
+    'BIT 6,(HL)',
+    'BIT 6,A',
+    'BIT 7,B',
+    'BIT 7,C',
+    'BIT 7,D',
+    'BIT 7,E',
+    'BIT 7,H',
+    'BIT 7,L',
+    'BIT 7,(HL)',
+    'BIT 7,A',
+    'RES 0,B',
+    'RES 0,C',
+    'RES 0,D',
+    'RES 0,E',
+    'RES 0,H',
+    'RES 0,L',
+    'RES 0,(HL)',
+    'RES 0,A',
+    'RES 1,B',
+    'RES 1,C',
+    'RES 1,D',
+    'RES 1,E',
+    'RES 1,H',
+    'RES 1,L',
+    'RES 1,(HL)',
+    'RES 1,A',
+    'RES 2,B',
+    'RES 2,C',
+    'RES 2,D',
+    'RES 2,E',
+    'RES 2,H',
+    'RES 2,L',
+    'RES 2,(HL)',
+    'RES 2,A',
+    'RES 3,B',
+    'RES 3,C',
+    'RES 3,D',
+    'RES 3,E',
+    'RES 3,H',
+    'RES 3,L',
+    'RES 3,(HL)',
+    'RES 3,A',
+    'RES 4,B',
+    'RES 4,C',
+    'RES 4,D',
+    'RES 4,E',
+    'RES 4,H',
+    'RES 4,L',
+    'RES 4,(HL)',
+    'RES 4,A',
+    'RES 5,B',
+    'RES 5,C',
+    'RES 5,D',
+    'RES 5,E',
+    'RES 5,H',
+    'RES 5,L',
+    'RES 5,(HL)',
+    'RES 5,A',
+    'RES 6,B',
+    'RES 6,C',
+    'RES 6,D',
+    'RES 6,E',
+    'RES 6,H',
+    'RES 6,L',
+    'RES 6,(HL)',
+    'RES 6,A',
+    'RES 7,B',
+    'RES 7,C',
+    'RES 7,D',
+    'RES 7,E',
+    'RES 7,H',
+    'RES 7,L',
+    'RES 7,(HL)',
+    'RES 7,A',
+    'SET 0,B',
+    'SET 0,C',
+    'SET 0,D',
+    'SET 0,E',
+    'SET 0,H',
+    'SET 0,L',
+    'SET 0,(HL)',
+    'SET 0,A',
+    'SET 1,B',
+    'SET 1,C',
+    'SET 1,D',
+    'SET 1,E',
+    'SET 1,H',
+    'SET 1,L',
+    'SET 1,(HL)',
+    'SET 1,A',
+    'SET 2,B',
+    'SET 2,C',
+    'SET 2,D',
+    'SET 2,E',
+    'SET 2,H',
+    'SET 2,L',
+    'SET 2,(HL)',
+    'SET 2,A',
+    'SET 3,B',
+    'SET 3,C',
+    'SET 3,D',
+    'SET 3,E',
+    'SET 3,H',
+    'SET 3,L',
+    'SET 3,(HL)',
+    'SET 3,A',
+    'SET 4,B',
+    'SET 4,C',
+    'SET 4,D',
+    'SET 4,E',
+    'SET 4,H',
+    'SET 4,L',
+    'SET 4,(HL)',
+    'SET 4,A',
+    'SET 5,B',
+    'SET 5,C',
+    'SET 5,D',
+    'SET 5,E',
+    'SET 5,H',
+    'SET 5,L',
+    'SET 5,(HL)',
+    'SET 5,A',
+    'SET 6,B',
+    'SET 6,C',
+    'SET 6,D',
+    'SET 6,E',
+    'SET 6,H',
+    'SET 6,L',
+    'SET 6,(HL)',
+    'SET 6,A',
+    'SET 7,B',
+    'SET 7,C',
+    'SET 7,D',
+    'SET 7,E',
+    'SET 7,H',
+    'SET 7,L',
+    'SET 7,(HL)',
+    'SET 7,A',
+)
+cb_records = bytes.fromhex(
+    '0001020800d70401020100010201000101020800d70401030100010301000201020800d70401040100010401000301020800d70401050100010501000401020800d70401060100010601000501020800d70401070100010701000601021000d70402060200020602000701020800d70401000100010001000801020800d70601020100010201000901020800d70601030100010301000a01020800d70601040100010401000b01020800d70601050100010501000c01020800d70601060100010601000d01020800d70601070100010701000e01021000d70602060200020602000f01020800d70601000100010001001001020800d70801020100010201001101020800d70801030100010301001201020800d70801040100010401001301020800d70801050100010501001401020800d70801060100010601001501020800d70801070100010701001601021000d70802060200020602001701020800d70801000100010001001801020800d70a01020100010201001901020800d70a01030100010301001a01020800d70a01040100010401001b01020800d70a01050100010501001c01020800d70a01060100010601001d01020800d70a01070100010701001e01021000d70a02060200020602001f01020800d70a0100010001000100'
+    '2001020800d72001020100010201002101020800d72001030100010301002201020800d72001040100010401002301020800d72001050100010501002401020800d72001060100010601002501020800d72001070100010701002601021000d72002060200020602002701020800d72001000100010001002801020800d52101020100010201002901020800d52101030100010301002a01020800d52101040100010401002b01020800d52101050100010501002c01020800d52101060100010601002d01020800d52101070100010701002e01021000d52102060200020602002f01020800d52101000100010001003001020800d52201020100010201003101020800d52201030100010301003201020800d52201040100010401003301020800d52201050100010501003401020800d52201060100010601003501020800d52201070100010701003601021000d52202060200020602003701020800d52201000100010001003801020800d72301020100010201003901020800d72301030100010301003a01020800d72301040100010401003b01020800d72301050100010501003c01020800d72301060100010601003d01020800d72301070100010701003e01021000d72302060200020602003f01020800d7230100010001000100'
+    '4001020800d82408000100010201004101020800d82408000100010301004201020800d82408000100010401004301020800d82408000100010501004401020800d82408000100010601004501020800d82408000100010701004601021000d82408000100020602004701020800d82408000100010001004801020800d82408000101010201004901020800d82408000101010301004a01020800d82408000101010401004b01020800d82408000101010501004c01020800d82408000101010601004d01020800d82408000101010701004e01021000d82408000101020602004f01020800d82408000101010001005001020800d82408000102010201005101020800d82408000102010301005201020800d82408000102010401005301020800d82408000102010501005401020800d82408000102010601005501020800d82408000102010701005601021000d82408000102020602005701020800d82408000102010001005801020800d82408000103010201005901020800d82408000103010301005a01020800d82408000103010401005b01020800d82408000103010501005c01020800d82408000103010601005d01020800d82408000103010701005e01021000d82408000103020602005f01020800d8240800010301000100'
+    '6001020800d82408000104010201006101020800d82408000104010301006201020800d82408000104010401006301020800d82408000104010501006401020800d82408000104010601006501020800d82408000104010701006601021000d82408000104020602006701020800d82408000104010001006801020800d82408000105010201006901020800d82408000105010301006a01020800d82408000105010401006b01020800d82408000105010501006c01020800d82408000105010601006d01020800d82408000105010701006e01021000d82408000105020602006f01020800d82408000105010001007001020800d82408000106010201007101020800d82408000106010301007201020800d82408000106010401007301020800d82408000106010501007401020800d82408000106010601007501020800d82408000106010701007601021000d82408000106020602007701020800d82408000106010001007801020800d82408000107010201007901020800d82408000107010301007a01020800d82408000107010401007b01020800d82408000107010501007c01020800d82408000107010601007d01020800d82408000107010701007e01021000d82408000107020602007f01020800d8240800010701000100'
+    '8001020800002501020100080001008101020800002501030100080001008201020800002501040100080001008301020800002501050100080001008401020800002501060100080001008501020800002501070100080001008601021000002502060200080001008701020800002501000100080001008801020800002501020100080001018901020800002501030100080001018a01020800002501040100080001018b01020800002501050100080001018c01020800002501060100080001018d01020800002501070100080001018e01021000002502060200080001018f01020800002501000100080001019001020800002501020100080001029101020800002501030100080001029201020800002501040100080001029301020800002501050100080001029401020800002501060100080001029501020800002501070100080001029601021000002502060200080001029701020800002501000100080001029801020800002501020100080001039901020800002501030100080001039a01020800002501040100080001039b01020800002501050100080001039c01020800002501060100080001039d01020800002501070100080001039e01021000002502060200080001039f0102080000250100010008000103'
+    'a00102080000250102010008000104a10102080000250103010008000104a20102080000250104010008000104a30102080000250105010008000104a40102080000250106010008000104a50102080000250107010008000104a60102100000250206020008000104a70102080000250100010008000104a80102080000250102010008000105a90102080000250103010008000105aa0102080000250104010008000105ab0102080000250105010008000105ac0102080000250106010008000105ad0102080000250107010008000105ae0102100000250206020008000105af0102080000250100010008000105b00102080000250102010008000106b10102080000250103010008000106b20102080000250104010008000106b30102080000250105010008000106b40102080000250106010008000106b50102080000250107010008000106b60102100000250206020008000106b70102080000250100010008000106b80102080000250102010008000107b90102080000250103010008000107ba0102080000250104010008000107bb0102080000250105010008000107bc0102080000250106010008000107bd0102080000250107010008000107be0102100000250206020008000107bf0102080000250100010008000107'
+    'c00102080000260102010008000100c10102080000260103010008000100c20102080000260104010008000100c30102080000260105010008000100c40102080000260106010008000100c50102080000260107010008000100c60102100000260206020008000100c70102080000260100010008000100c80102080000260102010008000101c90102080000260103010008000101ca0102080000260104010008000101cb0102080000260105010008000101cc0102080000260106010008000101cd0102080000260107010008000101ce0102100000260206020008000101cf0102080000260100010008000101d00102080000260102010008000102d10102080000260103010008000102d20102080000260104010008000102d30102080000260105010008000102d40102080000260106010008000102d50102080000260107010008000102d60102100000260206020008000102d70102080000260100010008000102d80102080000260102010008000103d90102080000260103010008000103da0102080000260104010008000103db0102080000260105010008000103dc0102080000260106010008000103dd0102080000260107010008000103de0102100000260206020008000103df0102080000260100010008000103'
+    'e00102080000260102010008000104e10102080000260103010008000104e20102080000260104010008000104e30102080000260105010008000104e40102080000260106010008000104e50102080000260107010008000104e60102100000260206020008000104e70102080000260100010008000104e80102080000260102010008000105e90102080000260103010008000105ea0102080000260104010008000105eb0102080000260105010008000105ec0102080000260106010008000105ed0102080000260107010008000105ee0102100000260206020008000105ef0102080000260100010008000105f00102080000260102010008000106f10102080000260103010008000106f20102080000260104010008000106f30102080000260105010008000106f40102080000260106010008000106f50102080000260107010008000106f60102100000260206020008000106f70102080000260100010008000106f80102080000260102010008000107f90102080000260103010008000107fa0102080000260104010008000107fb0102080000260105010008000107fc0102080000260106010008000107fd0102080000260107010008000107fe0102100000260206020008000107ff0102080000260100010008000107'
+)
@@ -32,6 +32,11 @@ class PPU:
         self.checkpoint = None
     #end
 
+    @property
+    def NextEventCycle(self):
+        """ The cycle the PPU has to be ticked on next. Nothing it does changes before then """
+        return self._next_instr_cycle
+
     @property
     def BackgroundMap1(self):
         return self._memory.Read(Region.BGMAP1, Region.BGMAP1_END+1 - Region.BGMAP1)
@@ -0,0 +1,57 @@
+import time
+
+from .compiler import CB_OFFSET
+
+class OpcodeProfile:
+    """
+    Execution count, emulated cycles and host time spent on each entry of the 512 entry handler table.
+    Nothing here runs unless the CPU swaps in the table returned by Instrument
+    """
+
+    def __init__(self):
+        self.Counts = [0] * (2 * CB_OFFSET)
+        self.Cycles = [0] * (2 * CB_OFFSET)
+        self.Nanoseconds = [0] * (2 * CB_OFFSET)
+    #end
+
+    def Clear(self):
+        """ Starts over from zero """
+        for samples in (self.Counts, self.Cycles, self.Nanoseconds):
+            samples[:] = [0] * len(samples)
+
+    def Wrap(self, index, handler):
+        """ A handler that records into this profile as handler table entry 'index' """
+        counts, cycles, nanoseconds = self.Counts, self.Cycles, self.Nanoseconds
+        clock = time.perf_counter_ns
+        def profiled(cpu, mem, location):
+            start = clock()
+            taken = handler(cpu, mem, location)
+            nanoseconds[index] += clock() - start
+            counts[index] += 1
+            cycles[index] += taken
+            return taken
+        return profiled
+
+    def Instrument(self, handlers):
+        """ Builds a handler table that records into this profile before handing back what 'handlers' returned """
+        return [ self.Wrap(index, handler) for index, handler in enumerate(handlers) ]
+
+    def Report(self, instructions, top = None):
+        """
+        Ranks the opcodes that ran by host time per emulated cycle, most expensive first.
+        'instructions' is the combined base + CB instruction list, used to name each entry
+        """
+        ran = [ x for x in range(len(self.Counts)) if self.Counts[x] > 0 ]
+        ran.sort(key = lambda x: self.Nanoseconds[x] / max(self.Cycles[x], 1), reverse = True)
+        if top is not None:
+            ran = ran[:top]
+
+        lines = ["Opcode  Mnemonic              Count       Cycles     Host ms   ns/cycle"]
+        for index in ran:
+            opcode = "CB {:02X}".format(index - CB_OFFSET) if index >= CB_OFFSET else "{:02X}".format(index)
+            lines.append("{:<7} {:<18} {:>9} {:>12} {:>11.3f} {:>10.1f}".format(
+                opcode, instructions[index].Mnemonic, self.Counts[index], self.Cycles[index],
+                self.Nanoseconds[index] / 1e6, self.Nanoseconds[index] / max(self.Cycles[index], 1)))
+        return "\n".join(lines)
+    #end
+#end class
@@ -57,8 +57,11 @@ class GameBoy:
         self._memory.SetBootRom(bios_data)
         self.__log.info("Successfully loaded BIOS")
 
-    def SetGameRomFromFile(self, file_path):
-        self._cart = Cartridge.FromFile(file_path)
+    def SetGameRomFromFile(self, file_path, mapped = False):
+        """ Loads the game ROM, memory-mapped read-only when 'mapped' rather than read into a private copy """
+        if self._cart is not None:
+            self._cart.Close()
+        self._cart = Cartridge.FromFile(file_path, mapped)
         self._memory.SetROM(self._cart)
         self.__log.info("Game ROM loaded: %s", file_path)
 
@@ -80,21 +83,21 @@ class GameBoy:
 
         self._memory.Synchronized = False
         # Init Timers
-        self._memory.Write(IO.Timer.TIMA, 00)
-        self._memory.Write(IO.Timer.TMA, 00)
-        self._memory.Write(IO.Timer.TAC, 00)
+        self._memory.Write8(IO.Timer.TIMA, 00)
+        self._memory.Write8(IO.Timer.TMA, 00)
+        self._memory.Write8(IO.Timer.TAC, 00)
         # Init Sound (Noise Registers)
         # TODO: IO.Sound.NR*
         # Init LCD
-        self._memory.Write(IO.LCD.LCDC, 0x91)
-        self._memory.Write(IO.LCD.SCX, 00)
-        self._memory.Write(IO.LCD.SCY, 00)
-        self._memory.Write(IO.LCD.LYC, 00)
-        self._memory.Write(IO.LCD.BGP, 0xFC)
-        self._memory.Write(IO.LCD.OBP0, 0xFF)
-        self._memory.Write(IO.LCD.OBP1, 0xFF)
-        self._memory.Write(IO.LCD.WX, 00)
-        self._memory.Write(IO.LCD.WY, 00)
+        self._memory.Write8(IO.LCD.LCDC, 0x91)
+        self._memory.Write8(IO.LCD.SCX, 00)
+        self._memory.Write8(IO.LCD.SCY, 00)
+        self._memory.Write8(IO.LCD.LYC, 00)
+        self._memory.Write8(IO.LCD.BGP, 0xFC)
+        self._memory.Write8(IO.LCD.OBP0, 0xFF)
+        self._memory.Write8(IO.LCD.OBP1, 0xFF)
+        self._memory.Write8(IO.LCD.WX, 00)
+        self._memory.Write8(IO.LCD.WY, 00)
         self._memory.Synchronized = True
         
         # Don't re-run
@@ -167,6 +170,34 @@ class Debug:
     def Active(self, value):
         self._active = value
 
+    @property
+    def ProfileOpcodes(self):
+        """ Records the count, cycles and host time of every opcode the CPU runs """
+        return self._gb._cpu.Profiling
+    @ProfileOpcodes.setter
+    def ProfileOpcodes(self, value):
+        self._gb._cpu.Profiling = value
+
+    @property
+    def HotThreshold(self):
+        """ Entries before the CPU translates a block of ROM code, None when it only ever interprets """
+        blocks = self._gb._cpu.Blocks
+        return blocks.Threshold if blocks is not None else None
+    @HotThreshold.setter
+    def HotThreshold(self, value):
+        cpu = self._gb._cpu
+        cpu.Tiered = value is not None
+        if value is not None:
+            cpu.Blocks.Threshold = value
+
+    @property
+    def FusedSequences(self):
+        """ Opcode sequences the CPU runs as a single handler, see fusion.read_fused_sequences """
+        return self._gb._cpu.Fusion
+    @FusedSequences.setter
+    def FusedSequences(self, value):
+        self._gb._cpu.Fusion = value
+
     @property
     def InspectTiles(self):
         return self._tile_inspect_window != None
@@ -210,32 +241,13 @@ class Debug:
             window.Cleanup()
 
     def execute_cpu_instruction(self, opcode):
-        """ Runs an arbitrary instruction once """
-        
+        """ Runs an arbitrary instruction once, given by opcode (0xCBxx for CB prefixed ones) or mnemonic """
         cpu = self._gb._cpu
-        instr = None
-        # Instruction decode
-        if type(opcode) is int:
-            instr = cpu.__base_opcodes[opcode]
-            if (opcode & 0xFF00) == 0xCB00:
-                opcode = (opcode >> 8)
-                instr = self.__cb_opcodes[opcode]
-        elif type(opcode) is str:
-            # This is pretty darn slow...
-            matching = [ x for x in __base_opcodes + __cb_opcodes if x._mnemonic == opcode ]
-            if len(matching) < 1:
-                raise KeyError("Mnemonic not found!")
-            instr = matching[0]
-        #end
-
-        # Instruction Execute
-        location = cpu.PC + 1
-        print(instr.ToString(self.__memory, self.PC))
-        result = instr.execute(self, self.__memory, location)
-
-        # Writeback
-        instr.writeback(self, self.__memory, location, result)
-        self._check_interrupts()
+        instr = cpu._instruction_at(cpu._handler_index(opcode))
+        print(instr.ToString(self._gb._memory, cpu.PC))
+
+        cpu.ExecuteInstruction(opcode)
+        cpu._check_interrupts()
     #end
 
     def print_cpu_instruction(self, output_handle = sys.stdout):
@@ -245,6 +257,16 @@ class Debug:
         output_handle.write(cpu._curr_inst.ToString(self._gb._memory, cpu.PC))
         output_handle.write('\n')
     
+    def print_opcode_profile(self, output_handle = sys.stdout, top = None):
+        # Most expensive opcodes (host time per emulated cycle) first
+        output_handle.write(self._gb._cpu.ProfileReport(top))
+        output_handle.write('\n')
+
+    def print_block_report(self, output_handle = sys.stdout):
+        # What got hot enough to be translated, and how long that took
+        output_handle.write(self._gb._cpu.Blocks.Report())
+        output_handle.write('\n')
+
     def dump_rom(self, filename = None):
         # get some basic info about the ROM
         mem_bus = self._gb._memory
@@ -272,7 +294,7 @@ class Debug:
 
             # switch and scan all the banks successively
             for i in range(1, banks):
-                mem_bus.ROM.ChangeBank(i)
+                mem_bus.SwitchBank(i)
                 cpu.PC = Region.ROM_0+1    
                 
                 while cpu.PC <= Region.ROM_XX:
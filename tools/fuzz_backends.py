@@ -0,0 +1,385 @@
+import argparse, operator, os, random, sys, time
+
+# Tools run from their own folder, so make the emulator importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.cpu import CPU
+from src.memory import Memory
+from src.cartridge import Cartridge
+from src.compiler import CB_OFFSET, compile_handlers
+from src.blocks import BlockCache
+from src.bus import Region, IO
+from src.fusion import read_fused_sequences
+from src.opcode_table import base_instructions, cb_prefix
+
+# Differential fuzzing: every case is a random CPU state, random RAM and a random stream of instructions in ROM.
+# The reference interpreter (Instruction.execute) runs it one instruction at a time and every other backend
+# has to land on exactly the same registers, flags, memory and cycle count wherever it stops.
+# Backends that run several instructions at once (translated blocks) get compared at the end of each block.
+#
+# By default every instruction is stepped through Tick on memory that writes straight away.
+# With --synchronized, memory queues its writes like it does in a GameBoy and the CPU runs through RunCycles
+# with random budgets, so the write queue (and when each write is due), the HALT fast-forward and the
+# idle loop skip all get compared too.
+
+# Sequences the fusion backend runs as one handler. Streams are sprinkled with them, random opcodes hardly ever line up
+FUSED = read_fused_sequences()
+
+# CPU arguments for every backend, all checked against 'reference'.
+# 'threshold' is the BlockCache one, 1 translates every block the first time it's entered.
+# 'compiled' swaps in handlers compiled right now rather than the pregenerated ones
+BACKENDS = {
+    'reference':   { 'specialized': False },
+    'specialized': {},
+    'compiled':    { 'compiled': True },
+    'lazy_flags':  { 'lazy_flags': True },
+    'fusion':      { 'fusion': FUSED },
+    'tiered':      { 'tiered': True, 'threshold': 1 },
+    'tiered_lazy': { 'tiered': True, 'lazy_flags': True, 'threshold': 1 },
+    'tiered_warm': { 'tiered': True, 'threshold': 2 },
+}
+
+# Cases are 64KB MBC1 cartridges, random writes to ROM can select any of these banks
+_BANKS = 4
+
+# Where the instruction stream goes. Right after the header, so translated blocks can pick it up
+STREAM_START = Cartridge.Header.END + 1
+
+# Most cycles a single RunCycles call gets in --synchronized mode. Long enough for idle loops to be skipped
+MAX_BUDGET = 64
+
+# The emulator refuses to go on with these on purpose, random code is bound to run into them.
+# The PC doesn't wrap around past 0xFFFF either, no game ever runs code from there.
+# Any other exception, even when every backend raises it, is a crash
+REFUSALS = { 'invalid opcode', 'bank switch', 'end of memory' }
+
+_registers = ('A', 'F', 'B', 'C', 'D', 'E', 'H', 'L', 'SP', 'PC')
+_get_registers = operator.attrgetter(*_registers)
+
+# Every opcode a stream can be made of, as handler table indices
+_opcodes = [ x for x in range(len(base_instructions)) if base_instructions[x].Size > 0 and x != 0xCB ] + \
+           [ CB_OFFSET + x for x in range(len(cb_prefix)) ]
+
+_compiled_handlers = None
+
+class Case:
+    """ Everything needed to set up one CPU identically for every backend """
+
+    def __init__(self, seed, length):
+        rnd = random.Random(seed)
+        self.Seed = seed
+
+        rom = bytearray(rnd.randbytes(_BANKS * 16 * 1024))
+        rom[Cartridge.Header.TYPE] = Cartridge.Type.MBC1
+        rom[Cartridge.Header.SIZE] = 1
+        stream = []
+        while len(stream) < length:
+            stream += rnd.choice(FUSED) if rnd.random() < 0.125 else [ rnd.choice(_opcodes) ]
+        address = STREAM_START
+        for index in stream[:length]:
+            instr = cb_prefix[index - CB_OFFSET] if index >= CB_OFFSET else base_instructions[index]
+            code = ([0xCB, index - CB_OFFSET] if index >= CB_OFFSET else [index]) + list(rnd.randbytes(instr.Size))
+            rom[address : address + instr.Size] = bytes(code[:instr.Size])
+            address += instr.Size
+        self.ROM = bytes(rom)
+
+        # Only the upper half of the address space is RAM, the rest is the cartridge
+        self.RAM = bytearray(0x8000) + rnd.randbytes(0x8000)
+        self.RAM[IO.Boot] = 0
+        # Half the registers hold a bank number, so writes to ROM switch banks rather than just get refused
+        self.Registers = { x: rnd.randrange(0x100) if rnd.random() < 0.5 else rnd.randrange(_BANKS) for x in _registers[:-2] }
+        self.Registers['SP'] = rnd.choice([0xFFFE, 0xDFF0, 0xC100])
+        self.Registers['PC'] = STREAM_START
+        self.InterruptsEnabled = rnd.random() < 0.5
+    #end
+
+    def Create(self, backend, synchronized = False):
+        """ A fresh CPU + Memory pair for 'backend' with this case loaded """
+        memory = Memory()
+        memory.SetROM(Cartridge("fuzz.gb", bytearray(self.ROM)))
+        # Random code can write the boot ROM register too, make it the same bytes so that doesn't matter
+        memory.SetBootRom(self.ROM[:Region.BOOT_END + 1])
+        memory._mem_area[0x8000:] = self.RAM[0x8000:]
+        # Go through writes so IE & IF are picked up and the boot ROM gets unmapped
+        memory.Write8(0xFFFF, self.RAM[0xFFFF])
+        memory.Write8(IO.Boot, self.RAM[IO.Boot])
+        # Only the case's own writes get queued
+        memory.Synchronized = synchronized
+
+        arguments = dict(BACKENDS[backend])
+        threshold = arguments.pop('threshold', None)
+        compiled = arguments.pop('compiled', False)
+        cpu = CPU(memory, **arguments)
+        if threshold is not None:
+            cpu.Blocks.Threshold = threshold
+        if compiled:
+            global _compiled_handlers
+            if _compiled_handlers is None:
+                _compiled_handlers = compile_handlers(base_instructions, cb_prefix, lazy_flags = False)
+            cpu._CPU__handlers = _compiled_handlers
+
+        for name, value in self.Registers.items():
+            setattr(cpu, name, value)
+        # Random streams pop far more than they ever pushed
+        cpu._CPU__stack_size = 0x10000
+        cpu.EnableInterrupts(self.InterruptsEnabled)
+        return cpu, memory
+    #end
+#end class
+
+def snapshot(cpu, memory):
+    """ Everything a backend could get wrong, minus the cycles. Queued writes include the cycle they're due on """
+    return (_get_registers(cpu), cpu.InterruptsEnabled, cpu._CPU__suspended,
+            memory.ROM._bank, bytes(memory._mem_area), tuple(memory._ram_write_queue))
+
+def _fetches_past_memory(cpu):
+    """
+    Checks that the instructions a handler fetches from the PC on run past 0xFFFF.
+    Fused handlers fetch the ones after it too, before they move the PC
+    """
+    memory = cpu._CPU__memory
+    address = cpu.PC
+    for _ in range(max(len(x) for x in cpu.Fusion) if len(cpu.Fusion) > 0 else 1):
+        if address > 0xFFFF:
+            return True
+        if memory.Read8(address) != 0xCB:
+            instr = base_instructions[memory.Read8(address)]
+        elif address == 0xFFFF:
+            return True
+        else:
+            instr = cb_prefix[memory.Read8(address + 1)]
+        if instr.Size < 1:
+            return False
+        address += instr.Size
+    return address > 0x10000
+#end
+
+def fault(cpu, error):
+    """ How an exception shows up in a trace: one of the REFUSALS, or its type and message when it's a crash """
+    if cpu.PC > 0xFFFF or (type(error) is IndexError and _fetches_past_memory(cpu)):
+        # Only the PC ever goes past 0xFFFF, an instruction ending right at it is still fine
+        return 'end of memory'
+    if type(error) is SystemError:
+        return 'invalid opcode'
+    if type(error) is RuntimeError and 'requested' in str(error):
+        return 'bank switch'
+    return "{}: {}".format(type(error).__name__, error)
+#end
+
+def step(cpu):
+    """
+    Runs the CPU for one instruction (or one translated block) through Tick.
+    Returns the cycle it got to, or the fault it raised
+    """
+    start = cpu._next_instr_cycle
+    try:
+        cpu.Tick(start)
+    except Exception as error:
+        return fault(cpu, error)
+    return cpu._next_instr_cycle
+#end
+
+def run(cpu, budget):
+    """ Runs the CPU through RunCycles for 'budget' cycles. Returns the cycle it got to, or the fault it raised """
+    try:
+        cpu.RunCycles(budget)
+        # Blocks retire writes as they go, RunCycles only when it picks up again. Land everything that's due
+        # so both leave memory the same on the cycle they stop at
+        cpu._CPU__memory.Tick(cpu._next_instr_cycle)
+    except Exception as error:
+        return fault(cpu, error)
+    return cpu._next_instr_cycle
+#end
+
+class ReferenceTrace:
+    """
+    (cycle or fault, PC it ran from, snapshot) after each instruction of the reference interpreter.
+    Synchronized traces go through RunCycles one cycle at a time, which is one instruction or one cycle of HALT.
+    It only runs as far as some backend needs it to
+    """
+
+    def __init__(self, case, synchronized = False):
+        self._cpu, self._memory = case.Create('reference', synchronized)
+        self._synchronized = synchronized
+        self._entries = []
+        self._stopped = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def Reaches(self, position):
+        """ Checks that there's an entry at 'position', running the reference further if needed """
+        while len(self._entries) <= position and not self._stopped:
+            pc = self._cpu.PC
+            cycle = run(self._cpu, 1) if self._synchronized else step(self._cpu)
+            # Faulted or halted, nothing else is going to happen after this one.
+            # Synchronized runs keep counting cycles while halted, since a queued write can still wake the CPU up
+            previous = self._entries[-1][0] if len(self._entries) > 0 else 0
+            self._stopped = type(cycle) is str or (cycle == previous and not self._synchronized)
+            self._entries.append( (cycle, pc, snapshot(self._cpu, self._memory)) )
+        return position < len(self._entries)
+
+    def __getitem__(self, position):
+        self.Reaches(position)
+        return self._entries[position]
+#end class
+
+def _crashed(position, pc, expected):
+    """ A divergence for the reference itself crashing, which no backend agreeing with it can make right """
+    if type(expected) is str and expected not in REFUSALS:
+        return (position, pc, 'reference crashed', expected)
+    return None
+
+def compare(case, backend, trace, length):
+    """
+    Runs 'backend' alongside the reference trace until 'length' reference instructions are covered.
+    Returns None if they agree, otherwise (instruction, PC, what the backend got, what the reference got)
+    """
+    cpu, memory = case.Create(backend)
+    batched = cpu.Tiered or len(cpu.Fusion) > 0
+    position = 0
+    while position < length and trace.Reaches(position):
+        before = cpu._next_instr_cycle
+        pc = cpu.PC
+        cycle = step(cpu)
+        expected = trace[position][0]
+        if cycle == before:
+            # Halted, the reference has to be stuck right here too
+            return None if expected == before else (position, pc, 'halted', expected)
+
+        # Translated blocks and fused sequences run several instructions at once, so let the reference catch up.
+        # When they raised part way through, the reference should have raised somewhere in the same stretch
+        first = position
+        limit = position + BlockCache.MAX_INSTRUCTIONS - 1 if batched else position
+        while type(expected) is int and position < limit and trace.Reaches(position + 1) \
+                and (expected < cycle if type(cycle) is int else True):
+            position += 1
+            expected = trace[position][0]
+        position += 1
+
+        crash = _crashed(first, pc, expected)
+        if crash is not None:
+            return crash
+        if cycle != expected:
+            return (first, pc, cycle, expected)
+        if type(cycle) is str:
+            # Both refused to go on the same way, that's as far as this case goes
+            return None
+        actual = snapshot(cpu, memory)
+        if actual != trace[position - 1][2]:
+            return (first, pc, actual, trace[position - 1][2])
+    #end while
+    return None
+#end
+
+def compare_synchronized(case, backend, trace, length):
+    """
+    Runs 'backend' through RunCycles with random budgets until 'length' reference entries are covered.
+    Wherever the backend stops, the reference has to have stopped on that same cycle with the same state.
+    Returns None if they agree, otherwise (entry, PC, what the backend got, what the reference got)
+    """
+    cpu, memory = case.Create(backend, synchronized = True)
+    budgets = random.Random(case.Seed)
+    position = 0
+    while position < length and trace.Reaches(position):
+        pc = cpu.PC
+        cycle = run(cpu, budgets.randint(1, MAX_BUDGET))
+
+        # Let the reference catch up to the cycle the backend got to (or as far as it goes, if the backend raised)
+        first = position
+        while type(trace[position][0]) is int and (type(cycle) is str or trace[position][0] < cycle) \
+                and trace.Reaches(position + 1):
+            position += 1
+        expected = trace[position][0]
+
+        crash = _crashed(first, pc, expected)
+        if crash is not None:
+            return crash
+        if cycle != expected:
+            return (first, pc, cycle, expected)
+        if type(cycle) is str:
+            return None
+        actual = snapshot(cpu, memory)
+        if actual != trace[position][2]:
+            return (first, pc, actual, trace[position][2])
+        position += 1
+    #end while
+    return None
+#end
+
+def describe(case, backend, divergence):
+    """ A readable report of where 'backend' stopped agreeing with the reference """
+    position, pc, actual, expected = divergence
+    lines = [ "Divergence in '{}' at instruction {} of case {}".format(backend, position, case.Seed) ]
+    if pc < len(case.ROM) - 1:
+        rom = case.ROM
+        instr = base_instructions[rom[pc]] if rom[pc] != 0xCB else cb_prefix[rom[pc + 1]]
+        lines.append("  From 0x{:04X}: {}".format(pc, instr._mnemonic))
+    else:
+        lines.append("  From 0x{:04X}, outside of ROM".format(pc))
+    if actual == 'reference crashed':
+        lines.append("  The reference crashed with {}".format(expected))
+    elif type(actual) is not tuple or type(expected) is not tuple:
+        lines.append("  Cycles (or exception): {} vs {} expected".format(actual, expected))
+    else:
+        names = _registers + ('IME', 'HALT', 'Bank')
+        values = actual[0] + actual[1:4]
+        references = expected[0] + expected[1:4]
+        for name, value, reference in zip(names, values, references):
+            if value != reference:
+                lines.append("  {:<5} {} vs {} expected".format(name, value, reference))
+        changed = [ x for x in range(len(actual[4])) if actual[4][x] != expected[4][x] ]
+        for address in changed[:8]:
+            lines.append("  [0x{:04X}] 0x{:02X} vs 0x{:02X} expected".format(address, actual[4][address], expected[4][address]))
+        if len(changed) > 8:
+            lines.append("  ... {} bytes differ in total".format(len(changed)))
+        if actual[5] != expected[5]:
+            lines.append("  Queued writes {} vs {} expected".format(list(actual[5]), list(expected[5])))
+    lines.append("  Reproduce with: --seed {} --cases 1 --backends {}".format(case.Seed, backend))
+    return "\n".join(lines)
+#end
+
+def main():
+    parser = argparse.ArgumentParser(description="Checks every fast CPU backend against the reference interpreter on random instruction streams")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the first case, every following case adds one (random by default)")
+    parser.add_argument("--cases", type=int, default=1000, help="How many random cases to run")
+    parser.add_argument("--length", type=int, default=16, help="Instructions in each random stream")
+    parser.add_argument("--backends", nargs='+', default=[ x for x in BACKENDS if x != 'reference' ],
+                        choices=[ x for x in BACKENDS if x != 'reference' ], help="Backends to check")
+    parser.add_argument("--synchronized", action="store_true",
+                        help="Queue writes like a GameBoy does and run through RunCycles with random budgets")
+    parser.add_argument("--keep-going", action="store_true", help="Report every divergence instead of stopping at the first one")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else random.randrange(1 << 32)
+    mode = "synchronized RunCycles" if args.synchronized else "Tick"
+    print("Seed {}, {} cases of {} instructions through {} against: {}".format(seed, args.cases, args.length, mode, ", ".join(args.backends)))
+
+    failures = 0
+    start = time.perf_counter()
+    for number in range(args.cases):
+        case = Case(seed + number, args.length)
+        trace = ReferenceTrace(case, args.synchronized)
+        for backend in args.backends:
+            if args.synchronized:
+                divergence = compare_synchronized(case, backend, trace, args.length)
+            else:
+                divergence = compare(case, backend, trace, args.length)
+            if divergence is None:
+                continue
+            failures += 1
+            print(describe(case, backend, divergence))
+            if not args.keep_going:
+                return 1
+            if divergence[2] == 'reference crashed':
+                # Every other backend would report the same thing
+                break
+    #end for
+
+    elapsed = time.perf_counter() - start
+    print("{} cases in {:.1f}s ({:.0f} cases/s), {} divergences".format(args.cases, elapsed, args.cases / elapsed, failures))
+    return 1 if failures > 0 else 0
+#end
+
+if __name__ == "__main__":
+    sys.exit(main())
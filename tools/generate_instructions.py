@@ -1,5 +1,5 @@
 from utils import TextInstruction
-import os, json
+import argparse, io, os, sys, json
 
 mnemonic_map = {
     'ADC':'AddWithCarry',
@@ -87,10 +87,12 @@ unary_instructions = {
 }
 
 flag_operands = { 'NZ', 'Z', 'NC', 'C' }
+# Only these take a condition, everywhere else C is the register
+conditional_instructions = { 'JR', 'JP', 'CALL', 'RET' }
 immediate_operands = {'d8', 'd16', 'a8', 'a16', 'r8'}
 register_operands = {'A', 'F', 'B', 'C', 'D', 'E', 'H', 'L', 'AF', 'BC', 'DE', 'HL', 'SP', 'PC'}
 
-swap_operands = {'SET'}
+swap_operands = {'SET', 'RES'}
 
 def translate_flags(instr):
     if instr.flags is None:
@@ -115,7 +117,13 @@ def translate_flags(instr):
     return flag_string
 #end
 
-def translate_operand(operand):
+def translate_condition(operand):
+    bit = operand[-1].lower()
+    state = "Bit.Set" if len(operand) == 1 else "Bit.Reset"
+    return "Operand.bit(Flag.{}, {})".format(bit, state)
+#end
+
+def translate_operand(operand, is_condition = False):
     if operand is None:
         return 'None'
 
@@ -142,6 +150,8 @@ def translate_operand(operand):
         byte_length = len(operand) - 1
         op_txt = "Operand.mem({})" if is_memory_access else "Operand.imm({})"
         return op_txt.format(byte_length)
+    elif operand in flag_operands and is_condition:
+        return translate_condition(operand)
     elif operand in register_operands:
         # General case: Register Addressing
         op_txt = "Operand.reg(Registers.{}, {})"
@@ -152,10 +162,6 @@ def translate_operand(operand):
         elif is_memory_access:
             op_txt = "Operand.regi(Registers.{}, {})"
         return op_txt.format(operand, len(operand))
-    elif operand in flag_operands:
-        bit = operand[-1].lower()
-        state = "Bit.Set" if len(operand) == 1 else "Bit.Reset"
-        return "Operand.bit(Flag.{}, {})".format(bit, state)
     elif is_special_case:
         # this is a pretty special operand that I'd rather deal with as a one-off
         return "Operand.regI(Registers.SP)"
@@ -188,6 +194,10 @@ def translate_operands(instr):
             # Unary instruction
             assert(base in unary_instructions)
 
+            # Conditional return, the condition goes first like every other conditional instruction
+            if base == 'RET':
+                return "( {}, None )".format(translate_condition(op_tks))
+
             # Special case, compare instruction
             if base == 'CP':
                 return "( Operand.reg(Registers.A, throwaway = True), {} )".format(translate_operand(op_tks))
@@ -201,7 +211,7 @@ def translate_operands(instr):
     #end if-else on tokens
 
     # now translate the operands
-    dst_text = translate_operand(dst)
+    dst_text = translate_operand(dst, is_condition = base in conditional_instructions)
     src_text = translate_operand(src)
 
     if dst_text == 'None' and src_text == dst_text:
@@ -216,7 +226,14 @@ def translate_operands(instr):
     #end else
 #end
 
+# Instructions that need a different executor than the rest sharing their mnemonic
+special_mnemonics = {
+    'ADD SP,r8': 'AddOffset',
+}
+
 def translate_mnemonic(instr):
+    if instr.mnemonic in special_mnemonics:
+        return special_mnemonics[instr.mnemonic]
     base = instr.mnemonic.split()[0]
     return mnemonic_map[base]
 #end
@@ -277,7 +294,35 @@ def create_header(file_handle):
     file_handle.flush()
 #end create_header
 
-def main():
+def load_instructions(filename, list_name):
+    """ Builds the Instruction objects for the data in 'filename' straight from the generated source """
+    import src.cpu_types, src.instructions
+
+    source = io.StringIO()
+    read_and_generate(filename, list_name, source)
+    namespace = dict(vars(src.cpu_types))
+    namespace.update(vars(src.instructions))
+    exec(source.getvalue(), namespace)
+    return namespace[list_name]
+#end
+
+def generate_handlers():
+    """ Writes out one straight-line handler per opcode (see src/compiler.py), so the expanded code can be reviewed """
+    sys.path.append('..')
+    from src.compiler import handlers_module
+
+    base_instructions = load_instructions('./gb_base.json', 'base_instructions')
+    cb_prefix = load_instructions('./gb_cb_prefix.json', 'cb_prefix')
+    header = [
+        'Generated by tools/generate_instructions.py --backend handlers from gb_base.json and gb_cb_prefix.json',
+        'Every opcode expanded into a single function: handler(cpu, mem, location) -> cycles',
+        'Do not edit by hand, change the generator or src/compiler.py and regenerate instead',
+    ]
+    with open('../src/compiled_handlers.py', 'w') as handlers_file:
+        handlers_file.write(handlers_module(base_instructions, cb_prefix, header))
+#end
+
+def generate_instruction_tables():
     known_filenames = ['../src/known_instructions.py', '../src/base_instructions.py', '../src/cb_prefix_instructions.py']
     for out_filename in known_filenames:
         if os.path.exists(out_filename):
@@ -292,6 +337,39 @@ def main():
         create_header(cb_file)
         read_and_generate('./gb_cb_prefix.json', 'cb_prefix', cb_file)
     #close file
+
+    generate_packed_tables()
+#end
+
+def generate_packed_tables():
+    """ Writes out the same tables packed into records, which is what the CPU actually loads (see src/opcode_table.py) """
+    sys.path.append('..')
+    from src.opcode_table import packed_module
+
+    base_instructions = load_instructions('./gb_base.json', 'base_instructions')
+    cb_prefix = load_instructions('./gb_cb_prefix.json', 'cb_prefix')
+    header = [
+        'Generated by tools/generate_instructions.py from gb_base.json and gb_cb_prefix.json',
+        'The packed form of base_instructions.py and cb_prefix_instructions.py, loaded through src/opcode_table.py',
+        'Do not edit by hand, change the generator and regenerate instead',
+    ]
+    with open('../src/packed_opcodes.py', 'w') as packed_file:
+        packed_file.write(packed_module(base_instructions, cb_prefix, header))
+#end
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates the opcode tables out of the instruction data")
+    parser.add_argument("--backend", choices=['instructions', 'packed', 'handlers'], default='instructions',
+                        help="'instructions' writes the Instruction tables (and their packed form), "
+                             "'packed' only the packed tables, 'handlers' writes an expanded function per opcode")
+    args = parser.parse_args()
+
+    if args.backend == 'handlers':
+        generate_handlers()
+    elif args.backend == 'packed':
+        generate_packed_tables()
+    else:
+        generate_instruction_tables()
 #end
 
 if __name__ == "__main__":
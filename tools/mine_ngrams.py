@@ -0,0 +1,110 @@
+import argparse, os, sys
+from collections import Counter
+
+# Tools run from their own folder, so make the emulator importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.cpu import CPU
+from src.memory import Memory
+from src.cartridge import Cartridge
+from src.compiler import can_fuse, CB_OFFSET
+from src.fusion import write_fused_sequences
+from src.opcode_table import base_instructions, cb_prefix
+
+def create_system(rom_file):
+    """ A headless CPU + Memory pair, started the way GameBoy does it without a BIOS """
+    memory = Memory(synchronized = True)
+    memory.SetROM(Cartridge.FromFile(rom_file))
+
+    cpu = CPU(memory)
+    cpu.AF = 0x01B0
+    cpu.BC = 0x0013
+    cpu.DE = 0x00D8
+    cpu.HL = 0x014D
+    cpu.SP = 0xFFFE
+    cpu.PC = 0x100
+    return cpu, memory
+#end
+
+def trace(cpu, memory, cycles):
+    """ Yields the handler table index of every instruction the CPU executes in the given amount of cycles """
+    for cycle in range(cycles):
+        memory.Tick(cycle)
+        if cycle < cpu._next_instr_cycle:
+            continue
+
+        # Taking an interrupt moves the PC to its vector, and that's what Tick runs.
+        # Tick checks for one again, but dispatching it turned the interrupts off
+        cpu._check_interrupts()
+        pc = cpu.PC
+        cpu.Tick(cycle)
+        if cpu._next_instr_cycle == cycle:
+            # Halted, nothing ran
+            continue
+
+        index = memory.Read8(pc)
+        if index == 0xCB:
+            index = CB_OFFSET + memory.Read8(pc+1)
+        yield index
+    #end for
+#end
+
+def mine(indices, table, max_length):
+    """ Counts every run of 2 to 'max_length' instructions that could be fused """
+    counts = Counter()
+    window = []
+    for index in indices:
+        window.append(index)
+        window = window[-max_length:]
+        for length in range(2, len(window) + 1):
+            sequence = tuple(window[-length:])
+            if can_fuse([ table[x] for x in sequence ]):
+                counts[sequence] += 1
+    #end for
+    return counts
+#end
+
+def _overlaps(sequence, chosen):
+    # Fusing one would swallow the start of the other, so only one of them would ever run
+    return sequence[0] in chosen[1:] or chosen[0] in sequence[1:]
+
+def _subsumed(sequence, count, chosen, chosen_count):
+    # A shorter sequence that always continues into a chosen one never runs on its own
+    return chosen[:len(sequence)] == sequence and count <= chosen_count
+
+def select(counts, amount):
+    """ Picks the sequences that save the most dispatches: every fused instruction past the first is one less """
+    ranked = sorted(counts.items(), key = lambda x: x[1] * (len(x[0]) - 1), reverse = True)
+    selected = []
+    for sequence, count in ranked:
+        if len(selected) == amount:
+            break
+        if any(_overlaps(sequence, x) or _subsumed(sequence, count, x, n) for x, n in selected):
+            continue
+        selected.append( (sequence, count) )
+    return selected
+
+def main():
+    parser = argparse.ArgumentParser(description="Mines the most frequent instruction sequences out of a running ROM")
+    parser.add_argument("rom_file", help="The ROM file to trace")
+    parser.add_argument("--cycles", type=int, default=4000000, help="How many cycles to run the ROM for")
+    parser.add_argument("--length", type=int, default=3, help="Longest sequence to consider")
+    parser.add_argument("--top", type=int, default=16, help="How many sequences to fuse")
+    parser.add_argument("--output", required=True,
+                        help="Where to write the sequences for the CPU to fuse (main.py --fusion FILE). Mined sets are per title, so this never defaults to the shipped one")
+    args = parser.parse_args()
+
+    table = list(base_instructions) + list(cb_prefix)
+    cpu, memory = create_system(args.rom_file)
+    counts = mine(trace(cpu, memory, args.cycles), table, args.length)
+    selected = select(counts, args.top)
+
+    for sequence, count in selected:
+        print("{:>10}  {}".format(count, " ; ".join(table[x].Mnemonic for x in sequence)))
+
+    source = "Mined from {} over {} cycles".format(os.path.basename(args.rom_file), args.cycles)
+    write_fused_sequences(args.output, [ x for x, _ in selected ], table, [ x for _, x in selected ], source)
+#end
+
+if __name__ == "__main__":
+    main()